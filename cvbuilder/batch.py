@@ -0,0 +1,20 @@
+import argparse
+
+from dotenv import load_dotenv
+
+# Load env vars
+load_dotenv(".env")
+
+from src.batch import BATCH_OUTPUT_DIR, run_batch
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build tailored CVs for a batch of job descriptions.")
+    parser.add_argument("jobs", help="Directory of job descriptions (*.txt) or a glob pattern")
+    parser.add_argument("--output", default=BATCH_OUTPUT_DIR, help="Root directory for per-job outputs")
+    parser.add_argument("--workers", type=int, default=4, help="Number of jobs built concurrently")
+    parser.add_argument("--force", action="store_true", help="Recompile even if a job's LaTeX source is unchanged")
+    args = parser.parse_args()
+
+    summary = run_batch(args.jobs, output_root=args.output, workers=args.workers, force=args.force)
+    if not summary or summary["failed"]:
+        raise SystemExit(1)
@@ -1,12 +1,15 @@
-from src.pipeline import (
-    personal as personal_pipeline,
-    projects as project_pipeline,
-    skills as skills_pipeline,
-    experience as experience_pipeline,
-    education as education_pipeline,
-    certificates as certificates_pipeline,
-)
-from src.latex import compile_latex, render_resume, save_tex
+import argparse
+import os
+
+from notion.ratelimit import log_throttle_stats
+from notion.session import log_connection_stats
+from src.cv_agent.repair import log_repair_stats
+from src.pipeline import default_stages
+from src.pipeline.scheduler import run_stages
+from src.store import flush
+from src.latex import MAIN_TEX_PATH, OUTPUT_DIR, compile_file, render_resume_to
+from src.latex_fit import fit_file
+from src.latex_format import log_compile_stats
 
 from dotenv import load_dotenv
 
@@ -14,15 +17,27 @@ from dotenv import load_dotenv
 load_dotenv(".env")
 
 if __name__ == "__main__":
-    # Build each resume section via its dedicated pipeline
-    contact = personal_pipeline.run()
-    projects = project_pipeline.run()
-    skills = skills_pipeline.run()
-    experience = experience_pipeline.run()
-    education = education_pipeline.run()
-    certificates_pipeline.run()
+    parser = argparse.ArgumentParser(description="Build the CV from Notion data.")
+    parser.add_argument("--force", action="store_true", help="Recompile even if the LaTeX source is unchanged")
+    args = parser.parse_args()
+
+    # Build each resume section via its dedicated pipeline; independent
+    # sections run concurrently, skills wait for the raw projects data
+    results = run_stages(default_stages())
+    log_connection_stats()
+    log_throttle_stats()
+    log_repair_stats()
 
     # Render + Save LaTeX + Compile
-    tex = render_resume(contact, skills, projects, experience, education)
-    save_tex(tex)
-    compile_latex()
+    render_resume_to(
+        MAIN_TEX_PATH,
+        results["personal"],
+        results["skills"],
+        results["projects"],
+        results["experience"],
+        results["education"],
+    )
+    fit_file(MAIN_TEX_PATH, force=args.force)
+    compile_file(MAIN_TEX_PATH, os.path.join(OUTPUT_DIR, "main.pdf"), force=args.force)
+    log_compile_stats()
+    flush()
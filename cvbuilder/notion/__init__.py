@@ -7,6 +7,7 @@ from .certificates import Certificates
 from .education import Education
 from .skills import generate_skills_from_projects
 from .notion import Notion
+from .async_client import AsyncNotionClient
 
 __all__ = [
     "Projects",
@@ -16,4 +17,5 @@ __all__ = [
     "Education",
     "generate_skills_from_projects",
     "Notion",
+    "AsyncNotionClient",
 ]
@@ -0,0 +1,169 @@
+"""asyncio front-end for the Notion API client."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Dict, Iterator, Optional
+
+from .client import NotionClient, NotionError, incremental_default
+from src.utils.logger import get_logger
+
+logger = get_logger("notion-async-client")
+
+# Notion allows an average of three requests per second per integration
+DEFAULT_MAX_CONCURRENCY = 3
+
+# How often a pump retries handing a response to a consumer that is behind
+PUT_POLL_INTERVAL = 0.01
+
+_DONE = object()
+
+
+class AsyncNotionClient:
+    """Async variant of NotionClient with a bound on in-flight requests.
+
+    Requests go through the shared pooled session on worker threads, so the
+    sync and async clients share connections. ``max_concurrency`` (or
+    NOTION_MAX_CONCURRENCY) caps concurrent requests across every database
+    queried through this instance.
+
+    Requests and the blocking consumers of page streams (see ``run_blocking``)
+    get executors of their own. In the loop's default executor, consumers
+    parked on their streams could take every thread and starve the requests
+    feeding them. Pumps hand responses over from the loop without a thread.
+    Call ``close()`` when done.
+    """
+
+    def __init__(self, client: Optional[NotionClient] = None, max_concurrency: Optional[int] = None) -> None:
+        self.client = client or NotionClient()
+        limit = max_concurrency or int(os.getenv("NOTION_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY))
+        self._semaphore = asyncio.Semaphore(limit)
+        self._pumps: set = set()
+        self._requests = ThreadPoolExecutor(max_workers=limit, thread_name_prefix="notion-request")
+        self._consumers = ThreadPoolExecutor(thread_name_prefix="notion-consume")
+
+    async def query_page(self, database_id: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._requests, self.client.query_page, database_id, body)
+
+    async def run_blocking(self, func, *args):
+        """Run ``func`` off the loop, e.g. extraction consuming a ``fetch_database`` stream.
+
+        Consumers that wait for a free thread here hold up no request: their
+        pumps only buffer two responses and wait on the loop.
+        """
+        return await asyncio.get_running_loop().run_in_executor(self._consumers, func, *args)
+
+    def close(self) -> None:
+        self._requests.shutdown(wait=False)
+        self._consumers.shutdown(wait=False)
+
+    async def iter_database(
+        self, database_id: str, payload: Optional[Dict[str, Any]] = None, page_size: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield the pages of a database query, following pagination."""
+        body = dict(payload or {})
+        body["page_size"] = page_size or self.client.page_size
+        while True:
+            data = await self.query_page(database_id, body)
+            for page in data.get("results", []):
+                yield page
+            if not data.get("has_more") or not data.get("next_cursor"):
+                return
+            body["start_cursor"] = data["next_cursor"]
+
+    async def query_database(self, database_id: str, payload: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """Query a Notion database and return all pages as one JSON response."""
+        try:
+            results = [page async for page in self.iter_database(database_id, payload)]
+        except NotionError as e:
+            logger.error("%s", e)
+            return None
+        return {"object": "list", "results": results, "has_more": False, "next_cursor": None}
+
+    async def fetch_database(self, database_id: str, incremental: Optional[bool] = None) -> Optional[Dict[str, Any]]:
+        """Async counterpart of NotionClient.fetch_database.
+
+        A full fetch returns ``results`` as a blocking iterator fed from the
+        event loop through a bounded queue; consume it off the loop thread.
+        """
+        if incremental is None:
+            incremental = incremental_default()
+        if not incremental:
+            self.client._drop_snapshot(database_id)
+            return {"results": self._stream(database_id), "changed": None, "incremental": False}
+
+        snapshot = self.client._load_snapshot(database_id)
+        try:
+            pages = [p async for p in self.iter_database(database_id, self.client.changes_filter(snapshot))]
+        except NotionError as e:
+            logger.error("%s", e)
+            return None
+        return self.client.merge_snapshot(database_id, snapshot, pages)
+
+    def _stream(self, database_id: str, payload: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """Bridge paginated query responses to a thread-side page iterator.
+
+        At most two responses are buffered; the pump stops when the consumer
+        does, and a cancelled pump makes the consumer raise CancelledError
+        instead of waiting for pages that will never come.
+        """
+        buffer: queue.Queue = queue.Queue(maxsize=2)
+        closed = threading.Event()
+
+        async def put(item) -> None:
+            while not closed.is_set():
+                try:
+                    buffer.put_nowait(item)
+                    return
+                except queue.Full:
+                    await asyncio.sleep(PUT_POLL_INTERVAL)
+
+        async def pump() -> None:
+            body = dict(payload or {})
+            body["page_size"] = self.client.page_size
+            try:
+                while not closed.is_set():
+                    data = await self.query_page(database_id, body)
+                    await put(data.get("results", []))
+                    if not data.get("has_more") or not data.get("next_cursor"):
+                        break
+                    body["start_cursor"] = data["next_cursor"]
+                await put(_DONE)
+            except asyncio.CancelledError:
+                closed.set()
+                try:
+                    buffer.put_nowait(asyncio.CancelledError())
+                except queue.Full:
+                    pass  # the consumer notices ``closed`` once it drains the buffer
+                raise
+            except Exception as e:
+                await put(e)
+
+        task = asyncio.get_running_loop().create_task(pump())
+        self._pumps.add(task)
+        task.add_done_callback(self._pumps.discard)
+
+        def consume() -> Iterator[Dict[str, Any]]:
+            try:
+                while True:
+                    try:
+                        item = buffer.get(timeout=0.1)
+                    except queue.Empty:
+                        if closed.is_set():
+                            raise asyncio.CancelledError(f"Streaming {database_id} was cancelled")
+                        continue
+                    if item is _DONE:
+                        return
+                    if isinstance(item, BaseException):
+                        raise item
+                    yield from item
+            finally:
+                closed.set()
+
+        return consume()
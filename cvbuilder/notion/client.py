@@ -2,33 +2,234 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+import json
+import os
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Type
 
 import requests
+from pydantic import BaseModel
 
+from .ratelimit import TokenBucket, get_limiter, send_paced
+from .session import get_session
+from src.store import get_store, persist
 from src.utils.api import NOTION_BASE_HEADERS
 from src.utils.logger import get_logger
 
+if TYPE_CHECKING:
+    from .async_client import AsyncNotionClient
+
 logger = get_logger("notion-client")
 
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+SNAPSHOT_DIR = os.path.join(BASE_DIR, "data", "notion_cache")
+
+
+def incremental_default() -> bool:
+    """Whether syncs are incremental unless told otherwise (NOTION_INCREMENTAL)."""
+    return os.getenv("NOTION_INCREMENTAL", "").strip().lower() in {"1", "true", "yes"}
+
+
+class NotionError(RuntimeError):
+    """Raised when the Notion API rejects a request."""
+
 
 class NotionClient:
     """Basic HTTP client for the Notion API."""
 
     base_url = "https://api.notion.com/v1/"
+    # Notion's maximum page size for database queries
+    page_size = 100
+    # Set by subclasses: label used in log messages, the "data" section of
+    # the snapshot store sync() saves to and the model extract() returns
+    section = "notion"
+    store_key: Optional[str] = None
+    model: Optional[Type[BaseModel]] = None
+    database_id: Optional[str] = None
 
-    def __init__(self, headers: Optional[Dict[str, str]] = None) -> None:
+    def __init__(
+        self,
+        headers: Optional[Dict[str, str]] = None,
+        session: Optional[requests.Session] = None,
+        limiter: Optional[TokenBucket] = None,
+    ) -> None:
         self.headers = headers or NOTION_BASE_HEADERS
+        self.session = session or get_session()
+        self.limiter = limiter or get_limiter()
 
-    def query_database(self, database_id: str, payload: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
-        """Query a Notion database and return the JSON response."""
+    def query_page(self, database_id: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a single database query request and return its JSON body.
+
+        Requests are paced by the shared token bucket; 429 and 5xx responses
+        are retried before NotionError is raised.
+        """
         url = f"{self.base_url}databases/{database_id}/query"
-        response = requests.post(url, headers=self.headers, json=payload or {})
+        response = send_paced(self.session, self.limiter, "POST", url, headers=self.headers, json=body)
         if response.status_code != 200:
             try:
                 detail = response.json()
             except ValueError:
                 detail = response.text
-            logger.error("Error fetching data: %s", detail)
-            return None
+            raise NotionError(f"Error fetching data: {detail}")
         return response.json()
+
+    def iter_database(
+        self, database_id: str, payload: Optional[Dict[str, Any]] = None, page_size: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield the pages of a database query one by one, following pagination.
+
+        Raises NotionError when a request is rejected.
+        """
+        body = dict(payload or {})
+        body["page_size"] = page_size or self.page_size
+        while True:
+            data = self.query_page(database_id, body)
+            yield from data.get("results", [])
+            if not data.get("has_more") or not data.get("next_cursor"):
+                return
+            body["start_cursor"] = data["next_cursor"]
+
+    def query_database(self, database_id: str, payload: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """Query a Notion database and return all pages as one JSON response."""
+        try:
+            results = list(self.iter_database(database_id, payload))
+        except NotionError as e:
+            logger.error("%s", e)
+            return None
+        return {"object": "list", "results": results, "has_more": False, "next_cursor": None}
+
+    def fetch_database(self, database_id: str, incremental: Optional[bool] = None) -> Optional[Dict[str, Any]]:
+        """Return the pages of a database, optionally fetching only changed pages.
+
+        The result has the shape of a query response with two extra keys:
+        ``changed`` (pages fetched that differ from the local snapshot) and
+        ``incremental``. A full fetch streams ``results`` lazily and drops the
+        local snapshot, so the next incremental run re-seeds it from scratch;
+        this is also how pages deleted in Notion disappear from it.
+        """
+        if incremental is None:
+            incremental = incremental_default()
+        if not incremental:
+            self._drop_snapshot(database_id)
+            return {"results": self.iter_database(database_id), "changed": None, "incremental": False}
+
+        snapshot = self._load_snapshot(database_id)
+        try:
+            return self.merge_snapshot(database_id, snapshot, self.iter_database(database_id, self.changes_filter(snapshot)))
+        except NotionError as e:
+            logger.error("%s", e)
+            return None
+
+    @staticmethod
+    def changes_filter(snapshot: Dict[str, Any]) -> Dict[str, Any]:
+        """Query payload selecting pages edited since the snapshot cursor."""
+        if not snapshot["cursor"]:
+            return {}
+        # last_edited_time is truncated to the minute, so re-read the cursor's
+        # minute; pages seen twice are merged by id.
+        return {
+            "filter": {
+                "timestamp": "last_edited_time",
+                "last_edited_time": {"on_or_after": snapshot["cursor"]},
+            }
+        }
+
+    def merge_snapshot(
+        self, database_id: str, snapshot: Dict[str, Any], pages: Iterable[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Merge fetched pages into the snapshot by id and persist it if anything changed."""
+        merged = snapshot["pages"]
+        cursor = snapshot["cursor"] or ""
+        fetched = changed = 0
+        for page in pages:
+            fetched += 1
+            previous = merged.get(page["id"])
+            if previous is None or previous.get("last_edited_time") != page.get("last_edited_time"):
+                changed += 1
+            merged[page["id"]] = page
+            cursor = max(cursor, page.get("last_edited_time", ""))
+
+        if changed:
+            self._save_snapshot(database_id, {"cursor": cursor or None, "pages": merged})
+        logger.info("Fetched %d pages from %s (%d changed)", fetched, database_id, changed)
+        return {"results": list(merged.values()), "changed": changed, "incremental": True}
+
+    def sync(self, incremental: Optional[bool] = None) -> List[BaseModel]:
+        """Fetch the database and return the extracted models.
+
+        They are saved under ``store_key`` in the background. When nothing
+        could be fetched, the last saved models are returned instead.
+        """
+        return self.store(self.fetch(incremental))
+
+    async def sync_async(self, client: "AsyncNotionClient", incremental: Optional[bool] = None) -> List[BaseModel]:
+        """Like sync(), fetching through an AsyncNotionClient."""
+        if not self.database_id:
+            return self.sync(incremental)  # logs the missing database id
+        notion_data = await client.fetch_database(self.database_id, incremental)
+        # Extraction consumes the page stream, which is fed from the event loop
+        return await client.run_blocking(self.store, notion_data)
+
+    def store(self, notion_data: Optional[Dict[str, Any]]) -> List[BaseModel]:
+        """Extract fetched pages and save them in the background.
+
+        The snapshot store skips payloads identical to the saved one, so an
+        incremental fetch without changes writes nothing.
+        """
+        if not notion_data:
+            logger.error("No %s data fetched.", self.section)
+            return self.load_saved()
+        try:
+            data = self.extract(notion_data)
+        except NotionError as e:
+            logger.error("No %s data fetched: %s", self.section, e)
+            return self.load_saved()
+        if self.unchanged(notion_data):
+            logger.info("No changes since last sync for %s", self.section)
+        self.save(data)
+        return data
+
+    def save(self, data: List[BaseModel]) -> None:
+        """Save extracted models to the snapshot store on its writer thread."""
+        persist("data", self.store_key, data)
+        logger.info("Extracted %d %s records", len(data), self.section)
+
+    def load_saved(self) -> List[BaseModel]:
+        """Models from the last saved snapshot, or an empty list."""
+        store = get_store()
+        if self.model is None or not store.has("data", self.store_key):
+            return []
+        logger.warning("Using the last saved %s data", self.section)
+        return [self.model.model_validate(item) for item in store.load("data", self.store_key)]
+
+    @staticmethod
+    def unchanged(notion_data: Dict[str, Any]) -> bool:
+        """True when an incremental fetch found no new or edited pages."""
+        return bool(notion_data.get("incremental")) and notion_data.get("changed") == 0
+
+    @staticmethod
+    def _snapshot_path(database_id: str) -> str:
+        return os.path.join(SNAPSHOT_DIR, f"{database_id}.json")
+
+    def _load_snapshot(self, database_id: str) -> Dict[str, Any]:
+        path = self._snapshot_path(database_id)
+        if not os.path.exists(path):
+            return {"cursor": None, "pages": {}}
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            logger.warning("Unreadable snapshot %s, falling back to a full fetch", path)
+            return {"cursor": None, "pages": {}}
+
+    def _drop_snapshot(self, database_id: str) -> None:
+        path = self._snapshot_path(database_id)
+        if os.path.exists(path):
+            os.remove(path)
+
+    def _save_snapshot(self, database_id: str, snapshot: Dict[str, Any]) -> None:
+        path = self._snapshot_path(database_id)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
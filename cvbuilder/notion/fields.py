@@ -0,0 +1,177 @@
+"""Declarative mapping of Notion page properties to pydantic model fields.
+
+Each database declares a spec ``{model field: Field(property, kind)}``.
+``Extractor`` binds a reader closure to every entry once, so extracting a
+page is one pass over prebuilt readers, without the throwaway ``{}``/``[{}]``
+defaults of hand-written ``.get()`` chains.
+
+Rows are turned into models with one bulk validation call for the whole
+response. ``trusted=True`` uses ``model_construct`` instead and only
+validates the fields whose type needs coercion (URLs, numbers). With
+pydantic 2 bulk validation in pydantic-core is usually the faster of the
+two, so the clients validate; the trusted path is for callers that must
+not coerce or reject anything.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Type
+
+from pydantic import BaseModel, TypeAdapter
+
+# Annotations the readers already produce, so trusted extraction skips them
+PLAIN_ANNOTATIONS = (str, Optional[str], List[str])
+# Read in place of a missing ``properties``; never mutated
+EMPTY: Dict[str, Any] = {}
+
+
+def _text(kind: str):
+    def reader(prop, default):
+        def read(properties, page):
+            value = properties.get(prop)
+            if value and (texts := value.get(kind)) and (text := texts[0].get("text")):
+                return text.get("content", default)
+            return default
+        return read
+    return reader
+
+
+def _select(prop, default):
+    def read(properties, page):
+        value = properties.get(prop)
+        option = value.get("select") if value else None
+        return option.get("name", default) if option else default
+    return read
+
+
+def _multi_select(prop, default):
+    def read(properties, page):
+        value = properties.get(prop)
+        # A fresh list per row: models must not share a mutable default
+        return [option["name"] for option in value.get("multi_select") or ()] if value else []
+    return read
+
+
+def _date(prop, default):
+    def read(properties, page):
+        value = properties.get(prop)
+        date = value.get("date") if value else None
+        return (date.get("start") if date else None) or default
+    return read
+
+
+def _url(prop, default):
+    def read(properties, page):
+        value = properties.get(prop)
+        return (value.get("url") if value else None) or default
+    return read
+
+
+def _formula(key: str):
+    def reader(prop, default):
+        def read(properties, page):
+            value = properties.get(prop)
+            formula = value.get("formula") if value else None
+            return formula.get(key, default) if formula else default
+        return read
+    return reader
+
+
+def _page_url(prop, default):
+    def read(properties, page):
+        return page.get("url") or default
+    return read
+
+
+# Property kind -> factory of ``read(properties, page)`` for one property
+READERS = {
+    "title": _text("title"),
+    "rich_text": _text("rich_text"),
+    "select": _select,
+    "multi_select": _multi_select,
+    "date": _date,
+    "url": _url,
+    "formula_string": _formula("string"),
+    "formula_number": _formula("number"),
+    "page_url": _page_url,
+}
+
+
+@dataclass(frozen=True)
+class Field:
+    """One Notion property: its name, its type and the value when it is empty.
+
+    ``kind`` is a Notion property type (``title``, ``rich_text``,
+    ``select``, ``multi_select``, ``date``, ``url``), ``formula_string`` or
+    ``formula_number`` for formula results, or ``page_url`` for the URL of
+    the page itself (``prop`` is then ignored). Spec entries that are not
+    model fields are helpers for ``derive`` and are dropped by the model.
+    """
+
+    prop: Optional[str]
+    kind: str
+    default: Any = None
+
+
+def _compile(spec: Dict[str, Field], derive: Optional[Callable[[Dict[str, Any]], None]]):
+    """Bind a reader to every spec entry and return the row function."""
+    readers = []
+    for name, field in spec.items():
+        if field.kind not in READERS:
+            raise ValueError(f"Unknown Notion property kind {field.kind!r} for {name!r}")
+        readers.append((name, READERS[field.kind](field.prop, field.default)))
+    readers = tuple(readers)
+
+    def row(page):
+        properties = page.get("properties") or EMPTY
+        values = {name: read(properties, page) for name, read in readers}
+        if derive is not None:
+            derive(values)
+        return values
+
+    return row
+
+
+class Extractor:
+    """Compiled spec turning Notion pages into ``model`` instances.
+
+    ``derive`` receives each row (field name -> value) and may fill in
+    computed fields such as summaries or durations.
+    """
+
+    def __init__(
+        self,
+        model: Type[BaseModel],
+        spec: Dict[str, Field],
+        derive: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> None:
+        self.model = model
+        self.row = _compile(spec, derive)
+        self._validate_all = TypeAdapter(List[model]).validate_python
+        # Validators for the model fields trusted extraction still has to coerce
+        self._coerce = {
+            name: TypeAdapter(info.annotation).validate_python
+            for name, info in model.model_fields.items()
+            if info.annotation not in PLAIN_ANNOTATIONS
+        }
+
+    def rows(self, pages: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        return map(self.row, pages)
+
+    def build(self, rows: Iterable[Dict[str, Any]], trusted: bool = False) -> List[BaseModel]:
+        """Models from extracted rows; ``trusted`` skips full validation."""
+        if not trusted:
+            return self._validate_all(list(rows))
+        construct, coerce = self.model.model_construct, self._coerce.items()
+        models = []
+        for row in rows:
+            for name, validate in coerce:
+                value = row.get(name)
+                if value is not None:
+                    row[name] = validate(value)
+            models.append(construct(**row))
+        return models
+
+    def extract(self, pages: Iterable[Dict[str, Any]], trusted: bool = False) -> List[BaseModel]:
+        return self.build(self.rows(pages), trusted)
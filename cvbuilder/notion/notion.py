@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
+
+from src.store import flush
 from src.utils.logger import get_logger
 
+from .async_client import AsyncNotionClient
 from .certificates import Certificates
 from .education import Education
 from .experience import Experience
 from .personal import PersonalInfo
 from .projects import Projects
+from .ratelimit import log_throttle_stats
+from .session import log_connection_stats
 from .skills import generate_skills_from_projects
 
 logger = get_logger("notion-main")
@@ -24,21 +30,33 @@ class Notion:
         self.certificates = Certificates()
         self.education = Education()
 
-    def sync_all(self) -> None:
-        logger.info("[SYNC] Projects")
-        self.projects.sync()
-
-        logger.info("[SYNC] Personal Info")
-        self.personal.sync()
-
-        logger.info("[SYNC] Experience")
-        self.experience.sync()
-
-        logger.info("[SYNC] Certificates")
-        self.certificates.sync()
-
-        logger.info("[SYNC] Education")
-        self.education.sync()
-
-        generate_skills_from_projects()
+    def sync_all(self, incremental: bool | None = None, max_concurrency: int | None = None) -> None:
+        """Synchronous entry point; must not be called from a running event loop."""
+        asyncio.run(self.sync_all_async(incremental, max_concurrency))
+
+    async def sync_all_async(self, incremental: bool | None = None, max_concurrency: int | None = None) -> None:
+        """Fetch every database concurrently, bounded by ``max_concurrency`` requests."""
+        client = AsyncNotionClient(max_concurrency=max_concurrency)
+
+        async def sync_one(label, source):
+            logger.info("[SYNC] %s", label)
+            data = await source.sync_async(client, incremental)
+            logger.info("[SYNCED] %s", label)
+            return data
+
+        try:
+            projects, *_ = await asyncio.gather(
+                sync_one("Projects", self.projects),
+                sync_one("Personal Info", self.personal),
+                sync_one("Experience", self.experience),
+                sync_one("Certificates", self.certificates),
+                sync_one("Education", self.education),
+            )
+        finally:
+            client.close()
+
+        generate_skills_from_projects(projects)
+        flush()
+        log_connection_stats()
+        log_throttle_stats()
         logger.info("[DONE] All data synced")
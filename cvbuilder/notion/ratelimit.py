@@ -0,0 +1,168 @@
+"""Request pacing for the Notion API: token bucket plus 429/5xx retry policy."""
+
+from __future__ import annotations
+
+import os
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+from src.utils.logger import get_logger
+
+logger = get_logger("notion-ratelimit")
+
+# Notion documents an average of three requests per second per integration.
+# Builders sharing one token should split it, e.g. NOTION_RATE_LIMIT=1 for three.
+DEFAULT_RATE = 3.0
+DEFAULT_BURST = 3.0
+DEFAULT_MAX_RETRIES = 5
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 30.0
+
+
+class ThrottleStats:
+    """Thread-safe counters of time spent waiting on the rate limit."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.paced_seconds = 0.0
+        self.retry_after_seconds = 0.0
+        self.backoff_seconds = 0.0
+        self.rate_limited = 0
+        self.server_errors = 0
+
+    def add(self, field: str, seconds: float = 0.0, count: Optional[str] = None) -> None:
+        with self._lock:
+            setattr(self, field, getattr(self, field) + seconds)
+            if count:
+                setattr(self, count, getattr(self, count) + 1)
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "paced_seconds": self.paced_seconds,
+                "retry_after_seconds": self.retry_after_seconds,
+                "backoff_seconds": self.backoff_seconds,
+                # Retry-After pauses are served while pacing, so they are part
+                # of paced_seconds already
+                "throttled_seconds": self.paced_seconds + self.backoff_seconds,
+                "rate_limited": self.rate_limited,
+                "server_errors": self.server_errors,
+            }
+
+
+class TokenBucket:
+    """Blocking token bucket shared by every thread of the process."""
+
+    def __init__(self, rate: float = DEFAULT_RATE, capacity: float = DEFAULT_BURST) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.stats = ThrottleStats()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token, sleeping until one is available. Returns the wait."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now > self.updated:
+                    self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                    self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    break
+                # ``updated`` lies in the future while paused by a Retry-After
+                delay = max(self.updated - now, 0.0) + (1 - self.tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+        if waited:
+            self.stats.add("paced_seconds", waited)
+        return waited
+
+    def pause(self, seconds: float) -> None:
+        """Hold every caller for ``seconds``, e.g. after a 429."""
+        with self._lock:
+            self.tokens = 0.0
+            self.updated = max(self.updated, time.monotonic() + seconds)
+
+
+def retry_after(response) -> Optional[float]:
+    """Parse a Retry-After header given in seconds or as an HTTP date."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt: int) -> float:
+    """Exponential backoff with full jitter."""
+    return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt))
+
+
+def send_paced(session, limiter: TokenBucket, method: str, url: str, max_retries: int = DEFAULT_MAX_RETRIES, **kwargs):
+    """Send a request through the limiter, retrying 429 and 5xx responses.
+
+    Returns the last response; callers decide what a non-200 means.
+    """
+    for attempt in range(max_retries + 1):
+        limiter.acquire()
+        response = session.request(method, url, **kwargs)
+        status = response.status_code
+        if attempt == max_retries or (status != 429 and status < 500):
+            return response
+
+        if status == 429:
+            delay = retry_after(response)
+            if delay is None:
+                delay = backoff_delay(attempt)
+            limiter.pause(delay)
+            limiter.stats.add("retry_after_seconds", delay, count="rate_limited")
+            logger.warning("Rate limited by Notion, retrying in %.2fs", delay)
+        else:
+            delay = backoff_delay(attempt)
+            limiter.stats.add("backoff_seconds", delay, count="server_errors")
+            logger.warning("Notion returned %d, retrying in %.2fs", status, delay)
+            time.sleep(delay)
+    return response
+
+
+_limiter: Optional[TokenBucket] = None
+_limiter_lock = threading.Lock()
+
+
+def get_limiter() -> TokenBucket:
+    """Return the process-wide limiter (NOTION_RATE_LIMIT, NOTION_BURST)."""
+    global _limiter
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = TokenBucket(
+                rate=float(os.getenv("NOTION_RATE_LIMIT") or DEFAULT_RATE),
+                capacity=float(os.getenv("NOTION_BURST") or DEFAULT_BURST),
+            )
+        return _limiter
+
+
+def log_throttle_stats() -> Dict[str, float]:
+    stats = get_limiter().stats.snapshot()
+    logger.info(
+        "Notion throttling: %.2fs total (paced %.2fs incl. %.2fs Retry-After, backoff %.2fs), %d x 429, %d x 5xx",
+        stats["throttled_seconds"],
+        stats["paced_seconds"],
+        stats["retry_after_seconds"],
+        stats["backoff_seconds"],
+        stats["rate_limited"],
+        stats["server_errors"],
+    )
+    return stats
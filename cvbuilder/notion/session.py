@@ -0,0 +1,165 @@
+"""Pooled keep-alive HTTP session shared by every Notion client."""
+
+from __future__ import annotations
+
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
+
+from src.utils.logger import get_logger
+
+logger = get_logger("notion-session")
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_TIMEOUT = (5.0, 30.0)
+DEFAULT_RETRIES = 3
+
+
+class ConnectionStats:
+    """Thread-safe counters of connections opened versus reused."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.opened = 0
+
+    def record_checkout(self) -> None:
+        with self._lock:
+            self.checkouts += 1
+
+    def record_open(self) -> None:
+        with self._lock:
+            self.opened += 1
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "requests": self.checkouts,
+                "opened": self.opened,
+                "reused": max(self.checkouts - self.opened, 0),
+            }
+
+
+STATS = ConnectionStats()
+
+
+class _CountingHTTPConnectionPool(HTTPConnectionPool):
+    def _get_conn(self, timeout=None):
+        STATS.record_checkout()
+        return super()._get_conn(timeout)
+
+    def _new_conn(self):
+        STATS.record_open()
+        return super()._new_conn()
+
+
+class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    def _get_conn(self, timeout=None):
+        STATS.record_checkout()
+        return super()._get_conn(timeout)
+
+    def _new_conn(self):
+        STATS.record_open()
+        return super()._new_conn()
+
+
+class _CountingAdapter(HTTPAdapter):
+    """HTTPAdapter whose connection pools feed ``STATS``."""
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _CountingHTTPConnectionPool,
+            "https": _CountingHTTPSConnectionPool,
+        }
+
+
+class NotionSession(requests.Session):
+    """requests.Session applying a default timeout to every request."""
+
+    def __init__(self, timeout: Tuple[float, float] = DEFAULT_TIMEOUT) -> None:
+        super().__init__()
+        self.timeout = timeout
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        return super().request(method, url, **kwargs)
+
+
+def _env_float(name: str, default: float) -> float:
+    value = os.getenv(name)
+    return float(value) if value else default
+
+
+def build_session(
+    pool_size: Optional[int] = None,
+    timeout: Optional[Tuple[float, float]] = None,
+    retries: Optional[int] = None,
+) -> NotionSession:
+    """Create a pooled session; unset options come from NOTION_POOL_SIZE,
+    NOTION_CONNECT_TIMEOUT, NOTION_READ_TIMEOUT and NOTION_RETRIES."""
+    pool_size = pool_size or int(_env_float("NOTION_POOL_SIZE", DEFAULT_POOL_SIZE))
+    timeout = timeout or (
+        _env_float("NOTION_CONNECT_TIMEOUT", DEFAULT_TIMEOUT[0]),
+        _env_float("NOTION_READ_TIMEOUT", DEFAULT_TIMEOUT[1]),
+    )
+    retries = int(_env_float("NOTION_RETRIES", DEFAULT_RETRIES)) if retries is None else retries
+
+    # Only transport errors are retried here; 429/5xx responses are paced and
+    # retried by notion.ratelimit so Retry-After applies to every caller
+    retry = Retry(
+        total=retries,
+        status=0,
+        backoff_factor=0.5,
+        # Database queries are reads even though Notion exposes them as POST
+        allowed_methods=None,
+        raise_on_status=False,
+    )
+    adapter = _CountingAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session = NotionSession(timeout=timeout)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_session: Optional[NotionSession] = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> NotionSession:
+    """Return the process-wide Notion session, creating it on first use."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = build_session()
+        return _session
+
+
+def configure_session(
+    pool_size: Optional[int] = None,
+    timeout: Optional[Tuple[float, float]] = None,
+    retries: Optional[int] = None,
+) -> NotionSession:
+    """Replace the shared session, e.g. to size the pool for a batch run."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = build_session(pool_size, timeout, retries)
+        return _session
+
+
+def log_connection_stats() -> Dict[str, int]:
+    stats = STATS.snapshot()
+    logger.info(
+        "Notion connections: %d requests, %d opened, %d reused",
+        stats["requests"],
+        stats["opened"],
+        stats["reused"],
+    )
+    return stats
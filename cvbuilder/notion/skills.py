@@ -1,25 +1,17 @@
 """Generate flat skills derived from project data."""
 
-import json
-import os
+from typing import List, Union
 
-from src.schemas.notion import Skills
+from src.schemas.notion import Project, Skills
+from src.store import persist
+from src.utils.commons import to_jsonable
 from src.utils.logger import get_logger
 
 logger = get_logger("notion-skills")
 
-BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-PROJECTS_PATH = os.path.join(BASE_DIR, "data", "projects.json")
-SKILLS_PATH = os.path.join(BASE_DIR, "data", "skills.json")
 
-
-def generate_skills_from_projects() -> None:
-    if not os.path.exists(PROJECTS_PATH):
-        logger.error("Missing %s", PROJECTS_PATH)
-        return
-
-    with open(PROJECTS_PATH, "r", encoding="utf-8") as f:
-        projects = json.load(f)
+def generate_skills_from_projects(projects: List[Union[Project, dict]]) -> Skills:
+    projects = to_jsonable(projects)
 
     techs = set()
     tags = set()
@@ -36,8 +28,6 @@ def generate_skills_from_projects() -> None:
 
     skills_model = Skills(tools=sorted(techs), tags=sorted(tags))
 
-    os.makedirs(os.path.dirname(SKILLS_PATH), exist_ok=True)
-    with open(SKILLS_PATH, "w", encoding="utf-8") as f:
-        json.dump(skills_model.model_dump(mode="json"), f, indent=2, ensure_ascii=False)
-
-    logger.info("Saved flat skills to %s", SKILLS_PATH)
+    persist("data", "skills", skills_model)
+    logger.info("Generated %d tools and %d tags", len(skills_model.tools), len(skills_model.tags))
+    return skills_model
@@ -0,0 +1,156 @@
+"""Build tailored CVs for many job descriptions in a single process."""
+
+import glob
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from notion.ratelimit import log_throttle_stats
+from notion.session import log_connection_stats
+from src.cv_agent.repair import log_repair_stats
+from src.cv_agent.selector import CVSelector, get_selector
+from src.latex import compile_file, render_resume_to
+from src.latex_fit import fit_file
+from src.latex_format import log_compile_stats
+from src.latex_pool import CompilePool
+from src.pipeline import (
+    personal as personal_pipeline,
+    projects as project_pipeline,
+    skills as skills_pipeline,
+    experience as experience_pipeline,
+    education as education_pipeline,
+    certificates as certificates_pipeline,
+)
+from src.pipeline.scheduler import Stage, run_stages
+from src.store import flush
+from src.utils.logger import get_logger
+
+logger = get_logger("batch")
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../"))
+BATCH_OUTPUT_DIR = os.path.join(BASE_DIR, "output", "batch")
+
+
+def discover_jobs(source):
+    """Return job description files from a directory or a glob pattern."""
+    if os.path.isdir(source):
+        pattern = os.path.join(source, "*.txt")
+    else:
+        pattern = source
+    return sorted(p for p in glob.glob(pattern) if os.path.isfile(p))
+
+
+def fetch_shared_data():
+    """Fetch everything that does not depend on the job description once."""
+    results = run_stages([
+        Stage("projects.fetch", project_pipeline.fetch_raw, outputs=("data/projects",)),
+        Stage("skills.fetch", skills_pipeline.fetch_raw, inputs=("data/projects",), pass_inputs=True),
+        *personal_pipeline.STAGES,
+        *experience_pipeline.STAGES,
+        *education_pipeline.STAGES,
+        *certificates_pipeline.STAGES,
+    ])
+    return {
+        "projects": results["projects.fetch"],
+        "skills": results["skills.fetch"],
+        "contact": results["personal"],
+        "experience": results["experience"],
+        "education": results["education"],
+    }
+
+
+def build_job(job_path, shared, output_root, mode, model, agent=None, compiler=None, force=False):
+    """Select, render and compile the CV for a single job description."""
+    name = os.path.splitext(os.path.basename(job_path))[0]
+    job_dir = os.path.join(output_root, name)
+    os.makedirs(job_dir, exist_ok=True)
+    report = {"job": job_path, "output_dir": job_dir, "status": "ok", "timings": {}, "error": None}
+    timings = report["timings"]
+    started = time.perf_counter()
+
+    try:
+        stage_start = time.perf_counter()
+        selector = CVSelector(
+            mode=mode,
+            model=model,
+            job_description_path=job_path,
+            namespace=f"batch/{name}",
+            agent=agent,
+        )
+        projects, skills = selector.run_all(shared["projects"], shared["skills"])
+        timings["select"] = time.perf_counter() - stage_start
+
+        stage_start = time.perf_counter()
+        # Streamed to disk: concurrent jobs do not each hold their document
+        tex_path = os.path.join(job_dir, "main.tex")
+        render_resume_to(tex_path, shared["contact"], skills, projects, shared["experience"], shared["education"])
+        fit_file(tex_path, force=force, compiler=compiler)
+        timings["render"] = time.perf_counter() - stage_start
+
+        stage_start = time.perf_counter()
+        compile_document = compiler.compile_file if compiler is not None else compile_file
+        result = compile_document(tex_path, os.path.join(job_dir, "main.pdf"))
+        timings["compile"] = time.perf_counter() - stage_start
+        report["exit_status"] = result.returncode
+        report["cached"] = result.cached
+        report["pdflatex_passes"] = result.passes
+        report["log"] = result.log_path
+        if not result.ok:
+            report["status"] = "failed"
+            report["error"] = f"pdflatex exited with status {result.returncode}"
+    # render_resume_to and load_json exit() on errors; keep the rest of the batch alive
+    except (Exception, SystemExit) as e:
+        logger.exception(f"Job {name} failed")
+        report["status"] = "failed"
+        report["error"] = repr(e)
+
+    timings["total"] = time.perf_counter() - started
+    return report
+
+
+def run_batch(source, output_root=BATCH_OUTPUT_DIR, workers=4, mode=None, model=None, force=False):
+    """Build one CV per job description and write a summary of the run."""
+    mode = mode or os.getenv("MODE", "local")
+    model = model or os.getenv("MODEL", "deepseek-coder:6.7b")
+    jobs = discover_jobs(source)
+    if not jobs:
+        logger.error(f"No job descriptions found for {source}")
+        return None
+
+    os.makedirs(output_root, exist_ok=True)
+    started = time.perf_counter()
+    logger.info(f"Fetching shared Notion data for {len(jobs)} jobs")
+    shared = fetch_shared_data()
+    log_connection_stats()
+    log_throttle_stats()
+    fetch_time = time.perf_counter() - started
+
+    # One agent for every job, so the Ollama concurrency limit is global
+    agent = get_selector(mode, model).agent
+    reports = []
+    with CompilePool(force=force) as compiler, ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(build_job, job, shared, output_root, mode, model, agent, compiler, force) for job in jobs]
+        for future in as_completed(futures):
+            report = future.result()
+            logger.info(f"[{report['status'].upper()}] {report['job']} in {report['timings']['total']:.1f}s")
+            reports.append(report)
+    # Selections are saved to the snapshot store in the background
+    flush()
+
+    reports.sort(key=lambda r: r["job"])
+    summary = {
+        "jobs": len(reports),
+        "succeeded": sum(r["status"] == "ok" for r in reports),
+        "failed": sum(r["status"] != "ok" for r in reports),
+        "fetch_seconds": fetch_time,
+        "json_repair": log_repair_stats(),
+        "latex": log_compile_stats(),
+        "total_seconds": time.perf_counter() - started,
+        "results": reports,
+    }
+    summary_path = os.path.join(output_root, "summary.json")
+    with open(summary_path, "w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=2, ensure_ascii=False)
+    logger.info(f"Batch finished: {summary['succeeded']}/{summary['jobs']} succeeded. Summary in {summary_path}")
+    return summary
@@ -1,13 +1,20 @@
 # src/cv_agent/agent.py
 
 import os
-import re
-import requests
-import logging
-from openai import OpenAI
-from dotenv import load_dotenv
-from typing import Literal, Optional, Type
+import re
+import json
+import time
+import threading
+import contextlib
+import openai
+import requests
+import logging
+from dataclasses import dataclass
+from openai import OpenAI
+from dotenv import load_dotenv
+from typing import List, Literal, Optional, Type
 from pydantic import BaseModel
+from src.cv_agent.cache import ResponseCache
 
 # Load environment variables
 load_dotenv()
@@ -16,15 +23,80 @@ load_dotenv()
 logger = logging.getLogger("cv-agent")
 logger.setLevel(logging.DEBUG)
 
+CONNECT_TIMEOUT = 10
+# Read timeouts of a stalled stream, from requests (Ollama) or the OpenAI SDK
+STREAM_TIMEOUTS = (requests.exceptions.Timeout, openai.APITimeoutError)
+
+
+class GenerationTimeout(TimeoutError):
+    """The model missed its first-token or total deadline."""
+
+
+class GenerationCancelled(RuntimeError):
+    """The request was cancelled through CVAgent.cancel()."""
+
+
+@dataclass
+class GenerationStats:
+    """Timing of a single model call."""
+    backend: str
+    model: str
+    streamed: bool
+    duration: float
+    tokens: int
+    time_to_first_token: Optional[float] = None
+
+    @property
+    def tokens_per_second(self) -> float:
+        generating = self.duration - (self.time_to_first_token or 0)
+        return self.tokens / generating if generating > 0 else 0.0
+
 
 class CVAgent:
-    def __init__(self, mode: Literal["openai", "local"] = "openai", model: str = "gpt-4"):
+    def __init__(
+        self,
+        mode: Literal["openai", "local"] = "openai",
+        model: str = "gpt-4",
+        cache: Optional[ResponseCache] = None,
+        stream: bool = False,
+        first_token_timeout: Optional[float] = 120,
+        total_timeout: Optional[float] = 600,
+    ):
+        """
+        Args:
+            stream: Consume tokens as they arrive instead of waiting for the
+                full completion.
+            first_token_timeout: Seconds to wait for the first token (and,
+                when streaming, for any further chunk).
+            total_timeout: Seconds allowed for the whole call.
+        """
         self.mode = mode
         self.model = model
+        self.cache = cache
+        self.stream = stream
+        self.first_token_timeout = first_token_timeout
+        self.total_timeout = total_timeout
+        self.stats: List[GenerationStats] = []
+        self._stats_lock = threading.Lock()
+        self._cancelled = threading.Event()
+        self._active_streams = set()
+        # Streams are tracked from the selection threads and closed from cancel()
+        self._streams_lock = threading.Lock()
+        # Skip cache lookups (fresh responses are still stored)
+        self.bypass_cache = os.getenv("LLM_CACHE_BYPASS", "").lower() in ("1", "true", "yes")
+        # Bounds concurrent calls made through this agent; unbounded for OpenAI
+        # and for an Ollama server without an explicit OLLAMA_NUM_PARALLEL
+        self._slots = contextlib.nullcontext()
         if mode == "openai":
             self.client = OpenAI()
         elif mode == "local":
             self.ollama_host = os.getenv("OLLAMA_HOST", "http://localhost:11434")
+            # Requests beyond the server's num_parallel only queue up there and
+            # eat into our deadlines, so wait for a slot before sending. Unset,
+            # Ollama sizes num_parallel itself (up to 4) and we do not guess.
+            parallel = os.getenv("OLLAMA_NUM_PARALLEL")
+            if parallel:
+                self._slots = threading.BoundedSemaphore(max(int(parallel), 1))
         else:
             raise ValueError("Mode must be 'openai' or 'local'")
 
@@ -33,6 +105,8 @@ class CVAgent:
         prompt: str,
         schema: Optional[Type[BaseModel]] = None,
         extract_json: bool = True,
+        use_cache: bool = True,
+        store: bool = True,
     ) -> str:
         """Ask the model for a response.
 
@@ -41,15 +115,30 @@ class CVAgent:
             schema: Optional Pydantic model to constrain output.
             extract_json: Extract JSON part from the response if extra text exists
                 (ignored when a schema is provided).
+            use_cache: Look the response up in the response cache first.
+            store: Store a fresh response in the cache. Callers validating the
+                output pass False and call ``remember`` once it passed.
         """
         logger.debug(f"Using model: {self.model} (mode: {self.mode})")
         logger.debug(f"Prompt sent:\n{prompt}")
 
+        result = None
+        if self.cache is not None and use_cache and not self.bypass_cache:
+            result = self.cache.get(self._cache_key(prompt, schema))
+            if result is not None:
+                logger.debug("Response served from cache.")
+
         # Call the right backend
-        if self.mode == "openai":
-            result = self._ask_openai(prompt, schema)
-        else:
-            result = self._ask_ollama(prompt, schema)
+        if result is None:
+            if self._cancelled.is_set():
+                raise GenerationCancelled("Model call cancelled.")
+            with self._slots:
+                if self.mode == "openai":
+                    result = self._ask_openai(prompt, schema)
+                else:
+                    result = self._ask_ollama(prompt, schema)
+            if result and store:
+                self.remember(prompt, schema, result)
 
         if not result:
             logger.error("Empty response from model.")
@@ -64,45 +153,161 @@ class CVAgent:
         logger.debug(f"Cleaned model response:\n{result}")
         return result.strip()
 
-    def _ask_openai(
-        self, prompt: str, schema: Optional[Type[BaseModel]] = None
-    ) -> str:
-        try:
-            params = {
-                "model": self.model,
-                "messages": [{"role": "user", "content": prompt}],
-            }
-            if schema is not None:
-                params["response_format"] = {
-                    "type": "json_schema",
-                    "json_schema": {
-                        "name": schema.__name__,
-                        "schema": schema.model_json_schema(),
-                    },
-                }
-            completion = self.client.chat.completions.create(**params)
-            return completion.choices[0].message.content.strip()
-        except Exception as e:
-            logger.error(f"OpenAI API error: {e}")
-            raise
-
-    def _ask_ollama(
-        self, prompt: str, schema: Optional[Type[BaseModel]] = None
-    ) -> str:
-        url = f"{self.ollama_host}/api/generate"
-        payload = {"model": self.model, "prompt": prompt, "stream": False}
-        if schema is not None:
-            payload["format"] = schema.model_json_schema()
-        else:
-            payload["format"] = "json"
-        try:
-            response = requests.post(url, json=payload)
-            if response.status_code != 200:
-                raise RuntimeError(f"Ollama error: {response.text}")
-            return response.json().get("response", "").strip()
-        except Exception as e:
-            logger.error(f"Ollama API error: {e}")
-            raise
+    def remember(self, prompt: str, schema: Optional[Type[BaseModel]], response: str) -> None:
+        """Store a response for ``prompt`` in the cache, if one is configured."""
+        if self.cache is not None:
+            self.cache.put(self._cache_key(prompt, schema), response)
+
+    def _cache_key(self, prompt: str, schema: Optional[Type[BaseModel]]) -> str:
+        return ResponseCache.key(self.mode, self.model, prompt, schema)
+
+    def cancel(self) -> None:
+        """Abort in-flight streaming calls and refuse new ones until resume()."""
+        self._cancelled.set()
+        with self._streams_lock:
+            streams = list(self._active_streams)
+        for stream in streams:
+            try:
+                stream.close()
+            except Exception:
+                pass
+
+    def resume(self) -> None:
+        self._cancelled.clear()
+
+    def _record(self, stats: GenerationStats) -> None:
+        with self._stats_lock:
+            self.stats.append(stats)
+        ttft = f"{stats.time_to_first_token:.2f}s" if stats.time_to_first_token is not None else "n/a"
+        logger.info(
+            f"{stats.backend}/{stats.model}: {stats.tokens} tokens in {stats.duration:.2f}s "
+            f"(first token {ttft}, {stats.tokens_per_second:.1f} tokens/s)"
+        )
+
+    def _check_deadlines(self, started: float, first_token: Optional[float]) -> None:
+        if self._cancelled.is_set():
+            raise GenerationCancelled("Model call cancelled.")
+        elapsed = time.monotonic() - started
+        if first_token is None and self.first_token_timeout and elapsed > self.first_token_timeout:
+            raise GenerationTimeout(f"No token after {self.first_token_timeout}s")
+        if self.total_timeout and elapsed > self.total_timeout:
+            raise GenerationTimeout(f"Generation exceeded {self.total_timeout}s")
+
+    def _consume(self, backend: str, chunks, closeable) -> str:
+        """Collect streamed ``(text, final_token_count)`` chunks under the deadlines."""
+        with self._streams_lock:
+            self._active_streams.add(closeable)
+        started = time.monotonic()
+        first_token = None
+        parts = []
+        tokens = 0
+        try:
+            for text, final_count in chunks:
+                self._check_deadlines(started, first_token)
+                if text:
+                    if first_token is None:
+                        first_token = time.monotonic() - started
+                    parts.append(text)
+                    tokens += 1
+                if final_count:
+                    tokens = final_count
+        except Exception as e:
+            # cancel() closing the stream surfaces as whatever the client raises
+            if self._cancelled.is_set():
+                raise GenerationCancelled("Model call cancelled.") from e
+            if isinstance(e, STREAM_TIMEOUTS):
+                raise GenerationTimeout(f"Stream stalled for {self.first_token_timeout}s") from e
+            raise
+        finally:
+            with self._streams_lock:
+                self._active_streams.discard(closeable)
+        self._check_deadlines(started, first_token)
+        self._record(GenerationStats(backend, self.model, True, time.monotonic() - started, tokens, first_token))
+        return "".join(parts).strip()
+
+    def _ask_openai(
+        self, prompt: str, schema: Optional[Type[BaseModel]] = None
+    ) -> str:
+        try:
+            params = {
+                "model": self.model,
+                "messages": [{"role": "user", "content": prompt}],
+            }
+            if schema is not None:
+                params["response_format"] = {
+                    "type": "json_schema",
+                    "json_schema": {
+                        "name": schema.__name__,
+                        "schema": schema.model_json_schema(),
+                    },
+                }
+            if self.stream:
+                # The client timeout bounds each read, i.e. the gap between chunks
+                stream = self.client.chat.completions.create(
+                    **params, stream=True, timeout=self.first_token_timeout
+                )
+                chunks = (
+                    (chunk.choices[0].delta.content if chunk.choices else None, None)
+                    for chunk in stream
+                )
+                return self._consume("openai", chunks, stream)
+
+            started = time.monotonic()
+            completion = self.client.chat.completions.create(**params, timeout=self.total_timeout)
+            usage = getattr(completion, "usage", None)
+            self._record(GenerationStats(
+                "openai", self.model, False, time.monotonic() - started,
+                getattr(usage, "completion_tokens", 0) or 0,
+            ))
+            return completion.choices[0].message.content.strip()
+        except Exception as e:
+            logger.error(f"OpenAI API error: {e}")
+            raise
+
+    def _ask_ollama(
+        self, prompt: str, schema: Optional[Type[BaseModel]] = None
+    ) -> str:
+        url = f"{self.ollama_host}/api/generate"
+        payload = {"model": self.model, "prompt": prompt, "stream": self.stream}
+        if schema is not None:
+            payload["format"] = schema.model_json_schema()
+        else:
+            payload["format"] = "json"
+        try:
+            if self.stream:
+                response = requests.post(
+                    url, json=payload, stream=True, timeout=(CONNECT_TIMEOUT, self.first_token_timeout)
+                )
+                with response:
+                    if response.status_code != 200:
+                        raise RuntimeError(f"Ollama error: {response.text}")
+                    return self._consume("ollama", self._ollama_chunks(response), response)
+
+            started = time.monotonic()
+            response = requests.post(url, json=payload, timeout=(CONNECT_TIMEOUT, self.total_timeout))
+            if response.status_code != 200:
+                raise RuntimeError(f"Ollama error: {response.text}")
+            body = response.json()
+            self._record(GenerationStats(
+                "ollama", self.model, False, time.monotonic() - started, body.get("eval_count", 0),
+            ))
+            return body.get("response", "").strip()
+        except Exception as e:
+            logger.error(f"Ollama API error: {e}")
+            raise
+
+    @staticmethod
+    def _ollama_chunks(response):
+        """Yield ``(text, final_token_count)`` from Ollama's JSON lines stream."""
+        for line in response.iter_lines():
+            if not line:
+                continue
+            chunk = json.loads(line)
+            if chunk.get("error"):
+                raise RuntimeError(f"Ollama error: {chunk['error']}")
+            yield chunk.get("response", ""), chunk.get("eval_count") if chunk.get("done") else None
+            if chunk.get("done"):
+                return
 
     def _extract_json(self, text: str) -> str:
         """Extract the first JSON object or array from the text."""
@@ -0,0 +1,112 @@
+# src/cv_agent/cache.py
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Optional, Type
+
+from pydantic import BaseModel
+
+from src.utils.logger import get_logger
+
+logger = get_logger("cv-cache")
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
+CACHE_DIR = os.path.join(BASE_DIR, "cache", "llm")
+
+
+class ResponseCache:
+    """Content-addressed on-disk cache of model responses.
+
+    Entries expire after ``ttl_seconds``; once more than ``max_entries`` are
+    stored the least recently used ones are evicted (a hit refreshes the
+    entry's mtime).
+    """
+
+    def __init__(self, directory=CACHE_DIR, ttl_seconds=7 * 24 * 3600, max_entries=500):
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def key(mode: str, model: str, prompt: str, schema: Optional[Type[BaseModel]] = None) -> str:
+        payload = json.dumps(
+            {
+                "mode": mode,
+                "model": model,
+                "prompt": prompt,
+                "schema": schema.model_json_schema() if schema is not None else None,
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str) -> Optional[str]:
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            self._count(hit=False)
+            return None
+
+        if time.time() - entry.get("created", 0) > self.ttl_seconds:
+            self._remove(path)
+            self._count(hit=False)
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self._count(hit=True)
+        return entry["response"]
+
+    def put(self, key: str, response: str) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"created": time.time(), "response": response}, f, ensure_ascii=False)
+        os.replace(tmp_path, self._path(key))
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".json"):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                entries.append((os.path.getmtime(path), path))
+            except OSError:
+                continue
+        excess = len(entries) - self.max_entries
+        if excess <= 0:
+            return
+        for _, path in sorted(entries)[:excess]:
+            self._remove(path)
+        logger.info(f"Evicted {excess} cached responses")
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
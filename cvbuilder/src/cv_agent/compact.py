@@ -0,0 +1,108 @@
+# src/cv_agent/compact.py
+
+import json
+import math
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Defaults written by the Notion extractors when a property is empty
+PLACEHOLDERS = frozenset({
+    "No Status", "No Category", "No Description", "No Notes",
+    "No Start Date", "No End Date", "No Role",
+})
+# Fields the selection prompts never use
+DROPPED_FIELDS = ("status",)
+# Long free-text fields, shortened when over budget
+TRUNCATABLE_FIELDS = ("notes", "description")
+MIN_FIELD_CHARS = 40
+ELLIPSIS = "…"
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about four characters per token for English/JSON).
+
+    Good enough for budgeting; exact counts depend on the model's tokenizer.
+    """
+    return math.ceil(len(text) / 4)
+
+
+def _is_empty(value) -> bool:
+    if value is None:
+        return True
+    if isinstance(value, str):
+        return not value.strip() or value.strip() in PLACEHOLDERS
+    if isinstance(value, (list, dict)):
+        return not value
+    return False
+
+
+def compact_record(record: Dict, drop: Iterable[str] = DROPPED_FIELDS) -> Dict:
+    """Copy of ``record`` without dropped, empty or placeholder fields."""
+    drop = set(drop)
+    return {k: v for k, v in record.items() if k not in drop and not _is_empty(v)}
+
+
+def _dumps(value) -> str:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+
+def _truncate(text: str, limit: int) -> str:
+    if len(text) <= limit:
+        return text
+    return text[:limit].rstrip() + ELLIPSIS
+
+
+def serialize_records(records: List[Dict], budget: Optional[int] = None) -> str:
+    """Serialize records as compact JSON, one record per line.
+
+    When ``budget`` (in estimated tokens) is given, the longest free-text
+    fields are cut down until the output fits or they reach
+    ``MIN_FIELD_CHARS``; whatever is left over is returned as is.
+    """
+    records = [compact_record(r) for r in records]
+    text = "\n".join(_dumps(r) for r in records)
+    if budget is None or estimate_tokens(text) <= budget:
+        return text
+
+    longest = max((len(r.get(f, "")) for r in records for f in TRUNCATABLE_FIELDS if isinstance(r.get(f), str)), default=0)
+    limit = longest
+    while limit > MIN_FIELD_CHARS and estimate_tokens(text) > budget:
+        limit = max(limit * 2 // 3, MIN_FIELD_CHARS)
+        shortened = []
+        for record in records:
+            record = dict(record)
+            for field in TRUNCATABLE_FIELDS:
+                if isinstance(record.get(field), str):
+                    record[field] = _truncate(record[field], limit)
+            shortened.append(record)
+        text = "\n".join(_dumps(r) for r in shortened)
+    return text
+
+
+def serialize_data(data, budget: Optional[int] = None) -> str:
+    """Compact serialization of a list of records or a single JSON value."""
+    if isinstance(data, list) and all(isinstance(r, dict) for r in data):
+        return serialize_records(data, budget)
+    if isinstance(data, dict):
+        data = compact_record(data, drop=())
+    return _dumps(data)
+
+
+def token_budget(config: Dict, model: str) -> Optional[int]:
+    """Prompt token budget for ``model`` from the ``prompt_budget`` config section."""
+    budgets = config.get("prompt_budget", {})
+    return budgets.get(model, budgets.get("default"))
+
+
+def fit_prompt(template_fill, data, budget: Optional[int]) -> Tuple[str, int, int]:
+    """Build a prompt around compact ``data`` within ``budget`` tokens.
+
+    ``template_fill`` formats the prompt for a serialized payload. Returns
+    the prompt plus estimated token counts of the legacy ``indent=2`` prompt
+    and of the compact one.
+    """
+    before = estimate_tokens(template_fill(json.dumps(data, indent=2)))
+    data_budget = None
+    if budget is not None:
+        data_budget = max(budget - estimate_tokens(template_fill("")), 0)
+    prompt = template_fill(serialize_data(data, data_budget))
+    return prompt, before, estimate_tokens(prompt)
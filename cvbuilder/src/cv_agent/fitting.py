@@ -0,0 +1,112 @@
+# src/cv_agent/fitting.py
+
+import copy
+import re
+from typing import Dict, List, Tuple
+
+from src.utils.logger import get_logger
+
+logger = get_logger("cv-fitting")
+
+# Items are dropped freely down to this many before details get shortened
+PREFERRED_MIN_PROJECTS = 3
+MIN_SKILLS_PER_CATEGORY = 2
+SENTENCE_RE = re.compile(r"(?<=[.!?])\s+")
+
+
+def projects_length(projects: List[Dict]) -> int:
+    """Characters the projects section renders, ignoring LaTeX markup."""
+    return sum(
+        len(cat["category"])
+        + sum(len(i["title"]) + len(i["description"]) + len(i["details"]) + len(i["duration"]) for i in cat["items"])
+        for cat in projects
+    )
+
+
+def skills_length(skills: List[Dict]) -> int:
+    """Characters the skills section renders, ignoring LaTeX markup."""
+    return sum(len(cat["category"]) + len(", ".join(cat["items"])) for cat in skills)
+
+
+def _item_count(projects: List[Dict]) -> int:
+    return sum(len(cat["items"]) for cat in projects)
+
+
+def _drop_last_project(projects: List[Dict]) -> None:
+    """Drop the lowest-ranked project, i.e. the last one listed."""
+    for cat in reversed(projects):
+        if cat["items"]:
+            cat["items"].pop()
+            break
+    projects[:] = [cat for cat in projects if cat["items"]]
+
+
+def _shorten_details(projects: List[Dict]) -> bool:
+    """Drop the last sentence of the longest multi-sentence ``details``."""
+    candidates = [
+        item
+        for cat in projects
+        for item in cat["items"]
+        if len(SENTENCE_RE.split(item["details"].strip())) > 1
+    ]
+    if not candidates:
+        return False
+    # max() keeps the first of equals, so prefer lower-ranked items on ties
+    item = max(reversed(candidates), key=lambda i: len(i["details"]))
+    sentences = SENTENCE_RE.split(item["details"].strip())
+    item["details"] = " ".join(sentences[:-1])
+    return True
+
+
+def fit_projects(projects: List[Dict], max_chars: int) -> Tuple[List[Dict], bool]:
+    """Trim selected projects until they render within ``max_chars``.
+
+    Lowest-ranked projects go first while more than
+    ``PREFERRED_MIN_PROJECTS`` remain, then ``details`` are shortened at
+    sentence boundaries, then projects are dropped down to one. Returns the
+    trimmed copy and whether it fits.
+    """
+    projects = copy.deepcopy(projects)
+    while projects_length(projects) > max_chars:
+        if _item_count(projects) > PREFERRED_MIN_PROJECTS:
+            _drop_last_project(projects)
+        elif not _shorten_details(projects):
+            if _item_count(projects) <= 1:
+                break
+            _drop_last_project(projects)
+    return projects, projects_length(projects) <= max_chars
+
+
+def fit_skills(skills: List[Dict], max_chars: int) -> Tuple[List[Dict], bool]:
+    """Trim selected skills until they render within ``max_chars``.
+
+    The last skill of the largest category goes first, down to
+    ``MIN_SKILLS_PER_CATEGORY`` each, then trailing categories. Returns the
+    trimmed copy and whether it fits.
+    """
+    skills = copy.deepcopy(skills)
+    while skills_length(skills) > max_chars:
+        largest = max(reversed(skills), key=lambda cat: len(cat["items"]), default=None)
+        if largest is not None and len(largest["items"]) > MIN_SKILLS_PER_CATEGORY:
+            largest["items"].pop()
+        elif len(skills) > 1:
+            skills.pop()
+        else:
+            break
+    return skills, skills_length(skills) <= max_chars
+
+
+FITTERS = {
+    "projects": (fit_projects, projects_length),
+    "skills": (fit_skills, skills_length),
+}
+
+
+def fit_to_budget(section: str, data: List[Dict], max_chars: int) -> Tuple[List[Dict], bool]:
+    """Deterministically trim a selected section to its character budget."""
+    fit, length = FITTERS[section]
+    before = length(data)
+    fitted, fits = fit(data, max_chars)
+    if before > max_chars:
+        logger.info(f"Trimmed {section} from {before} to {length(fitted)} characters (budget {max_chars})")
+    return fitted, fits
@@ -0,0 +1,197 @@
+# src/cv_agent/repair.py
+
+import ast
+import json
+import re
+import threading
+import typing
+from typing import Any, Dict, Optional, Type
+
+from pydantic import BaseModel, RootModel, ValidationError
+from src.utils.logger import get_logger
+
+logger = get_logger("cv-repair")
+
+FENCE_RE = re.compile(r"^\s*```[a-zA-Z]*\s*|\s*```\s*$")
+CLOSERS = {"{": "}", "[": "]"}
+# Required text fields a reply may leave out without losing the entry
+OPTIONAL_CONTENT = frozenset({"details", "description"})
+
+
+class RepairStats:
+    """Thread-safe counters of local repairs tried versus succeeded."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.attempts = 0
+        self.repaired = 0
+        self.calls_saved = 0
+
+    def record(self, success: bool, retry_available: bool = True) -> None:
+        with self._lock:
+            self.attempts += 1
+            if success:
+                self.repaired += 1
+                if retry_available:
+                    self.calls_saved += 1
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "attempts": self.attempts,
+                "repaired": self.repaired,
+                # repairs that replaced a retry round-trip to the model
+                "model_calls_saved": self.calls_saved,
+                "success_rate": self.repaired / self.attempts if self.attempts else 0.0,
+            }
+
+
+STATS = RepairStats()
+
+
+def _normalize(text: str) -> Optional[str]:
+    """Drop trailing commas and any text after the root container.
+
+    Returns None for input that ends with a string or container still open:
+    a response cut off mid-way is left for the model to redo rather than
+    closed into something that merely looks complete.
+    """
+    out = []
+    stack = []
+    in_string = escaped = False
+    for ch in text:
+        if in_string:
+            out.append(ch)
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+            continue
+        if ch == '"':
+            in_string = True
+        elif ch in CLOSERS:
+            stack.append(CLOSERS[ch])
+        elif ch in "}]":
+            if not stack or stack.pop() != ch:
+                return None
+            # a comma right before a closer is a trailing comma
+            while out and out[-1].isspace():
+                out.pop()
+            if out and out[-1] == ",":
+                out.pop()
+            if not stack:
+                out.append(ch)
+                return "".join(out)
+        out.append(ch)
+    return None
+
+
+def _candidates(text: str):
+    text = FENCE_RE.sub("", text.strip())
+    yield text
+    starts = [i for i in (text.find("{"), text.find("[")) if i >= 0]
+    if starts:
+        text = text[min(starts):]
+    normalized = _normalize(text)
+    if normalized is not None:
+        yield normalized
+
+
+def parse_loose(text: str) -> Any:
+    """Parse JSON tolerating fences, prose around it, trailing commas and
+    Python-style literals. Truncated input raises ValueError like any other
+    hopeless text."""
+    for candidate in _candidates(text):
+        try:
+            return json.loads(candidate)
+        except ValueError:
+            pass
+        try:
+            return ast.literal_eval(candidate)
+        except (ValueError, SyntaxError, MemoryError, RecursionError):
+            pass
+    raise ValueError("No parsable JSON found")
+
+
+def _unwrap_optional(annotation):
+    if typing.get_origin(annotation) is typing.Union:
+        args = [a for a in typing.get_args(annotation) if a is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+def _is_model(annotation) -> bool:
+    return isinstance(annotation, type) and issubclass(annotation, BaseModel)
+
+
+def coerce(value: Any, annotation) -> Any:
+    """Reshape ``value`` towards ``annotation`` where the intent is unambiguous."""
+    annotation = _unwrap_optional(annotation)
+
+    if _is_model(annotation) and issubclass(annotation, RootModel):
+        return coerce(value, annotation.model_fields["root"].annotation)
+
+    if _is_model(annotation):
+        if not isinstance(value, dict):
+            return value
+        by_lower = {str(k).lower(): k for k in value}
+        result = {}
+        for name, field in annotation.model_fields.items():
+            key = name if name in value else by_lower.get(name.lower())
+            if key is not None:
+                result[name] = coerce(value[key], field.annotation)
+            elif name in OPTIONAL_CONTENT and _unwrap_optional(field.annotation) is str:
+                # missing supporting text is better empty than a retry; a
+                # missing title or category still fails validation
+                result[name] = ""
+        return result
+
+    if typing.get_origin(annotation) is list:
+        (item_type,) = typing.get_args(annotation) or (Any,)
+        if isinstance(value, dict):
+            lists = [v for v in value.values() if isinstance(v, list)]
+            # {"projects": [...]} -> [...]; a bare object -> [object]
+            value = lists[0] if len(value) == 1 and lists else [value]
+        elif isinstance(value, str) and item_type is str:
+            value = [part.strip() for part in value.split(",") if part.strip()]
+        if isinstance(value, list):
+            return [coerce(item, item_type) for item in value]
+        return value
+
+    if annotation is str:
+        if isinstance(value, list) and all(isinstance(v, str) for v in value):
+            return " ".join(value)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return str(value)
+    return value
+
+
+def repair_json(text: str, schema: Type[BaseModel], retry_available: bool = True) -> Optional[str]:
+    """Return ``text`` repaired into JSON valid for ``schema``, or None.
+
+    Every call is counted in ``STATS``; a repair only saves a model call
+    when the caller had a ``retry_available``.
+    """
+    try:
+        value = coerce(parse_loose(text), schema)
+        schema.model_validate(value)
+    except (ValueError, ValidationError):
+        STATS.record(success=False)
+        return None
+    STATS.record(success=True, retry_available=retry_available)
+    return json.dumps(value, ensure_ascii=False)
+
+
+def log_repair_stats() -> Dict[str, float]:
+    stats = STATS.snapshot()
+    logger.info(
+        "JSON repair: %d of %d invalid responses repaired locally (%.0f%%), %d model calls saved",
+        stats["repaired"],
+        stats["attempts"],
+        stats["success_rate"] * 100,
+        stats["model_calls_saved"],
+    )
+    return stats
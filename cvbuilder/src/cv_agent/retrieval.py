@@ -0,0 +1,187 @@
+# src/cv_agent/retrieval.py
+
+import hashlib
+import json
+import math
+import os
+import re
+import tempfile
+from collections import Counter
+from typing import Dict, List, Optional
+
+import requests
+
+from src.cv_agent import compact
+from src.utils.logger import get_logger
+
+logger = get_logger("cv-retrieval")
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
+INDEX_DIR = os.path.join(BASE_DIR, "cache", "embeddings")
+
+# Fields that describe what a project is about; dates and status do not help ranking
+PROJECT_FIELDS = ("name", "category", "role", "tech_stack", "tags", "description", "notes")
+# Compaction keeps the default title so the model can still name the project;
+# for ranking it carries no meaning
+PLACEHOLDERS = compact.PLACEHOLDERS | {"Untitled Project"}
+
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or that the this to was "
+    "were will with we you your our their they using used use via into over all can".split()
+)
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#.]*")
+
+
+def project_text(project: Dict) -> str:
+    """Flatten the descriptive fields of a project into one string."""
+    parts = []
+    for field in PROJECT_FIELDS:
+        value = project.get(field)
+        if isinstance(value, list):
+            value = ", ".join(str(v) for v in value)
+        if value and value not in PLACEHOLDERS:
+            parts.append(str(value))
+    return "\n".join(parts)
+
+
+def tokenize(text: str) -> List[str]:
+    tokens = (t.rstrip(".") for t in TOKEN_RE.findall(text.lower()))
+    return [t for t in tokens if len(t) > 1 and t not in STOPWORDS]
+
+
+def _cosine(a: List[float], b: List[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
+class TfidfEmbedder:
+    """Dependency-free fallback: bag-of-words vectors weighted by TF-IDF.
+
+    Stored vectors are raw term counts; IDF weights depend on the whole
+    corpus, so they are applied when scoring.
+    """
+
+    name = "tfidf"
+
+    def embed(self, texts: List[str]) -> List[Dict[str, int]]:
+        return [dict(Counter(tokenize(text))) for text in texts]
+
+    def similarities(self, query: Dict[str, int], documents: List[Dict[str, int]]) -> List[float]:
+        df = Counter(term for doc in documents for term in doc)
+        n = len(documents)
+        idf = {term: math.log((1 + n) / (1 + count)) + 1 for term, count in df.items()}
+
+        def weigh(counts):
+            return {term: count * idf.get(term, 0.0) for term, count in counts.items()}
+
+        q = weigh(query)
+        q_norm = math.sqrt(sum(w * w for w in q.values()))
+        scores = []
+        for doc in documents:
+            d = weigh(doc)
+            norm = q_norm * math.sqrt(sum(w * w for w in d.values()))
+            dot = sum(w * d.get(term, 0.0) for term, w in q.items())
+            scores.append(dot / norm if norm else 0.0)
+        return scores
+
+
+class OllamaEmbedder:
+    """Dense embeddings from an Ollama embedding model (e.g. nomic-embed-text)."""
+
+    def __init__(self, model: str, host: Optional[str] = None, timeout: float = 60):
+        self.model = model
+        self.host = host or os.getenv("OLLAMA_HOST", "http://localhost:11434")
+        self.timeout = timeout
+        self.name = f"ollama-{model}"
+
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        response = requests.post(
+            f"{self.host}/api/embed",
+            json={"model": self.model, "input": texts},
+            timeout=self.timeout,
+        )
+        if response.status_code != 200:
+            raise RuntimeError(f"Ollama embedding error: {response.text}")
+        return response.json()["embeddings"]
+
+    def similarities(self, query: List[float], documents: List[List[float]]) -> List[float]:
+        return [_cosine(query, doc) for doc in documents]
+
+
+class ProjectIndex:
+    """Persistent project vectors keyed by a hash of each project's text.
+
+    Only projects whose text changed since the last run are embedded again;
+    entries for projects that no longer exist are dropped on save.
+    """
+
+    def __init__(self, embedder, directory: str = INDEX_DIR):
+        self.embedder = embedder
+        slug = re.sub(r"[^A-Za-z0-9_.-]+", "_", embedder.name)
+        self.path = os.path.join(directory, f"projects-{slug}.json")
+
+    @staticmethod
+    def _hash(text: str) -> str:
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def _load(self) -> Dict[str, object]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self, entries: Dict[str, object]) -> None:
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.path), suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(entries, f)
+        os.replace(tmp_path, self.path)
+
+    def vectors(self, texts: List[str]) -> List[object]:
+        """Return one vector per text, embedding only the unseen ones."""
+        cached = self._load()
+        keys = [self._hash(text) for text in texts]
+        missing = [i for i, key in enumerate(keys) if key not in cached]
+        if missing:
+            fresh = self.embedder.embed([texts[i] for i in missing])
+            for i, vector in zip(missing, fresh):
+                cached[keys[i]] = vector
+        current = {key: cached[key] for key in keys}
+        if missing or len(current) != len(cached):
+            self._save(current)
+        logger.info(f"Project index: {len(missing)} embedded, {len(keys) - len(missing)} reused")
+        return [current[key] for key in keys]
+
+
+def build_embedder(config: Dict):
+    """Embedder selected by the ``retrieval`` section of config.json."""
+    if config.get("embedder") == "ollama":
+        return OllamaEmbedder(config.get("embedding_model", "nomic-embed-text"))
+    return TfidfEmbedder()
+
+
+def rank_projects(projects: List[Dict], job_desc: str, top_k: int, embedder=None, directory: str = INDEX_DIR) -> List[Dict]:
+    """Return the ``top_k`` projects most similar to the job description.
+
+    The result keeps the order of ``projects``, so the prompt reads the same
+    as before, only shorter. An Ollama embedder that fails falls back to TF-IDF.
+    """
+    if top_k <= 0 or len(projects) <= top_k:
+        return projects
+    embedder = embedder or TfidfEmbedder()
+    texts = [project_text(p) for p in projects]
+    try:
+        documents = ProjectIndex(embedder, directory).vectors(texts)
+        query = embedder.embed([job_desc])[0]
+    except (requests.exceptions.RequestException, RuntimeError, KeyError) as e:
+        if isinstance(embedder, TfidfEmbedder):
+            raise
+        logger.warning(f"Embedding with {embedder.name} failed ({e}), falling back to TF-IDF")
+        return rank_projects(projects, job_desc, top_k, TfidfEmbedder(), directory)
+
+    scores = embedder.similarities(query, documents)
+    keep = sorted(range(len(projects)), key=lambda i: scores[i], reverse=True)[:top_k]
+    logger.info(f"Pre-ranked {len(projects)} projects, passing top {top_k} to the model")
+    return [projects[i] for i in sorted(keep)]
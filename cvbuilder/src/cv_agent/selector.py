@@ -2,7 +2,15 @@
 
 import os
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from src.cv_agent.agent import CVAgent
+from src.cv_agent.cache import ResponseCache
+from src.cv_agent.compact import fit_prompt, token_budget
+from src.cv_agent.fitting import fit_to_budget
+from src.cv_agent.retrieval import build_embedder, rank_projects
+from src.store import get_store, persist
+from src.utils.commons import to_jsonable
 from src.utils.logger import get_logger
 from src.schemas.latex_data import ProjectsSchema, SkillsSchema
 from src.cv_agent.validator import ask_and_validate_json
@@ -10,23 +18,35 @@ from src.cv_agent.validator import ask_and_validate_json
 logger = get_logger("cv-selector")
 
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
-DATA_DIR = os.path.join(BASE_DIR, "data")
-LATEX_DIR = os.path.join(BASE_DIR, "latex_data")
 CONFIG_PATH = os.path.join(BASE_DIR, "src/cv_agent/config.json")
 LOG_FILE = os.path.join(BASE_DIR, "logs/model_responses.log")
 
 
 class CVSelector:
-    def __init__(self, mode="openai", model="gpt-4"):
-        self.agent = CVAgent(mode=mode, model=model)
+    def __init__(self, mode="openai", model="gpt-4", job_description_path=None, namespace="latex", agent=None):
         self.config = self._load_config()
+        self.agent = agent or CVAgent(mode=mode, model=model, cache=self._build_cache(), **self.config.get("agent", {}))
+        self.job_description_path = job_description_path
+        # Snapshot store namespace the selections are saved under
+        self.namespace = namespace
+        self.retrieval = self.config.get("retrieval", {})
+        self.embedder = build_embedder(self.retrieval)
 
     def _load_config(self):
         with open(CONFIG_PATH, "r") as f:
             return json.load(f)
 
+    def _build_cache(self):
+        cache_config = self.config.get("cache", {})
+        if not cache_config.get("enabled", False):
+            return None
+        return ResponseCache(
+            ttl_seconds=cache_config.get("ttl_seconds", 7 * 24 * 3600),
+            max_entries=cache_config.get("max_entries", 500),
+        )
+
     def _load_job_description(self):
-        path = os.path.join(BASE_DIR, self.config["job_description_path"])
+        path = self.job_description_path or os.path.join(BASE_DIR, self.config["job_description_path"])
         with open(path, "r") as f:
             return f.read()
 
@@ -36,31 +56,68 @@ class CVSelector:
             prompt = f.read()
         return prompt.format(**vars)
 
-    def _load_data(self, filename):
-        path = os.path.join(DATA_DIR, filename)
-        with open(path, "r") as f:
-            return json.load(f)
+    def _build_prompt(self, filename, key, data, **vars):
+        """Load a prompt with ``data`` compactly serialized under ``key``,
+        fitted to the model's token budget."""
+        budget = token_budget(self.config, self.agent.model)
+        prompt, before, after = fit_prompt(
+            lambda payload: self._load_prompt(filename, **vars, **{key: payload}), data, budget
+        )
+        limit = f" (budget {budget})" if budget is not None else ""
+        logger.info(f"{filename}: ~{before} -> ~{after} prompt tokens{limit}")
+        return prompt
+
+    def _load_data(self, section, data=None):
+        """Fetched ``data`` as plain JSON data, read from the store when not given."""
+        if data is None:
+            return get_store().load("data", section)
+        return to_jsonable(data)
 
-    def _save_latex(self, filename, data):
-        os.makedirs(LATEX_DIR, exist_ok=True)
-        path = os.path.join(LATEX_DIR, filename)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+    def _save_latex(self, section, data):
+        persist(self.namespace, section, data)
 
     def _save_debug_log(self, context, prompt, response):
         os.makedirs(os.path.dirname(LOG_FILE), exist_ok=True)
         with open(LOG_FILE, "a", encoding="utf-8") as log:
             log.write(f"\n--- {context} ---\nPROMPT:\n{prompt}\n\nRESPONSE:\n{response}\n\n")
 
-    def select_projects(self):
+    def _fit(self, section, parsed, max_chars, schema, context):
+        """Trim ``parsed`` to ``max_chars``; ask the model to shorten it only
+        when deterministic trimming cannot get there."""
+        fitted, fits = fit_to_budget(section, parsed, max_chars)
+        if fits:
+            return fitted
+        logger.warning(f"{context}: trimming cannot meet {max_chars} characters, asking the model to shorten")
+        prompt = self._load_prompt(
+            "shorten.txt",
+            max_chars=max_chars,
+            data=json.dumps(fitted, ensure_ascii=False),
+        )
+        shorter = ask_and_validate_json(
+            self.agent,
+            prompt,
+            f"{context} (shorten)",
+            schema=schema,
+            retries=1,
+            log_callback=self._save_debug_log,
+        )
+        fitted, fits = fit_to_budget(section, shorter, max_chars)
+        if not fits:
+            logger.warning(f"{context}: still over {max_chars} characters after shortening")
+        return fitted
+
+    def select_projects(self, projects=None):
         job_desc = self._load_job_description()
-        projects = self._load_data("projects.json")
+        projects = self._load_data("projects", projects)
+        if self.retrieval.get("enabled", False):
+            projects = rank_projects(projects, job_desc, self.retrieval.get("top_k", 10), self.embedder)
         max_chars = self.config["max_characters"]["projects"]
 
-        prompt = self._load_prompt(
+        prompt = self._build_prompt(
             "select_projects.txt",
+            "projects",
+            projects,
             job_desc=job_desc,
-            projects=json.dumps(projects, indent=2),
             max_chars=max_chars
         )
 
@@ -72,18 +129,21 @@ class CVSelector:
             retries=1,
             log_callback=self._save_debug_log,
         )
-        self._save_latex("projects.json", parsed)
-        logger.info("Selected projects saved to LaTeX folder.")
+        parsed = self._fit("projects", parsed, max_chars, ProjectsSchema, "Project Selection")
+        self._save_latex("projects", parsed)
+        logger.info(f"Selected projects, saving to {self.namespace}/projects.")
+        return parsed
 
-    def select_skills(self):
+    def select_skills(self, skills=None):
         job_desc = self._load_job_description()
-        skills = self._load_data("skills.json")
+        skills = self._load_data("skills", skills)
         max_chars = self.config["max_characters"]["skills"]
 
-        prompt = self._load_prompt(
+        prompt = self._build_prompt(
             "select_skills.txt",
+            "skills",
+            skills,
             job_desc=job_desc,
-            skills=json.dumps(skills, indent=2),
             max_chars=max_chars
         )
 
@@ -95,9 +155,38 @@ class CVSelector:
             retries=1,
             log_callback=self._save_debug_log,
         )
-        self._save_latex("skills.json", parsed)
-        logger.info("Selected skills saved to LaTeX folder.")
-
-    def run_all(self):
-        self.select_projects()
-        self.select_skills()
+        parsed = self._fit("skills", parsed, max_chars, SkillsSchema, "Skills Selection")
+        self._save_latex("skills", parsed)
+        logger.info(f"Selected skills, saving to {self.namespace}/skills.")
+        return parsed
+
+    def run_all(self, projects=None, skills=None, concurrent=True):
+        """Select projects and skills, returning ``(projects, skills)``.
+
+        ``projects`` and ``skills`` are the fetched data (models or plain),
+        read from the snapshot store when not given. With ``concurrent``
+        both prompts are in flight at once through the shared agent, so the
+        phase takes as long as the slower call.
+        """
+        if not concurrent:
+            return self.select_projects(projects), self.select_skills(skills)
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="cv-select") as pool:
+            selected_projects = pool.submit(self.select_projects, projects)
+            selected_skills = pool.submit(self.select_skills, skills)
+            return selected_projects.result(), selected_skills.result()
+
+
+_selectors = {}
+_selectors_lock = threading.Lock()
+
+
+def get_selector(mode, model):
+    """Return the process-wide selector for ``mode``/``model``.
+
+    Pipeline stages share it so their calls go through one agent and one
+    Ollama concurrency limit.
+    """
+    with _selectors_lock:
+        if (mode, model) not in _selectors:
+            _selectors[(mode, model)] = CVSelector(mode=mode, model=model)
+        return _selectors[(mode, model)]
@@ -1,6 +1,7 @@
 import json
 from typing import Callable, Optional, Type
 from pydantic import BaseModel
+from src.cv_agent.repair import repair_json
 from src.utils.logger import get_logger
 
 logger = get_logger("cv-validator")
@@ -16,26 +17,43 @@ def ask_and_validate_json(
 ):
     """Send prompt via agent and validate JSON response against schema.
 
-    If validation fails, the function optionally retries with a minimal prompt
-    referencing the expected schema and the invalid JSON produced previously.
+    If validation fails, a local repair pass (see ``repair_json``) is tried
+    first; only when that fails does the function optionally retry with a
+    minimal prompt referencing the expected schema and the invalid JSON
+    produced previously.
+    Agents with a response cache only get validated responses stored, keyed
+    by the original prompt.
     """
+    original_prompt = prompt
+    cache_aware = getattr(agent, "cache", None) is not None
     for attempt in range(retries + 1):
-        result = agent.ask(prompt, schema=schema)
+        if cache_aware:
+            result = agent.ask(prompt, schema=schema, store=False)
+        else:
+            result = agent.ask(prompt, schema=schema)
         if log_callback:
             log_callback(context, prompt, result)
         try:
-            return schema.model_validate_json(result).model_dump(mode="python")
+            parsed = schema.model_validate_json(result).model_dump(mode="python")
         except Exception:
             logger.error(
                 f"{context}: JSON schema validation failed on attempt {attempt+1}"
             )
-            if attempt < retries:
-                schema_json = json.dumps(schema.model_json_schema(), indent=2)
-                prompt = (
-                    f"Expected JSON schema:\n{schema_json}\n\n"
-                    f"Invalid JSON:\n{result}\n\n"
-                    "Respond only with corrected JSON."
-                )
-                continue
-            logger.error(f"Final invalid JSON was:\n{result}")
-            raise
+            repaired = repair_json(result, schema, retry_available=attempt < retries)
+            if repaired is None:
+                if attempt < retries:
+                    schema_json = json.dumps(schema.model_json_schema(), indent=2)
+                    prompt = (
+                        f"Expected JSON schema:\n{schema_json}\n\n"
+                        f"Invalid JSON:\n{result}\n\n"
+                        "Respond only with corrected JSON."
+                    )
+                    continue
+                logger.error(f"Final invalid JSON was:\n{result}")
+                raise
+            logger.info(f"{context}: repaired invalid JSON locally")
+            result = repaired
+            parsed = schema.model_validate_json(result).model_dump(mode="python")
+        if cache_aware:
+            agent.remember(original_prompt, schema, result)
+        return parsed
@@ -1,9 +1,19 @@
 from src.utils.logger import get_logger
 
+import hashlib
 import os
 import re
+import shutil
 import subprocess
-from jinja2 import Environment, FileSystemLoader
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import List, Optional
+from jinja2 import ChoiceLoader, Environment, FileSystemLoader, ModuleLoader
+from src import latex_cache
+from src.latex_format import STATS, ensure_format, format_env, needs_baseline, save_baseline
 
 logger = get_logger("latex")
 
@@ -12,35 +22,263 @@ BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../"))
 TEMPLATE_DIR = os.path.join(BASE_DIR, 'templates')
 OUTPUT_DIR = os.path.join(BASE_DIR, 'output')
 MAIN_TEX_PATH = os.path.join(TEMPLATE_DIR, 'main.tex')
+COMPILED_TEMPLATE_DIR = os.path.join(BASE_DIR, 'cache', 'jinja')
+# Characters collected from the template stream before each write to the sink
+WRITE_BUFFER_SIZE = 64 * 1024
+
+# Passes stop once the .aux is stable; this only guards against oscillation
+MAX_PASSES = 4
+# The log wraps long lines, so the path may run over several
+PAGES_RE = re.compile(r"Output written on .*?\((\d+)\s+pages?", re.S)
+# Logged by the FitOnePage environment in header.tex when it has to shrink
+SCALED_MARKER = "FitOnePage: content scaled down to fit"
+# A warm run that died on the format itself, not on the document
+FORMAT_FAILURE_RE = re.compile(
+    r"I can't find the format file|Fatal format file error|\.fmt (?:was written by|doesn't match)"
+    r"|Can be used only in preamble"
+)
+RERUN_RE = re.compile(
+    r"Rerun to get|Label\(s\) may have changed|Rerun LaTeX|There were undefined references|\(rerunfilecheck\)"
+)
 
 # Jinja2 setup
-env = Environment(loader=FileSystemLoader(TEMPLATE_DIR), trim_blocks=True, lstrip_blocks=True)
+ENV_OPTIONS = {"trim_blocks": True, "lstrip_blocks": True}
+env = Environment(loader=FileSystemLoader(TEMPLATE_DIR), **ENV_OPTIONS)
+
+@dataclass
+class CompileResult:
+    """Outcome of compiling one document in its own build directory."""
+    name: str
+    returncode: int
+    seconds: float
+    warm: bool
+    pdf_path: Optional[str]
+    log_path: Optional[str]
+    cached: bool = False
+    # Seconds spent in each pdflatex pass
+    passes: List[float] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return self.returncode == 0 and self.pdf_path is not None
+
+def _pdflatex_cmd(latex_file, output_dir, fmt=None, jobname=None):
+    cmd = ["pdflatex", "-interaction=nonstopmode", "-output-directory", output_dir]
+    if jobname:
+        cmd.append(f"-jobname={jobname}")
+    if fmt:
+        cmd.append(f"-fmt={fmt}")
+    cmd.append(latex_file)
+    return cmd
 
-def compile_latex(latex_file="main.tex", working_dir=TEMPLATE_DIR, output_dir=OUTPUT_DIR):
-    """Compile a LaTeX file using pdflatex"""
+def _file_hash(path):
     try:
-        subprocess.run(
-            ["pdflatex", "-interaction=nonstopmode", "-output-directory", output_dir, latex_file],
-            cwd=working_dir,
-            check=True
-        )
-        logger.info(f"Compilation successful! PDF is in {output_dir}")
-    except subprocess.CalledProcessError as e:
-        logger.exception("Error in compilation")
-    except FileNotFoundError:
-        logger.exception("Error: pdflatex not found. Please ensure LaTeX is installed and in your PATH.")
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+def _wants_rerun(log_path):
+    try:
+        with open(log_path, encoding="utf-8", errors="replace") as f:
+            return RERUN_RE.search(f.read()) is not None
+    except OSError:
+        return False
+
+def _run_passes(run_once, aux_path, log_path):
+    """Run pdflatex passes latexmk-style; returns (returncode, seconds per pass).
 
+    Another pass runs only while the log asks for one (cross-references,
+    hyperref outlines, rerunfilecheck) and the .aux still changes.
+    """
+    times = []
+    previous_aux = _file_hash(aux_path)
+    while True:
+        started = time.perf_counter()
+        returncode = run_once()
+        times.append(time.perf_counter() - started)
+        aux = _file_hash(aux_path)
+        if returncode != 0 or len(times) >= MAX_PASSES:
+            return returncode, times
+        if not _wants_rerun(log_path) or aux == previous_aux:
+            return returncode, times
+        previous_aux = aux
+
+def _format_passes(times):
+    return ", ".join(f"{t:.2f}s" for t in times)
+
+def compile_latex(latex_file="main.tex", working_dir=TEMPLATE_DIR, output_dir=OUTPUT_DIR, warm=True):
+    """Compile a LaTeX file on disk into ``output_dir``. Returns True on success.
+
+    Thin wrapper over ``compile_file``, kept for callers of the old API.
+    """
+    stem = os.path.splitext(os.path.basename(latex_file))[0]
+    output_pdf = os.path.join(output_dir, f"{stem}.pdf")
+    return compile_file(os.path.join(working_dir, latex_file), output_pdf, warm=warm).ok
+
+def _format_failed(log_path):
+    """Whether a failed warm run should be retried cold, judging by its log."""
+    try:
+        with open(log_path, encoding="utf-8", errors="replace") as f:
+            return FORMAT_FAILURE_RE.search(f.read()) is not None
+    except OSError:
+        # pdflatex gave up before it could write a log, e.g. on an unreadable format
+        return True
+
+def _build_env(fmt=None):
+    # Build directories live outside templates/, so keep it on the input path
+    env = format_env() if fmt else dict(os.environ)
+    env["TEXINPUTS"] = TEMPLATE_DIR + os.pathsep + env.get("TEXINPUTS", "")
+    return env
+
+def _source_writer(source):
+    """Callable writing ``source`` to a path: a rendered string or already such a callable."""
+    if callable(source):
+        return source
+
+    def write(path):
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            f.write(source)
+    return write
+
+def _file_writer(tex_path):
+    return lambda path: shutil.copyfile(tex_path, path)
+
+def _build(source, name, build_dir, fmt=None):
+    """Run pdflatex quietly on ``source`` in ``build_dir`` until it converges.
+
+    ``source`` is the rendered string or a callable writing it to a path.
+    Returns (returncode, seconds per pass).
+    """
+    _source_writer(source)(os.path.join(build_dir, f"{name}.tex"))
+
+    def run_once():
+        try:
+            return subprocess.run(
+                _pdflatex_cmd(f"{name}.tex", build_dir, fmt, jobname=name),
+                cwd=build_dir,
+                env=_build_env(fmt),
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            ).returncode
+        except FileNotFoundError:
+            logger.error("pdflatex not found. Please ensure LaTeX is installed and in your PATH.")
+            return 127
+
+    return _run_passes(run_once, os.path.join(build_dir, f"{name}.aux"), os.path.join(build_dir, f"{name}.log"))
+
+def measure_layout(source, fmt=None, keep_fit=False):
+    """Compile ``source`` (see ``_build``) in a scratch directory and report its layout.
+
+    Returns ``{"pages": int, "scaled": bool}`` read from the pdflatex log,
+    or None when it did not compile. With ``keep_fit`` a build that fits one
+    page unscaled goes into the build cache, so compiling the same source
+    afterwards reuses it instead of running pdflatex again.
+    """
+    with tempfile.TemporaryDirectory(prefix="cvbuild-probe-") as build_dir:
+        returncode, _ = _build(source, "probe", build_dir, fmt)
+        log_path = os.path.join(build_dir, "probe.log")
+        try:
+            with open(log_path, encoding="utf-8", errors="replace") as f:
+                log = f.read()
+        except OSError:
+            return None
+        pages = PAGES_RE.search(log)
+        if returncode != 0 or pages is None:
+            return None
+        result = {"pages": int(pages.group(1)), "scaled": SCALED_MARKER in log}
+        pdf_path = os.path.join(build_dir, "probe.pdf")
+        if keep_fit and result["pages"] == 1 and not result["scaled"] and os.path.exists(pdf_path):
+            key = latex_cache.build_key_file(os.path.join(build_dir, "probe.tex"))
+            latex_cache.store(key, pdf_path, log_path)
+    return result
+
+def compile_tex(tex_str, output_pdf, fmt=None, warm=True, record=True, force=False):
+    """Compile a rendered document in a private temporary build directory.
+
+    Only ``output_pdf`` and its ``.log`` next to it are written outside the
+    build directory, so any number of documents can compile concurrently.
+    Pass ``fmt`` to use a format built elsewhere, or ``warm=False`` to
+    compile cold. ``record`` adds the timing to the compile stats of this
+    process. Unless ``force`` is set, a source identical to an earlier
+    successful build (same templates too) reuses that PDF without running
+    pdflatex.
+    """
+    return _compile(_source_writer(tex_str), latex_cache.build_key(tex_str), output_pdf, fmt, warm, record, force)
+
+def compile_file(tex_path, output_pdf, fmt=None, warm=True, record=True, force=False):
+    """``compile_tex`` for a document already written to ``tex_path``.
+
+    The source is hashed and copied into the build directory in blocks, so
+    it is never held in memory as a whole.
+    """
+    return _compile(_file_writer(tex_path), latex_cache.build_key_file(tex_path), output_pdf, fmt, warm, record, force)
+
+def _compile(write_source, key, output_pdf, fmt, warm, record, force):
+    name = os.path.splitext(os.path.basename(output_pdf))[0]
+    output_dir = os.path.dirname(os.path.abspath(output_pdf))
+    os.makedirs(output_dir, exist_ok=True)
+    if not force:
+        pdf_path, log_path = latex_cache.fetch(key, output_pdf)
+        if pdf_path:
+            logger.info(f"{name}: source unchanged, reused the cached PDF")
+            return CompileResult(name, 0, 0.0, False, pdf_path, log_path, cached=True)
+    if warm and fmt is None:
+        fmt = ensure_format()
+    if not warm:
+        fmt = None
+
+    with tempfile.TemporaryDirectory(prefix=f"cvbuild-{name}-") as build_dir:
+        returncode, passes = _build(write_source, name, build_dir, fmt)
+        if returncode and fmt and _format_failed(os.path.join(build_dir, f"{name}.log")):
+            logger.warning(f"{name}: compilation with the preamble format failed, retrying cold")
+            fmt = None
+            returncode, passes = _build(write_source, name, build_dir)
+        elapsed = sum(passes)
+
+        pdf_path = log_path = None
+        if os.path.exists(os.path.join(build_dir, f"{name}.log")):
+            log_path = os.path.join(output_dir, f"{name}.log")
+            shutil.copyfile(os.path.join(build_dir, f"{name}.log"), log_path)
+        if returncode == 0 and os.path.exists(os.path.join(build_dir, f"{name}.pdf")):
+            pdf_path = os.path.abspath(output_pdf)
+            shutil.copyfile(os.path.join(build_dir, f"{name}.pdf"), pdf_path)
+
+    if returncode == 0 and fmt and needs_baseline():
+        with tempfile.TemporaryDirectory(prefix=f"cvbuild-{name}-cold-") as scratch:
+            cold_code, cold_passes = _build(write_source, name, scratch)
+            if cold_code == 0:
+                save_baseline(sum(cold_passes))
+
+    result = CompileResult(name, returncode, elapsed, fmt is not None, pdf_path, log_path, passes=passes)
+    if result.ok:
+        latex_cache.store(key, pdf_path, log_path)
+    if record:
+        STATS.record(result.seconds, warm=result.warm)
+    if result.ok:
+        logger.info(f"Compiled {pdf_path} in {elapsed:.2f}s ({len(passes)} pass(es): {_format_passes(passes)})")
+    else:
+        logger.error(f"Compilation of {name} failed with exit status {returncode}, see {log_path}")
+    return result
+
+# Single-character replacements, applied in one pass by str.translate
+LATEX_ESCAPES = str.maketrans({
+    '&': r'\&', '%': r'\%', '$': r'\$', '#': r'\#',
+    '_': r'\_', '{': r'\{', '}': r'\}',
+    '~': r'\textasciitilde{}', '^': r'\textasciicircum{}',
+    '\\': r'\textbackslash{}',
+})
+
+# Names, categories and tech tags repeat across sections and batch variants
+@lru_cache(maxsize=4096)
+def _escape(s):
+    return s.translate(LATEX_ESCAPES)
+
 def escape_latex(s):
     if not isinstance(s, str):
         return s
-    replace = {
-        '&': r'\&', '%': r'\%', '$': r'\$', '#': r'\#',
-        '_': r'\_', '{': r'\{', '}': r'\}',
-        '~': r'\textasciitilde{}', '^': r'\textasciicircum{}',
-        '\\': r'\textbackslash{}',
-    }
-    pattern = re.compile('|'.join(re.escape(k) for k in replace))
-    return pattern.sub(lambda m: replace[m.group()], s)
+    return _escape(s)
 
 # register the filter with Jinja2 environment
 env.filters["escape_latex"] = escape_latex
@@ -53,35 +291,160 @@ def render_template(template_name, context):
         logger.exception(f"Error rendering template: {template_name}")
         exit(1)
 
+def contact_lines(contact):
+    """Lines of the \\namesection contact block."""
+    lines = [
+        f"\\namesection{{{escape_latex(contact['name'])}}}{{%\n",
+        f"{escape_latex(contact['phone'])} \\\\\n",
+        f"\\href{{mailto:{escape_latex(contact['email'])}}}{{{escape_latex(contact['email'])}}} \\\\\n",
+        f"LinkedIn: \\href{{{escape_latex(contact['linkedin'])}}}{{{escape_latex(contact['linkedin'].replace('https://',''))}}} \\\\\n",
+    ]
+    if "githubs" in contact:
+        for gh in contact["githubs"]:
+            lines.append(f'{escape_latex(gh["label"])} GitHub: \\href{{{escape_latex(gh["url"])}}}{{{escape_latex(gh["url"].replace("https://", ""))}}} \\\\\n')
+    elif "github" in contact:
+        lines.append(f'GitHub: \\href{{{escape_latex(contact["github"])}}}{{{escape_latex(contact["github"].replace("https://", ""))}}}\n')
+    lines.append("}\n")
+    return lines
+
+class ResumeRenderer:
+    """Renders the resume from templates loaded and compiled once.
+
+    Header, footer and the compiled section templates are kept in memory and
+    reloaded when a template file changes, which is checked at most every
+    ``check_interval`` seconds. With ``precompile`` the section templates are
+    also compiled to Python modules (Jinja's ``compile_templates``) under
+    COMPILED_TEMPLATE_DIR, so later processes skip parsing them.
+    """
+
+    sections = (
+        ("skills", "skills.tex.j2"),
+        ("projects", "projects.tex.j2"),
+        ("experience", "experience.tex.j2"),
+        ("education", "education.tex.j2"),
+    )
+
+    def __init__(self, template_dir=TEMPLATE_DIR, precompile=False, check_interval=1.0):
+        self.template_dir = template_dir
+        self.precompile = precompile
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._load()
+
+    def _signature(self):
+        signature = []
+        for name in sorted(os.listdir(self.template_dir)):
+            if name.endswith(".j2") or name in ("header.tex", "footer.tex"):
+                stat = os.stat(os.path.join(self.template_dir, name))
+                signature.append((name, stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
+    def _environment(self):
+        def make(loader):
+            environment = Environment(loader=loader, auto_reload=False, **ENV_OPTIONS)
+            environment.filters["escape_latex"] = escape_latex
+            return environment
+
+        loader = FileSystemLoader(self.template_dir)
+        if not self.precompile:
+            return make(loader)
+        target = os.path.join(COMPILED_TEMPLATE_DIR, latex_cache.build_key("", self.template_dir)[:16])
+        if not os.path.isdir(target):
+            if os.path.isdir(COMPILED_TEMPLATE_DIR):
+                for stale in os.listdir(COMPILED_TEMPLATE_DIR):
+                    shutil.rmtree(os.path.join(COMPILED_TEMPLATE_DIR, stale), ignore_errors=True)
+            make(loader).compile_templates(target, filter_func=lambda name: name.endswith(".j2"), zip=None)
+            logger.info(f"Precompiled templates to {target}")
+        # Templates missing from the compiled set still load from source
+        return make(ChoiceLoader([ModuleLoader(target), loader]))
+
+    def _read(self, name):
+        with open(os.path.join(self.template_dir, name), encoding='utf-8') as f:
+            return f.read()
+
+    def _load(self):
+        signature = self._signature()
+        environment = self._environment()
+        self._bundle = (
+            self._read('header.tex'),
+            [(key, environment.get_template(name)) for key, name in self.sections],
+            self._read('footer.tex'),
+        )
+        self._loaded = signature
+        self._checked = time.monotonic()
+
+    def _refresh(self):
+        if time.monotonic() - self._checked < self.check_interval:
+            return
+        with self._lock:
+            self._checked = time.monotonic()
+            if self._signature() != self._loaded:
+                logger.info("Templates changed, reloading")
+                self._load()
+
+    def chunks(self, contact, skills, projects, experience, education):
+        """Yield the document piece by piece: header, contact, sections, footer."""
+        self._refresh()
+        header, sections, footer = self._bundle
+        data = {"skills": skills, "projects": projects, "experience": experience, "education": education}
+        yield header
+        yield from contact_lines(contact)
+        for key, template in sections:
+            yield from template.generate({key: data[key]})
+        yield footer
+
+    def render(self, contact, skills, projects, experience, education):
+        return "".join(self.chunks(contact, skills, projects, experience, education))
+
+    def stream(self, sink, contact, skills, projects, experience, education, buffer_size=WRITE_BUFFER_SIZE):
+        """Write the document to ``sink`` (an open file, ``io.StringIO``, ...).
+
+        Chunks are joined and written once ``buffer_size`` characters are
+        pending, so at most that much of the document is held besides the
+        template data. Returns the number of characters written.
+        """
+        pending, size, total = [], 0, 0
+        for chunk in self.chunks(contact, skills, projects, experience, education):
+            pending.append(chunk)
+            size += len(chunk)
+            if size >= buffer_size:
+                sink.write("".join(pending))
+                total += size
+                pending, size = [], 0
+        if pending:
+            sink.write("".join(pending))
+            total += size
+        return total
+
+_renderer = None
+_renderer_lock = threading.Lock()
+
+def get_renderer():
+    """Return the process-wide renderer (JINJA_PRECOMPILE=1 precompiles templates)."""
+    global _renderer
+    with _renderer_lock:
+        if _renderer is None:
+            precompile = os.getenv("JINJA_PRECOMPILE", "").lower() in ("1", "true", "yes")
+            _renderer = ResumeRenderer(precompile=precompile)
+        return _renderer
+
 def render_resume(contact, skills, projects, experience, education):
     """Render full LaTeX string for resume"""
     try:
-        with open(os.path.join(TEMPLATE_DIR, 'header.tex'), encoding='utf-8') as f:
-            tex = f.read()
-
-        # Contact info block
-        tex += f"""\\namesection{{{escape_latex(contact['name'])}}}{{%
-{escape_latex(contact['phone'])} \\\\
-\\href{{mailto:{escape_latex(contact['email'])}}}{{{escape_latex(contact['email'])}}} \\\\
-LinkedIn: \\href{{{escape_latex(contact['linkedin'])}}}{{{escape_latex(contact['linkedin'].replace('https://',''))}}} \\\\
-"""
-        if "githubs" in contact:
-            for gh in contact["githubs"]:
-                tex += f'{escape_latex(gh["label"])} GitHub: \\href{{{escape_latex(gh["url"])}}}{{{escape_latex(gh["url"].replace("https://", ""))}}} \\\\\n'
-        elif "github" in contact:
-            tex += f'GitHub: \\href{{{escape_latex(contact["github"])}}}{{{escape_latex(contact["github"].replace("https://", ""))}}}\n'
-        tex += "}\n"
-
-        # Add your sections
-        tex += render_template('skills.tex.j2', {'skills': skills})
-        tex += render_template('projects.tex.j2', {'projects': projects})
-        tex += render_template('experience.tex.j2', {'experience': experience})
-        tex += render_template('education.tex.j2', {'education': education})
-
-        with open(os.path.join(TEMPLATE_DIR, 'footer.tex'), encoding='utf-8') as f:
-            tex += f.read()
-
-        return tex
+        return get_renderer().render(contact, skills, projects, experience, education)
+    except Exception as e:
+        logger.exception("Error assembling LaTeX document")
+        exit(1)
+
+def render_resume_to(target, contact, skills, projects, experience, education, buffer_size=WRITE_BUFFER_SIZE):
+    """Stream the LaTeX resume to ``target``, a file path or a writable sink"""
+    try:
+        if not isinstance(target, (str, os.PathLike)):
+            return get_renderer().stream(target, contact, skills, projects, experience, education, buffer_size)
+        with open(target, 'w', encoding='utf-8', newline='') as f:
+            written = get_renderer().stream(f, contact, skills, projects, experience, education, buffer_size)
+        logger.info(f"{os.path.basename(target)} written to {target}")
+        return written
     except Exception as e:
         logger.exception("Error assembling LaTeX document")
         exit(1)
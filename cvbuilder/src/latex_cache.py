@@ -0,0 +1,95 @@
+"""Cache of compiled PDFs keyed by the rendered source and the templates."""
+
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+from typing import Optional, Tuple
+
+from src.utils.logger import get_logger
+
+logger = get_logger("latex-cache")
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../"))
+TEMPLATE_DIR = os.path.join(BASE_DIR, "templates")
+BUILD_CACHE_DIR = os.path.join(BASE_DIR, "cache", "builds")
+MAX_ENTRIES = 100
+READ_BLOCK_SIZE = 64 * 1024
+# Rendered output written into templates/, not an input of the build
+IGNORED_TEMPLATES = {"main.tex"}
+
+_lock = threading.Lock()
+
+
+def build_key(tex_str: str, template_dir: str = TEMPLATE_DIR) -> str:
+    """Hash of the rendered source plus every template file (header, footer, sections)."""
+    return _add_templates(hashlib.sha256(tex_str.encode("utf-8")), template_dir)
+
+
+def build_key_file(tex_path: str, template_dir: str = TEMPLATE_DIR) -> str:
+    """``build_key`` of a source already written to ``tex_path``, read in blocks."""
+    digest = hashlib.sha256()
+    with open(tex_path, "rb") as f:
+        for block in iter(lambda: f.read(READ_BLOCK_SIZE), b""):
+            digest.update(block)
+    return _add_templates(digest, template_dir)
+
+
+def _add_templates(digest, template_dir: str) -> str:
+    for name in sorted(os.listdir(template_dir)):
+        path = os.path.join(template_dir, name)
+        if name in IGNORED_TEMPLATES or not os.path.isfile(path):
+            continue
+        digest.update(name.encode("utf-8"))
+        with open(path, "rb") as f:
+            digest.update(hashlib.sha256(f.read()).digest())
+    return digest.hexdigest()
+
+
+def fetch(key: str, output_pdf: str) -> Tuple[Optional[str], Optional[str]]:
+    """Place a cached build at ``output_pdf``; returns (pdf_path, log_path) or (None, None)."""
+    cached_pdf = os.path.join(BUILD_CACHE_DIR, f"{key}.pdf")
+    if not os.path.exists(cached_pdf):
+        return None, None
+    os.makedirs(os.path.dirname(os.path.abspath(output_pdf)), exist_ok=True)
+    # Copied, not hard-linked: later builds overwrite outputs in place
+    shutil.copyfile(cached_pdf, output_pdf)
+    os.utime(cached_pdf)
+
+    log_path = None
+    cached_log = os.path.join(BUILD_CACHE_DIR, f"{key}.log")
+    if os.path.exists(cached_log):
+        log_path = os.path.splitext(output_pdf)[0] + ".log"
+        shutil.copyfile(cached_log, log_path)
+    return os.path.abspath(output_pdf), log_path
+
+
+def store(key: str, pdf_path: str, log_path: Optional[str] = None) -> None:
+    """Keep a successful build, evicting the least recently used past MAX_ENTRIES."""
+    with _lock:
+        os.makedirs(BUILD_CACHE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=BUILD_CACHE_DIR, suffix=".tmp")
+        os.close(fd)
+        shutil.copyfile(pdf_path, tmp_path)
+        os.replace(tmp_path, os.path.join(BUILD_CACHE_DIR, f"{key}.pdf"))
+        if log_path:
+            shutil.copyfile(log_path, os.path.join(BUILD_CACHE_DIR, f"{key}.log"))
+        _evict()
+
+
+def _evict() -> None:
+    pdfs = []
+    for name in os.listdir(BUILD_CACHE_DIR):
+        if name.endswith(".pdf"):
+            path = os.path.join(BUILD_CACHE_DIR, name)
+            try:
+                pdfs.append((os.path.getmtime(path), path))
+            except OSError:
+                continue
+    for _, path in sorted(pdfs)[: max(len(pdfs) - MAX_ENTRIES, 0)]:
+        for victim in (path, os.path.splitext(path)[0] + ".log"):
+            try:
+                os.remove(victim)
+            except OSError:
+                pass
@@ -0,0 +1,208 @@
+"""Search for the least aggressive layout that fits the CV on one page.
+
+Operators used to tweak ``\\linespread``, the geometry margins and the
+paragraph spacing in header.tex by hand. The fitter compiles variants of the
+rendered document along one tightening axis and picks the lowest level at
+which the content fits without FitOnePage having to scale it down. Fitting
+probes go into the build cache, so the final compile of the chosen variant
+reuses its probe instead of running pdflatex again.
+"""
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+
+from src import latex_cache
+from src.latex import measure_layout
+from src.latex_format import ensure_format
+from src.utils.logger import get_logger
+
+logger = get_logger("latex-fit")
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../"))
+FIT_CACHE_DIR = os.path.join(BASE_DIR, "cache", "fit")
+
+# Level 0 is header.tex as written; MAX_LEVEL is the tightest variant
+MAX_LEVEL = 8
+# (header.tex value, tightest value) per parameter
+LINESPREAD = (1.0, 0.9)
+MARGIN_TOP_BOTTOM = (0.42, 0.25)
+MARGIN_LEFT_RIGHT = (0.32, 0.25)
+PARSKIP = (3.0, 1.0)
+MARKER = "\\begin{document}"
+
+
+def _lerp(bounds, level):
+    start, end = bounds
+    return start + (end - start) * level / MAX_LEVEL
+
+
+def layout(level: int) -> Dict[str, float]:
+    return {
+        "linespread": round(_lerp(LINESPREAD, level), 4),
+        "margin_tb": round(_lerp(MARGIN_TOP_BOTTOM, level), 4),
+        "margin_lr": round(_lerp(MARGIN_LEFT_RIGHT, level), 4),
+        "parskip": round(_lerp(PARSKIP, level), 4),
+    }
+
+
+def _layout_block(level: int) -> str:
+    values = layout(level)
+    return (
+        f"\n\\newgeometry{{left={values['margin_lr']}in,right={values['margin_lr']}in,"
+        f"top={values['margin_tb']}in,bottom={values['margin_tb']}in}}\n"
+        f"\\linespread{{{values['linespread']}}}\\selectfont\n"
+        f"\\setlength{{\\parskip}}{{{values['parskip']}pt}}\n"
+    )
+
+
+def apply_layout(tex_str: str, level: int) -> str:
+    """Insert the layout overrides for ``level`` right after ``\\begin{document}``.
+
+    Overrides go after the preamble so documents keep matching the
+    precompiled header format.
+    """
+    if level <= 0:
+        return tex_str
+    index = tex_str.find(MARKER)
+    if index < 0:
+        return tex_str
+    index += len(MARKER)
+    return tex_str[:index] + _layout_block(level) + tex_str[index:]
+
+
+def apply_layout_file(tex_path: str, dest_path: str, level: int) -> None:
+    """``apply_layout`` from ``tex_path`` to ``dest_path``, copying line by line."""
+    block = _layout_block(level) if level > 0 else None
+    with open(tex_path, "r", encoding="utf-8", newline="") as src, \
+            open(dest_path, "w", encoding="utf-8", newline="") as dest:
+        for line in src:
+            index = line.find(MARKER) if block else -1
+            if index >= 0:
+                index += len(MARKER)
+                line = line[:index] + block + line[index:]
+                block = None
+            dest.write(line)
+
+
+def _file_variant(tex_path: str, level: int):
+    # measure_layout source writing the variant straight into the probe directory
+    return lambda dest_path: apply_layout_file(tex_path, dest_path, level)
+
+
+def _fits(tex, level: int, fmt: Optional[str], variant=apply_layout, measure=None) -> Optional[bool]:
+    """Whether the variant fits one page unscaled; None if it did not compile."""
+    if measure is not None:
+        result = measure(tex, level)
+    else:
+        result = measure_layout(variant(tex, level), fmt, keep_fit=True)
+    if result is None:
+        return None
+    return result["pages"] == 1 and not result["scaled"]
+
+
+def _cache_path(key: str) -> str:
+    return os.path.join(FIT_CACHE_DIR, f"{key}.json")
+
+
+def _cached_level(key: str) -> Optional[int]:
+    try:
+        with open(_cache_path(key), "r", encoding="utf-8") as f:
+            return json.load(f)["level"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def _store_level(key: str, level: int) -> None:
+    os.makedirs(FIT_CACHE_DIR, exist_ok=True)
+    with open(_cache_path(key), "w", encoding="utf-8") as f:
+        json.dump({"level": level, "layout": layout(level)}, f)
+
+
+def search_level(
+    tex, workers: Optional[int] = None, fmt: Optional[str] = None, variant=apply_layout, measure=None
+) -> Optional[int]:
+    """Lowest level whose variant fits on one page, MAX_LEVEL if none does,
+    None if the document or one of its variants does not compile.
+
+    Assumes tighter levels never need more space. Each round compiles up to
+    ``workers`` evenly spaced levels of the open interval in parallel and
+    keeps the part between the last miss and the first fit, i.e. a k-ary
+    binary search. ``variant(tex, level)`` builds what gets compiled;
+    ``_file_variant`` searches a document on disk. ``measure(tex, level)``
+    replaces compiling in this process, e.g. with ``CompilePool.measure_file``.
+    """
+    workers = workers or min(os.cpu_count() or 1, 4)
+    first = _fits(tex, 0, fmt, variant, measure)
+    if first is None:
+        return None
+    if first:
+        return 0
+    low, high = 0, MAX_LEVEL + 1  # low misses; high fits (MAX_LEVEL + 1 = give up)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fit") as pool:
+        while high - low > 1:
+            span = high - low - 1
+            count = min(workers, span)
+            levels = sorted({low + 1 + (span * (i + 1)) // (count + 1) for i in range(count)})
+            results = dict(zip(levels, pool.map(lambda lvl: _fits(tex, lvl, fmt, variant, measure), levels)))
+            broken = [lvl for lvl, ok in results.items() if ok is None]
+            if broken:
+                # A failed compile says nothing about the fit; do not read it as an overflow
+                logger.error(f"Layout level {broken[0]} does not compile, aborting the one-page search")
+                return None
+            tried = ", ".join(f"{lvl}={'fits' if ok else 'overflows'}" for lvl, ok in results.items())
+            logger.info(f"Layout levels tried: {tried}")
+            fitting = [lvl for lvl in levels if results[lvl]]
+            if fitting:
+                high = fitting[0]
+            missing = [lvl for lvl in levels if not results[lvl] and lvl < high]
+            if missing:
+                low = missing[-1]
+    return min(high, MAX_LEVEL)
+
+
+def fit_one_page(tex_str: str, workers: Optional[int] = None, force: bool = False) -> str:
+    """Return ``tex_str`` with the least aggressive layout that fits one page.
+
+    The chosen level is cached per content hash, so rebuilding the same
+    document skips the search. If nothing fits, the tightest layout is used
+    and FitOnePage scales the rest.
+    """
+    key = latex_cache.build_key(tex_str)
+    level = None if force else _cached_level(key)
+    if level is None:
+        level = search_level(tex_str, workers, ensure_format())
+        if level is None:
+            logger.warning("Document does not compile, skipping the one-page search")
+            return tex_str
+        _store_level(key, level)
+        logger.info(f"One-page layout: level {level}/{MAX_LEVEL} {layout(level)}")
+    return apply_layout(tex_str, level)
+
+
+def fit_file(tex_path: str, workers: Optional[int] = None, force: bool = False, compiler=None) -> int:
+    """``fit_one_page`` for a document on disk, rewritten in place.
+
+    Variants are streamed from the file into the probe directories, so the
+    document is never loaded as a whole. With a ``compiler`` (CompilePool)
+    the probes run on its workers, so concurrent fits stay within its CPU
+    cap. Returns the level applied.
+    """
+    key = latex_cache.build_key_file(tex_path)
+    level = None if force else _cached_level(key)
+    if level is None:
+        if compiler is not None:
+            level = search_level(tex_path, workers or compiler.workers, measure=compiler.measure_file)
+        else:
+            level = search_level(tex_path, workers, ensure_format(), variant=_file_variant)
+        if level is None:
+            logger.warning("Document does not compile, skipping the one-page search")
+            return 0
+        _store_level(key, level)
+        logger.info(f"One-page layout: level {level}/{MAX_LEVEL} {layout(level)}")
+    if level > 0:
+        fitted_path = tex_path + ".fit"
+        apply_layout_file(tex_path, fitted_path, level)
+        os.replace(fitted_path, tex_path)
+    return level
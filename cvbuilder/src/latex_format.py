@@ -0,0 +1,149 @@
+"""Precompiled LaTeX preamble format shared by every pdflatex run.
+
+``header.tex`` is dumped into a ``.fmt`` with mylatexformat, so a compile
+starts with geometry, enumitem, hyperref and microtype already loaded and
+skips the document preamble. The format is named after a hash of
+``header.tex`` and rebuilt whenever the header changes.
+"""
+
+import glob
+import hashlib
+import json
+import os
+import subprocess
+import threading
+from typing import Dict, Optional
+
+from src.utils.logger import get_logger
+
+logger = get_logger("latex-format")
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../"))
+TEMPLATE_DIR = os.path.join(BASE_DIR, "templates")
+HEADER_PATH = os.path.join(TEMPLATE_DIR, "header.tex")
+FORMAT_DIR = os.path.join(BASE_DIR, "cache", "latex")
+
+
+class CompileStats:
+    """Thread-safe timings of warm (format) and cold pdflatex runs."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.warm = []
+        self.cold = []
+
+    def record(self, seconds: float, warm: bool) -> None:
+        with self._lock:
+            (self.warm if warm else self.cold).append(seconds)
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            warm, cold = list(self.warm), list(self.cold)
+        baseline = _load_baseline()
+        warm_avg = sum(warm) / len(warm) if warm else 0.0
+        cold_avg = sum(cold) / len(cold) if cold else baseline or 0.0
+        return {
+            "warm_documents": len(warm),
+            "cold_documents": len(cold),
+            "warm_seconds": warm_avg,
+            "cold_seconds": cold_avg,
+            "speedup": cold_avg / warm_avg if warm_avg and cold_avg else 0.0,
+        }
+
+
+STATS = CompileStats()
+
+_format_lock = threading.Lock()
+_format_failed = set()
+
+
+def format_name(header_path: str = HEADER_PATH) -> str:
+    with open(header_path, "rb") as f:
+        digest = hashlib.sha256(f.read()).hexdigest()[:12]
+    return f"cvheader-{digest}"
+
+
+def format_env() -> Dict[str, str]:
+    """Environment letting pdflatex find formats in FORMAT_DIR (then the defaults)."""
+    env = dict(os.environ)
+    env["TEXFORMATS"] = FORMAT_DIR + os.pathsep + env.get("TEXFORMATS", "")
+    return env
+
+
+def ensure_format(header_path: str = HEADER_PATH) -> Optional[str]:
+    """Return the format name for the current header, building it if needed.
+
+    Returns None when the format cannot be built, so callers compile cold.
+    """
+    if os.getenv("LATEX_NO_FORMAT", "").lower() in ("1", "true", "yes"):
+        return None
+    name = format_name(header_path)
+    with _format_lock:
+        if os.path.exists(os.path.join(FORMAT_DIR, f"{name}.fmt")):
+            return name
+        if name in _format_failed:
+            return None
+
+        os.makedirs(FORMAT_DIR, exist_ok=True)
+        for stale in glob.glob(os.path.join(FORMAT_DIR, "cvheader-*")):
+            os.remove(stale)
+        logger.info(f"Building LaTeX format {name} from {header_path}")
+        try:
+            subprocess.run(
+                [
+                    "pdflatex", "-ini", "-interaction=nonstopmode",
+                    f"-jobname={name}", "-output-directory", FORMAT_DIR,
+                    "&pdflatex", "mylatexformat.ltx", os.path.basename(header_path),
+                ],
+                cwd=os.path.dirname(header_path),
+                check=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            logger.warning("Could not build the LaTeX format, compiling without it")
+            _format_failed.add(name)
+            return None
+        return name
+
+
+def _baseline_path() -> str:
+    return os.path.join(FORMAT_DIR, f"{format_name()}.json")
+
+
+def _load_baseline() -> Optional[float]:
+    try:
+        with open(_baseline_path(), "r", encoding="utf-8") as f:
+            return json.load(f)["cold_seconds"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def needs_baseline() -> bool:
+    """Whether no cold compile time has been measured for the current format."""
+    return _load_baseline() is None
+
+
+def save_baseline(seconds: float) -> None:
+    os.makedirs(FORMAT_DIR, exist_ok=True)
+    with open(_baseline_path(), "w", encoding="utf-8") as f:
+        json.dump({"cold_seconds": seconds}, f)
+
+
+def log_compile_stats() -> Dict[str, float]:
+    stats = STATS.snapshot()
+    if stats["speedup"]:
+        logger.info(
+            "pdflatex: %d documents at %.2fs each with the preamble format vs %.2fs cold (%.1fx faster)",
+            stats["warm_documents"],
+            stats["warm_seconds"],
+            stats["cold_seconds"],
+            stats["speedup"],
+        )
+    else:
+        logger.info(
+            "pdflatex: %d warm and %d cold documents",
+            stats["warm_documents"],
+            stats["cold_documents"],
+        )
+    return stats
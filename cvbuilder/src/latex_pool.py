@@ -0,0 +1,88 @@
+"""Process pool compiling many LaTeX documents in parallel, each isolated."""
+
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from src.latex import CompileResult, compile_file, compile_tex, measure_layout
+from src.latex_fit import _file_variant
+from src.latex_format import STATS, ensure_format
+from src.utils.logger import get_logger
+
+logger = get_logger("latex-pool")
+
+
+def _compile_job(tex_str, output_pdf, fmt, force):
+    # Runs in a worker process: its stats are recorded by the parent
+    return compile_tex(tex_str, output_pdf, fmt=fmt, warm=fmt is not None, record=False, force=force)
+
+
+def _compile_file_job(tex_path, output_pdf, fmt, force):
+    return compile_file(tex_path, output_pdf, fmt=fmt, warm=fmt is not None, record=False, force=force)
+
+
+def _measure_file_job(tex_path, level, fmt):
+    return measure_layout(_file_variant(tex_path, level), fmt, keep_fit=True)
+
+
+class CompilePool:
+    """Pool of pdflatex worker processes sharing one preamble format.
+
+    Every document compiles in its own temporary build directory under an
+    explicit output name (see ``compile_tex``), so jobs never share source,
+    ``.aux`` or PDF files. The pool is capped at the CPU count. The format
+    is built (or rebuilt after a header.tex change) once when the pool
+    starts, so workers never race to dump it.
+    """
+
+    def __init__(self, workers=None, force=False):
+        cpus = os.cpu_count() or 1
+        self.workers = min(workers or cpus, cpus)
+        self.format = ensure_format()
+        # Recompile even when the build cache has the document
+        self.force = force
+        # spawn: forking a process that already runs threads can deadlock
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+        )
+        self.results = []
+
+    def submit(self, tex_str, output_pdf) -> "Future[CompileResult]":
+        return self._submit(_compile_job, tex_str, output_pdf)
+
+    def submit_file(self, tex_path, output_pdf) -> "Future[CompileResult]":
+        """Like ``submit`` for a source on disk; only the path crosses to the worker."""
+        return self._submit(_compile_file_job, tex_path, output_pdf)
+
+    def _submit(self, job, source, output_pdf) -> "Future[CompileResult]":
+        future = self._executor.submit(job, source, output_pdf, self.format, self.force)
+        future.add_done_callback(self._collect)
+        return future
+
+    def compile(self, tex_str, output_pdf) -> CompileResult:
+        """Compile on a pool worker and wait for the result."""
+        return self.submit(tex_str, output_pdf).result()
+
+    def compile_file(self, tex_path, output_pdf) -> CompileResult:
+        return self.submit_file(tex_path, output_pdf).result()
+
+    def measure_file(self, tex_path, level):
+        """``measure_layout`` of a one-page-fit variant, compiled on a pool worker."""
+        return self._executor.submit(_measure_file_job, tex_path, level, self.format).result()
+
+    def _collect(self, future: Future) -> None:
+        if future.cancelled() or future.exception() is not None:
+            return
+        result = future.result()
+        if not result.cached:
+            STATS.record(result.seconds, warm=result.warm)
+        self.results.append(result)
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -7,4 +7,19 @@ __all__ = [
     "experience",
     "education",
     "certificates",
+    "default_stages",
 ]
+
+
+def default_stages():
+    """Return the stages of every section pipeline for the scheduler."""
+    from . import certificates, education, experience, personal, projects, skills
+
+    return [
+        *personal.STAGES,
+        *projects.STAGES,
+        *skills.STAGES,
+        *experience.STAGES,
+        *education.STAGES,
+        *certificates.STAGES,
+    ]
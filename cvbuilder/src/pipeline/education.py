@@ -1,38 +1,30 @@
 """Pipeline utilities for building the education section."""
 
-import os
-import json
-from src.notion import education as notion_education
-from src.utils.commons import load_json
-
-BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
-DATA_DIR = os.path.join(BASE_DIR, "data")
-LATEX_DIR = os.path.join(BASE_DIR, "latex_data")
+from notion.education import EducationClient
+from src.pipeline.scheduler import Stage
+from src.utils.commons import to_jsonable
 
 
 def fetch_raw():
-    """Fetch education data from Notion and store raw JSON."""
-    notion_education.run()
+    """Fetch education records from Notion as Education models."""
+    return EducationClient().sync()
 
 
-def select_relevant():
-    """Copy raw education data to LaTeX directory."""
-    src_path = os.path.join(DATA_DIR, "education.json")
-    dst_path = os.path.join(LATEX_DIR, "education.json")
-    os.makedirs(LATEX_DIR, exist_ok=True)
-    data = load_json(src_path)
-    with open(dst_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+def select_relevant(education):
+    """Return the fetched education; it goes into the CV as is."""
+    return education
 
 
-def render_section():
-    """Load curated education JSON ready for LaTeX rendering."""
-    path = os.path.join(LATEX_DIR, "education.json")
-    return load_json(path)
+def render_section(education):
+    """Convert education models into plain data for the LaTeX templates."""
+    return to_jsonable(education)
 
 
 def run():
     """Execute the full education pipeline and return LaTeX data."""
-    fetch_raw()
-    select_relevant()
-    return render_section()
+    return render_section(select_relevant(fetch_raw()))
+
+
+STAGES = [
+    Stage("education", run, outputs=("data/education",)),
+]
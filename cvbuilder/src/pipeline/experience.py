@@ -1,38 +1,30 @@
 """Pipeline utilities for building the experience section."""
 
-import os
-import json
-from src.notion import experience as notion_experience
-from src.utils.commons import load_json
-
-BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
-DATA_DIR = os.path.join(BASE_DIR, "data")
-LATEX_DIR = os.path.join(BASE_DIR, "latex_data")
+from notion.experience import ExperienceClient
+from src.pipeline.scheduler import Stage
+from src.utils.commons import to_jsonable
 
 
 def fetch_raw():
-    """Fetch experience data from Notion and store raw JSON."""
-    notion_experience.run()
+    """Fetch experience records from Notion as Experience models."""
+    return ExperienceClient().sync()
 
 
-def select_relevant():
-    """Copy raw experience data to LaTeX directory."""
-    src_path = os.path.join(DATA_DIR, "experience.json")
-    dst_path = os.path.join(LATEX_DIR, "experience.json")
-    os.makedirs(LATEX_DIR, exist_ok=True)
-    data = load_json(src_path)
-    with open(dst_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+def select_relevant(experience):
+    """Return the fetched experience; it goes into the CV as is."""
+    return experience
 
 
-def render_section():
-    """Load curated experience JSON ready for LaTeX rendering."""
-    path = os.path.join(LATEX_DIR, "experience.json")
-    return load_json(path)
+def render_section(experience):
+    """Convert experience models into plain data for the LaTeX templates."""
+    return to_jsonable(experience)
 
 
 def run():
     """Execute the full experience pipeline and return LaTeX data."""
-    fetch_raw()
-    select_relevant()
-    return render_section()
+    return render_section(select_relevant(fetch_raw()))
+
+
+STAGES = [
+    Stage("experience", run, outputs=("data/experience",)),
+]
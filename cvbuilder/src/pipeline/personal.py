@@ -1,31 +1,20 @@
 """Pipeline utilities for building the contact section."""
 
-import os
-import json
-from src.notion import personal as notion_personal
-from src.utils.commons import load_json
-
-BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
-DATA_DIR = os.path.join(BASE_DIR, "data")
-LATEX_DIR = os.path.join(BASE_DIR, "latex_data")
+from notion.personal import PersonalInfoClient
+from src.pipeline.scheduler import Stage
 
 
 def fetch_raw():
-    """Fetch personal information from Notion and store raw JSON."""
-    notion_personal.run()
-
+    """Fetch personal information from Notion as PersonalInfo models."""
+    return PersonalInfoClient().sync()
 
-def select_relevant():
-    """Convert raw personal info into LaTeX-ready contact data."""
-    src_path = os.path.join(DATA_DIR, "personal_info.json")
-    dst_path = os.path.join(LATEX_DIR, "contact.json")
-    os.makedirs(LATEX_DIR, exist_ok=True)
-    data = load_json(src_path)
 
+def select_relevant(personal_info):
+    """Convert personal info models into LaTeX-ready contact data."""
     contact = {}
-    for item in data:
-        key = item.get("key", "").strip().lower().replace(" ", "_")
-        value = item.get("value", "")
+    for item in personal_info:
+        key = item.key.strip().lower().replace(" ", "_")
+        value = item.value
         if not key:
             continue
         if key in contact:
@@ -37,19 +26,19 @@ def select_relevant():
             contact[key] = value
     if isinstance(contact.get("github"), list):
         contact["githubs"] = contact.pop("github")
-
-    with open(dst_path, "w", encoding="utf-8") as f:
-        json.dump(contact, f, indent=2, ensure_ascii=False)
+    return contact
 
 
-def render_section():
-    """Load curated contact JSON ready for LaTeX rendering."""
-    path = os.path.join(LATEX_DIR, "contact.json")
-    return load_json(path)
+def render_section(contact):
+    """Return contact data ready for LaTeX rendering."""
+    return contact
 
 
 def run():
     """Execute the full contact pipeline and return LaTeX data."""
-    fetch_raw()
-    select_relevant()
-    return render_section()
+    return render_section(select_relevant(fetch_raw()))
+
+
+STAGES = [
+    Stage("personal", run, outputs=("data/personal_info",)),
+]
@@ -2,35 +2,43 @@
 
 import os
 from src.notion import projects as notion_projects
-from src.cv_agent.selector import CVSelector
-from src.utils.commons import load_json
-
-BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
-LATEX_DIR = os.path.join(BASE_DIR, "latex_data")
+from src.cv_agent.selector import get_selector
+from src.pipeline.scheduler import Stage
 
 
 def fetch_raw():
-    """Fetch project data from Notion and store raw JSON."""
-    notion_projects.run()
+    """Fetch projects from Notion as Project models."""
+    return notion_projects.run()
 
 
-def select_relevant():
+def select_relevant(projects):
     """Run AI selector to curate projects for LaTeX output."""
-    selector = CVSelector(
-        mode=os.getenv("MODE", "local"),
-        model=os.getenv("MODEL", "deepseek-coder:6.7b"),
-    )
-    selector.select_projects()
+    selector = get_selector(os.getenv("MODE", "local"), os.getenv("MODEL", "deepseek-coder:6.7b"))
+    return selector.select_projects(projects)
 
 
-def render_section():
-    """Load curated projects JSON ready for LaTeX rendering."""
-    path = os.path.join(LATEX_DIR, "projects.json")
-    return load_json(path)
+def render_section(selection):
+    """Return curated projects ready for LaTeX rendering."""
+    return selection
 
 
 def run():
     """Execute the full projects pipeline and return LaTeX data."""
-    fetch_raw()
-    select_relevant()
-    return render_section()
+    return render_section(select_relevant(fetch_raw()))
+
+
+def select_and_render(projects):
+    """Curate already fetched projects and return LaTeX data."""
+    return render_section(select_relevant(projects))
+
+
+STAGES = [
+    Stage("projects.fetch", fetch_raw, outputs=("data/projects",)),
+    Stage(
+        "projects",
+        select_and_render,
+        inputs=("data/projects",),
+        outputs=("latex/projects",),
+        pass_inputs=True,
+    ),
+]
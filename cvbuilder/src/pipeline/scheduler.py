@@ -0,0 +1,121 @@
+"""Dependency-aware scheduler running pipeline stages concurrently."""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from src.utils.logger import get_logger
+
+logger = get_logger("pipeline-scheduler")
+
+
+@dataclass(frozen=True)
+class Stage:
+    """A unit of pipeline work.
+
+    ``inputs`` and ``outputs`` name the artifacts a stage consumes and
+    produces (e.g. ``"data/projects"``). A stage starts once every
+    stage producing one of its inputs has finished. With ``pass_inputs``
+    ``func`` is called with the results of those producers, in the order
+    of ``inputs``, so stages hand their data over in memory.
+    """
+
+    name: str
+    func: Callable[..., Any]
+    inputs: Tuple[str, ...] = ()
+    outputs: Tuple[str, ...] = ()
+    pass_inputs: bool = False
+
+
+def _producers(stages: List[Stage]) -> Dict[str, str]:
+    producers: Dict[str, str] = {}
+    for stage in stages:
+        for output in stage.outputs:
+            if output in producers:
+                raise ValueError(f"Output {output!r} produced by both {producers[output]!r} and {stage.name!r}")
+            producers[output] = stage.name
+    return producers
+
+
+def _dependencies(stages: List[Stage]) -> Dict[str, set]:
+    producers = _producers(stages)
+    deps: Dict[str, set] = {}
+    for stage in stages:
+        missing = [i for i in stage.inputs if i not in producers]
+        if missing:
+            raise ValueError(f"Stage {stage.name!r} needs inputs nobody produces: {missing}")
+        deps[stage.name] = {producers[i] for i in stage.inputs}
+
+    # Kahn's algorithm, only to reject cycles before anything runs
+    remaining = {name: set(d) for name, d in deps.items()}
+    while remaining:
+        ready = [name for name, d in remaining.items() if not d]
+        if not ready:
+            raise ValueError(f"Dependency cycle between stages: {sorted(remaining)}")
+        for name in ready:
+            del remaining[name]
+        for d in remaining.values():
+            d.difference_update(ready)
+    return deps
+
+
+def run_stages(stages: Iterable[Stage], max_workers: Optional[int] = None) -> Dict[str, Any]:
+    """Run stages as soon as their inputs are ready and return results by name.
+
+    If a stage fails no new stages are started; running ones are awaited and
+    the first error is re-raised.
+    """
+    stages = list(stages)
+    names = [s.name for s in stages]
+    if len(set(names)) != len(names):
+        raise ValueError("Stage names must be unique")
+    deps = _dependencies(stages)
+    producers = _producers(stages)
+    by_name = {s.name: s for s in stages}
+
+    results: Dict[str, Any] = {}
+    timings: Dict[str, float] = {}
+    done: set = set()
+    error: Optional[BaseException] = None
+    started = time.perf_counter()
+
+    def timed(stage: Stage):
+        stage_start = time.perf_counter()
+        try:
+            if stage.pass_inputs:
+                return stage.func(*(results[producers[i]] for i in stage.inputs))
+            return stage.func()
+        finally:
+            timings[stage.name] = time.perf_counter() - stage_start
+
+    with ThreadPoolExecutor(max_workers=max_workers or len(stages) or 1) as pool:
+        running = {}
+        pending = list(names)
+        while pending or running:
+            if error is None:
+                for name in [n for n in pending if deps[n] <= done]:
+                    pending.remove(name)
+                    logger.info(f"[START] {name}")
+                    running[pool.submit(timed, by_name[name])] = name
+            elif not running:
+                break
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                try:
+                    results[name] = future.result()
+                except BaseException as e:
+                    logger.error(f"[FAIL] {name}: {e!r}")
+                    error = error or e
+                    continue
+                done.add(name)
+                logger.info(f"[DONE] {name} in {timings[name]:.2f}s")
+
+    if error is not None:
+        raise error
+    logger.info(
+        f"All stages finished in {time.perf_counter() - started:.2f}s "
+        f"(sequential sum {sum(timings.values()):.2f}s)"
+    )
+    return results
@@ -0,0 +1,198 @@
+"""Versioned snapshots of pipeline data in a single SQLite database.
+
+Every section lives under a namespace: ``data`` holds what was fetched from
+Notion (projects, skills, personal_info, experience, education,
+certificates), ``latex`` the AI selections rendered into the CV, and batch
+jobs use ``batch/<job>``. Saving a payload identical to the stored one is a
+no-op, so only sections that changed are written; each real change bumps
+the section's version.
+
+Pipelines hand their results to each other in memory; the store is a
+side-channel they ``persist`` to on a background thread, for debugging and
+as the fallback when a later fetch fails. Incremental Notion syncs keep
+their own page snapshots in ``data/notion_cache``. ``SNAPSHOT_PERSIST=0``
+turns the store off.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.utils.commons import to_jsonable
+from src.utils.logger import get_logger
+
+logger = get_logger("store")
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../"))
+STORE_PATH = os.path.join(BASE_DIR, "data", "store.sqlite3")
+DATA_DIR = os.path.join(BASE_DIR, "data")
+LATEX_DIR = os.path.join(BASE_DIR, "latex_data")
+
+# JSON files of the previous layout imported by migrate_json. The other
+# latex_data/ files were plain copies of data/ and are not needed.
+LEGACY_FILES: Dict[Tuple[str, str], str] = {
+    ("data", "projects"): os.path.join(DATA_DIR, "projects.json"),
+    ("data", "skills"): os.path.join(DATA_DIR, "skills.json"),
+    ("data", "personal_info"): os.path.join(DATA_DIR, "personal_info.json"),
+    ("data", "experience"): os.path.join(DATA_DIR, "experience.json"),
+    ("data", "education"): os.path.join(DATA_DIR, "education.json"),
+    ("data", "certificates"): os.path.join(DATA_DIR, "certificates.json"),
+    ("latex", "projects"): os.path.join(LATEX_DIR, "projects.json"),
+    ("latex", "skills"): os.path.join(LATEX_DIR, "skills.json"),
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    namespace TEXT NOT NULL,
+    section TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    digest TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (namespace, section)
+)
+"""
+
+
+class SnapshotStore:
+    """Thread-safe store of the latest JSON payload per (namespace, section)."""
+
+    def __init__(self, path: str = STORE_PATH) -> None:
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(SCHEMA)
+
+    def load(self, namespace: str, section: str) -> Any:
+        """Return the stored payload; raises KeyError when there is none."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM snapshots WHERE namespace = ? AND section = ?", (namespace, section)
+            ).fetchone()
+        if row is None:
+            raise KeyError(f"No {namespace}/{section} snapshot in {self.path}")
+        return json.loads(row[0])
+
+    def has(self, namespace: str, section: str) -> bool:
+        return self.version(namespace, section) > 0
+
+    def version(self, namespace: str, section: str) -> int:
+        """Number of changes saved for the section, 0 if it was never saved."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT version FROM snapshots WHERE namespace = ? AND section = ?", (namespace, section)
+            ).fetchone()
+        return row[0] if row else 0
+
+    def save(self, namespace: str, section: str, data: Any) -> bool:
+        """Store ``data`` unless it equals the current payload; returns whether it was written."""
+        payload = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+        digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT version, digest FROM snapshots WHERE namespace = ? AND section = ?", (namespace, section)
+            ).fetchone()
+            if row is not None and row[1] == digest:
+                return False
+            self._conn.execute(
+                "INSERT OR REPLACE INTO snapshots (namespace, section, version, digest, payload, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (namespace, section, (row[0] if row else 0) + 1, digest, payload, time.time()),
+            )
+        return True
+
+    def sections(self, namespace: str) -> List[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT section FROM snapshots WHERE namespace = ? ORDER BY section", (namespace,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def migrate_json(self, files: Optional[Dict[Tuple[str, str], str]] = None) -> int:
+        """Import JSON files of the old data/ and latex_data/ layout.
+
+        Sections already in the store are left alone and the files are not
+        deleted. Returns the number of sections imported.
+        """
+        imported = 0
+        for (namespace, section), path in (files or LEGACY_FILES).items():
+            if not os.path.exists(path) or self.has(namespace, section):
+                continue
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                logger.warning("Skipping unreadable %s", path)
+                continue
+            self.save(namespace, section, data)
+            imported += 1
+        if imported:
+            logger.info("Imported %d JSON files into %s", imported, self.path)
+        return imported
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_store: Optional[SnapshotStore] = None
+_store_lock = threading.Lock()
+
+
+def get_store() -> SnapshotStore:
+    """Return the process-wide store, importing the old JSON files when it is first created."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            created = not os.path.exists(STORE_PATH)
+            _store = SnapshotStore(STORE_PATH)
+            if created:
+                _store.migrate_json()
+        return _store
+
+
+_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="store-writer")
+_pending: List[Future] = []
+_pending_lock = threading.Lock()
+
+
+def persistence_enabled() -> bool:
+    return os.getenv("SNAPSHOT_PERSIST", "1").strip().lower() not in ("0", "false", "no")
+
+
+def _write(namespace: str, section: str, data: Any) -> bool:
+    try:
+        return get_store().save(namespace, section, to_jsonable(data))
+    except Exception:
+        logger.exception("Saving the %s/%s snapshot failed", namespace, section)
+        raise
+
+
+def persist(namespace: str, section: str, data: Any) -> Optional[Future]:
+    """Save ``data`` (models or plain JSON data) on the writer thread.
+
+    Callers must not mutate ``data`` afterwards. Returns the pending write,
+    or None when persistence is disabled.
+    """
+    if not persistence_enabled():
+        return None
+    future = _writer.submit(_write, namespace, section, data)
+    with _pending_lock:
+        _pending[:] = [f for f in _pending if not f.done()]
+        _pending.append(future)
+    return future
+
+
+def flush() -> None:
+    """Wait until every pending write has finished (failures are logged by the writer)."""
+    with _pending_lock:
+        pending, _pending[:] = list(_pending), []
+    wait(pending)
@@ -14,6 +14,14 @@ def load_json(path):
         logger.exception(f"Error loading JSON file: {path}")
         exit(1)
         
+def to_jsonable(data):
+    """Plain JSON data from pydantic models, lists of them or data that already is plain"""
+    if hasattr(data, "model_dump"):
+        return data.model_dump(mode="json")
+    if isinstance(data, list):
+        return [to_jsonable(item) for item in data]
+    return data
+
 def safe_get_text(field):
     """Safely extract content from a rich_text field"""
     texts = field.get("rich_text", [])
@@ -32,3 +40,9 @@ def safe_get_date(field):
 def safe_get_multi_select(field):
     """Safely extract names from a multi_select field"""
     return [item.get("name", "") for item in field.get("multi_select", [])]
+
+def iter_pages(notion_data):
+    """Iterate pages from a query response dict or any iterable of pages"""
+    if isinstance(notion_data, dict):
+        return iter(notion_data.get("results", []))
+    return iter(notion_data)
@@ -0,0 +1,157 @@
+import json
+import os
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+import openai
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import src.cv_agent.agent as agent_module
+from src.cv_agent.agent import CVAgent, GenerationCancelled, GenerationTimeout
+
+
+class FakeStreamResponse:
+    status_code = 200
+
+    def __init__(self, lines, gate=None):
+        self.lines = lines
+        self.gate = gate
+        self.closed = False
+
+    def iter_lines(self):
+        for i, line in enumerate(self.lines):
+            if self.gate is not None and i == 1:
+                self.gate.wait(2)
+                if self.closed:
+                    raise agent_module.requests.exceptions.ConnectionError("closed")
+            yield json.dumps(line).encode()
+
+    def close(self):
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def make_agent(monkeypatch, response, **kwargs):
+    monkeypatch.setattr(agent_module.requests, "post", lambda *a, **k: response)
+    return CVAgent(mode="local", model="test", stream=True, **kwargs)
+
+
+def test_streams_tokens_and_records_stats(monkeypatch):
+    response = FakeStreamResponse([
+        {"response": '{"foo"', "done": False},
+        {"response": ": 1}", "done": False},
+        {"response": "", "done": True, "eval_count": 5},
+    ])
+    agent = make_agent(monkeypatch, response)
+    assert agent.ask("prompt", extract_json=False) == '{"foo": 1}'
+    stats = agent.stats[-1]
+    assert stats.streamed and stats.tokens == 5
+    assert stats.time_to_first_token is not None
+
+
+def test_total_deadline(monkeypatch):
+    response = FakeStreamResponse([{"response": "x", "done": False}] * 3)
+    agent = make_agent(monkeypatch, response, total_timeout=-1)
+    with pytest.raises(GenerationTimeout):
+        agent.ask("prompt")
+
+
+def test_cancel_closes_stream(monkeypatch):
+    gate = threading.Event()
+    response = FakeStreamResponse([{"response": "x", "done": False}] * 3, gate=gate)
+    agent = make_agent(monkeypatch, response)
+    errors = []
+
+    def run():
+        try:
+            agent.ask("prompt")
+        except Exception as e:
+            errors.append(e)
+
+    worker = threading.Thread(target=run)
+    worker.start()
+    for _ in range(2000):
+        if agent._active_streams:
+            break
+        time.sleep(0.001)
+    agent.cancel()
+    gate.set()
+    worker.join(2)
+    assert isinstance(errors[0], GenerationCancelled)
+    with pytest.raises(GenerationCancelled):
+        agent.ask("another prompt")
+
+
+def test_error_status_closes_stream(monkeypatch):
+    response = FakeStreamResponse([])
+    response.status_code = 500
+    response.text = "model not found"
+    agent = make_agent(monkeypatch, response)
+    with pytest.raises(RuntimeError, match="model not found"):
+        agent.ask("prompt")
+    assert response.closed
+
+
+class FakeOpenAIStream:
+    """Chat completion chunks; after the first one, waits on ``gate`` and then raises ``error``."""
+
+    def __init__(self, error, gate=None):
+        self.error = error
+        self.gate = gate
+        self.closed = False
+
+    def __iter__(self):
+        yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content="x"))])
+        if self.gate is not None:
+            self.gate.wait(2)
+        raise self.error
+
+    def close(self):
+        self.closed = True
+
+
+def make_openai_agent(monkeypatch, stream):
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    agent = CVAgent(mode="openai", model="test", stream=True)
+    create = lambda **params: stream
+    agent.client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    return agent
+
+
+def test_openai_stall_is_a_timeout(monkeypatch):
+    agent = make_openai_agent(monkeypatch, FakeOpenAIStream(openai.APITimeoutError(request=None)))
+    with pytest.raises(GenerationTimeout):
+        agent.ask("prompt")
+
+
+def test_openai_cancel_closes_stream(monkeypatch):
+    gate = threading.Event()
+    stream = FakeOpenAIStream(openai.APIConnectionError(request=None), gate=gate)
+    agent = make_openai_agent(monkeypatch, stream)
+    errors = []
+
+    def run():
+        try:
+            agent.ask("prompt")
+        except Exception as e:
+            errors.append(e)
+
+    worker = threading.Thread(target=run)
+    worker.start()
+    for _ in range(2000):
+        if agent._active_streams:
+            break
+        time.sleep(0.001)
+    agent.cancel()
+    gate.set()
+    worker.join(2)
+    assert stream.closed
+    assert isinstance(errors[0], GenerationCancelled)
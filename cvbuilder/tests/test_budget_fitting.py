@@ -0,0 +1,56 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.cv_agent.fitting import fit_projects, fit_skills, projects_length, skills_length
+
+
+def project(title, details="First point. Second point. Third point."):
+    return {"title": title, "description": "Short description", "details": details, "duration": "3 months"}
+
+
+PROJECTS = [
+    {"category": "Data", "items": [project("A"), project("B"), project("C")]},
+    {"category": "Web", "items": [project("D"), project("E")]},
+]
+
+
+def test_within_budget_is_untouched():
+    fitted, fits = fit_projects(PROJECTS, 10_000)
+    assert fits and fitted == PROJECTS
+
+
+def test_drops_lowest_ranked_projects_first():
+    budget = projects_length(PROJECTS) - 1
+    fitted, fits = fit_projects(PROJECTS, budget)
+    assert fits
+    assert [i["title"] for c in fitted for i in c["items"]] == ["A", "B", "C", "D"]
+    assert PROJECTS[1]["items"][-1]["title"] == "E"  # input left alone
+
+
+def test_shortens_details_at_sentence_boundaries():
+    three = PROJECTS[:1]
+    fitted, fits = fit_projects(three, projects_length(three) - 1)
+    assert fits
+    assert [i["details"] for i in fitted[0]["items"]] == [
+        "First point. Second point. Third point.",
+        "First point. Second point. Third point.",
+        "First point. Second point.",
+    ]
+
+
+def test_reports_when_trimming_cannot_fit():
+    fitted, fits = fit_projects(PROJECTS, 10)
+    assert not fits
+    assert len(fitted) == 1 and fitted[0]["items"] == [project("A", "First point.")]
+
+
+def test_skills_trim_largest_category_then_categories():
+    skills = [
+        {"category": "Languages", "items": ["Python", "Go", "Rust", "C"]},
+        {"category": "Cloud", "items": ["AWS", "GCP"]},
+    ]
+    fitted, fits = fit_skills(skills, skills_length(skills) - 1)
+    assert fits and fitted[0]["items"] == ["Python", "Go", "Rust"]
+    fitted, fits = fit_skills(skills, 25)
+    assert fits and fitted == [{"category": "Languages", "items": ["Python", "Go"]}]
@@ -0,0 +1,86 @@
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.cv_agent import repair
+from src.cv_agent.repair import repair_json
+from src.cv_agent.validator import ask_and_validate_json
+from src.schemas.latex_data import ProjectsSchema, SkillsSchema
+
+ITEM = '{"title": "CV builder", "description": "Tailored CVs", "duration": "3 months"}'
+CATEGORY = '{"category": "Projects", "items": [%s]}' % ITEM
+
+
+def test_trailing_commas_fences_and_missing_details():
+    text = "```json\n[%s,]\n```" % CATEGORY.replace("]}", ",]}")
+    repaired = json.loads(repair_json(text, ProjectsSchema))
+    assert repaired[0]["items"][0]["details"] == ""
+
+
+def test_unwraps_wrapper_key_and_wraps_bare_object():
+    assert json.loads(repair_json('{"projects": [%s]}' % CATEGORY, ProjectsSchema))[0]["category"] == "Projects"
+    assert len(json.loads(repair_json(CATEGORY, ProjectsSchema))) == 1
+
+
+def test_coerces_fields_and_strips_prose():
+    text = 'Here you go: [{"Category": "Languages", "items": "Python, Go"}, {"category": "Cloud", "items": ["AWS"]}] Hope it helps!'
+    assert json.loads(repair_json(text, SkillsSchema)) == [
+        {"category": "Languages", "items": ["Python", "Go"]},
+        {"category": "Cloud", "items": ["AWS"]},
+    ]
+
+
+def test_truncated_output_is_not_closed():
+    assert repair_json('[{"title": "A", "description": "x', ProjectsSchema) is None
+    assert repair_json('[{"category": "Cloud", "items": ["AWS"', SkillsSchema) is None
+
+
+def test_unrepairable_returns_none():
+    assert repair_json("no json here", SkillsSchema) is None
+
+
+class OneShotAgent:
+    cache = None
+
+    def __init__(self, response):
+        self.prompts = []
+        self.response = response
+
+    def ask(self, prompt, schema=None):
+        self.prompts.append(prompt)
+        return self.response
+
+
+def test_validator_repairs_without_second_model_call(monkeypatch):
+    monkeypatch.setattr(repair, "STATS", repair.RepairStats())
+    agent = OneShotAgent('{"skills": [{"category": "Languages", "items": ["Python"],}]}')
+    result = ask_and_validate_json(agent, "prompt", "Test", schema=SkillsSchema, retries=1)
+    assert result == [{"category": "Languages", "items": ["Python"]}]
+    assert len(agent.prompts) == 1
+    assert repair.STATS.snapshot()["model_calls_saved"] == 1
+
+
+def test_truncated_response_is_retried(monkeypatch):
+    monkeypatch.setattr(repair, "STATS", repair.RepairStats())
+    responses = iter(['[{"category": "Languages", "items": ["Pyth', '[{"category": "Languages", "items": ["Python"]}]'])
+    agent = OneShotAgent(None)
+    agent.ask = lambda prompt, schema=None: (agent.prompts.append(prompt), next(responses))[1]
+    assert ask_and_validate_json(agent, "prompt", "Test", schema=SkillsSchema, retries=1) == [
+        {"category": "Languages", "items": ["Python"]}
+    ]
+    assert len(agent.prompts) == 2
+
+
+def test_repair_without_retry_saves_no_call(monkeypatch):
+    monkeypatch.setattr(repair, "STATS", repair.RepairStats())
+    agent = OneShotAgent('[{"category": "Languages", "items": ["Python"],}]')
+    ask_and_validate_json(agent, "prompt", "Test", schema=SkillsSchema, retries=0)
+    stats = repair.STATS.snapshot()
+    assert (stats["repaired"], stats["model_calls_saved"]) == (1, 0)
+
+
+def test_missing_title_or_category_is_not_filled():
+    untitled = '[{"category": "Projects", "items": [{"description": "x", "duration": "1 mo"}]}]'
+    assert repair_json(untitled, ProjectsSchema) is None
+    assert repair_json('[{"items": ["Python"]}]', SkillsSchema) is None
@@ -0,0 +1,44 @@
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.latex import _escape, escape_latex
+
+# Deliberately generous so slow CI machines pass
+MIN_CALLS_PER_SECOND = 50_000
+
+REFERENCE = {
+    '&': r'\&', '%': r'\%', '$': r'\$', '#': r'\#',
+    '_': r'\_', '{': r'\{', '}': r'\}',
+    '~': r'\textasciitilde{}', '^': r'\textasciicircum{}',
+    '\\': r'\textbackslash{}',
+}
+REFERENCE_RE = re.compile('|'.join(re.escape(k) for k in REFERENCE))
+
+
+def sample_strings(count, seed=0):
+    rng = random.Random(seed)
+    # CV text: mostly plain words with the odd special character
+    alphabet = "abcdefghijklmnopqrstuvwxyz    " * 3 + "&%$#_{}~^\\"
+    return [f"{i}" + "".join(rng.choice(alphabet) for _ in range(40)) for i in range(count)]
+
+
+def test_matches_regex_reference():
+    for s in sample_strings(500):
+        assert escape_latex(s) == REFERENCE_RE.sub(lambda m: REFERENCE[m.group()], s)
+
+
+def test_throughput_floor():
+    strings = sample_strings(20_000, seed=1)
+    _escape.cache_clear()
+    started = time.perf_counter()
+    for s in strings:  # all cache misses
+        escape_latex(s)
+    for s in strings[-4096:]:  # cache hits: the LRU holds the most recent strings
+        escape_latex(s)
+    elapsed = time.perf_counter() - started
+    assert _escape.cache_info().hits == 4096
+    assert (len(strings) + 4096) / elapsed > MIN_CALLS_PER_SECOND
@@ -0,0 +1,82 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import src.latex_fit as latex_fit
+
+TEX = "\\documentclass{article}\n\\begin{document}\nbody\n\\end{document}"
+
+
+def install_fake_layout(monkeypatch, tmp_path, fits_from):
+    """Variants at ``fits_from`` or tighter fit; records the levels compiled."""
+    monkeypatch.setattr(latex_fit, "FIT_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(latex_fit, "ensure_format", lambda: None)
+    tried = []
+
+    def fake_measure(tex_str, fmt=None, keep_fit=False):
+        level = next((lvl for lvl in range(latex_fit.MAX_LEVEL, 0, -1) if tex_str == latex_fit.apply_layout(TEX, lvl)), 0)
+        tried.append(level)
+        return {"pages": 1, "scaled": level < fits_from}
+
+    monkeypatch.setattr(latex_fit, "measure_layout", fake_measure)
+    return tried
+
+
+def test_finds_least_aggressive_fitting_level(monkeypatch, tmp_path):
+    for fits_from in range(latex_fit.MAX_LEVEL + 1):
+        install_fake_layout(monkeypatch, tmp_path, fits_from)
+        assert latex_fit.search_level(TEX, workers=3) == fits_from
+
+
+def test_search_is_sublinear(monkeypatch, tmp_path):
+    tried = install_fake_layout(monkeypatch, tmp_path, 5)
+    latex_fit.search_level(TEX, workers=1)
+    assert len(tried) <= 5
+
+
+def test_layout_goes_after_begin_document():
+    tex = latex_fit.apply_layout(TEX, 4)
+    assert tex.index("\\newgeometry") > tex.index("\\begin{document}")
+    assert "\\linespread{0.95}" in tex
+    assert latex_fit.apply_layout(TEX, 0) == TEX
+
+
+def test_level_is_cached_per_content(monkeypatch, tmp_path):
+    tried = install_fake_layout(monkeypatch, tmp_path, 3)
+    assert latex_fit.fit_one_page(TEX) == latex_fit.apply_layout(TEX, 3)
+    tried.clear()
+    assert latex_fit.fit_one_page(TEX) == latex_fit.apply_layout(TEX, 3)
+    assert tried == []
+    latex_fit.fit_one_page(TEX, force=True)
+    assert tried
+
+
+def test_variant_that_does_not_compile_aborts_search(monkeypatch, tmp_path):
+    install_fake_layout(monkeypatch, tmp_path, 5)
+    measure = latex_fit.measure_layout
+    monkeypatch.setattr(latex_fit, "measure_layout", lambda tex_str, fmt=None, keep_fit=False: None if "\\newgeometry" in tex_str else measure(tex_str, fmt))
+    assert latex_fit.search_level(TEX, workers=2) is None
+
+
+class FakePool:
+    """Stands in for CompilePool: records the probes sent to its workers."""
+
+    workers = 2
+
+    def __init__(self, fits_from):
+        self.fits_from = fits_from
+        self.probes = []
+
+    def measure_file(self, tex_path, level):
+        self.probes.append(level)
+        return {"pages": 1, "scaled": level < self.fits_from}
+
+
+def test_fit_file_probes_on_compile_pool(monkeypatch, tmp_path):
+    monkeypatch.setattr(latex_fit, "FIT_CACHE_DIR", str(tmp_path / "fit"))
+    monkeypatch.setattr(latex_fit, "measure_layout", lambda *a: (_ for _ in ()).throw(AssertionError("compiled in-process")))
+    tex_path = tmp_path / "main.tex"
+    tex_path.write_text(TEX, encoding="utf-8")
+    pool = FakePool(fits_from=3)
+    assert latex_fit.fit_file(str(tex_path), compiler=pool) == 3
+    assert pool.probes and tex_path.read_text(encoding="utf-8") == latex_fit.apply_layout(TEX, 3)
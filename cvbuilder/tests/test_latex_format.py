@@ -0,0 +1,95 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import src.latex as latex
+import src.latex_format as latex_format
+
+
+def test_format_name_follows_header_contents(tmp_path):
+    header = tmp_path / "header.tex"
+    header.write_text("\\documentclass{article}")
+    first = latex_format.format_name(str(header))
+    header.write_text("\\documentclass{article}\\usepackage{hyperref}")
+    assert latex_format.format_name(str(header)) != first
+
+
+def test_ensure_format_builds_once_and_rebuilds_on_change(tmp_path, monkeypatch):
+    header = tmp_path / "header.tex"
+    header.write_text("v1")
+    monkeypatch.setattr(latex_format, "FORMAT_DIR", str(tmp_path / "fmt"))
+    builds = []
+
+    def fake_run(cmd, cwd, **kwargs):
+        builds.append(cmd)
+        jobname = next(a for a in cmd if a.startswith("-jobname=")).split("=", 1)[1]
+        open(os.path.join(latex_format.FORMAT_DIR, f"{jobname}.fmt"), "w").close()
+
+    monkeypatch.setattr(latex_format.subprocess, "run", fake_run)
+    name = latex_format.ensure_format(str(header))
+    assert latex_format.ensure_format(str(header)) == name
+    assert len(builds) == 1 and "mylatexformat.ltx" in builds[0]
+
+    header.write_text("v2")
+    assert latex_format.ensure_format(str(header)) != name
+    assert len(builds) == 2
+    assert len(os.listdir(latex_format.FORMAT_DIR)) == 1
+
+
+def fake_pdflatex(warm_log):
+    """Stand-in pdflatex: warm runs fail writing ``warm_log``, cold runs succeed."""
+    calls = []
+
+    def run(cmd, cwd, **kwargs):
+        calls.append(cmd)
+        jobname = next(a for a in cmd if a.startswith("-jobname=")).split("=", 1)[1]
+        warm = any(a.startswith("-fmt=") for a in cmd)
+        if warm and warm_log is None:
+            return subprocess.CompletedProcess(cmd, 1)  # died before writing a log
+        with open(os.path.join(cwd, f"{jobname}.log"), "w", encoding="utf-8") as f:
+            f.write(warm_log if warm else "Output written on main.pdf (1 page).")
+        if not warm:
+            open(os.path.join(cwd, f"{jobname}.pdf"), "w").close()
+        return subprocess.CompletedProcess(cmd, 1 if warm else 0)
+
+    return run, calls
+
+
+@pytest.fixture
+def warm_compile(monkeypatch, tmp_path):
+    monkeypatch.setattr(latex.latex_cache, "BUILD_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(latex, "ensure_format", lambda: "cvheader-test")
+    monkeypatch.setattr(latex, "needs_baseline", lambda: False)
+
+    def compile_with(warm_log):
+        run, calls = fake_pdflatex(warm_log)
+        monkeypatch.setattr(latex.subprocess, "run", run)
+        return latex.compile_tex("doc", str(tmp_path / "main.pdf"), record=False), calls
+
+    return compile_with
+
+
+@pytest.mark.parametrize("warm_log", [None, "---! cvheader-test.fmt was written by pdftex-other\n"])
+def test_format_failure_falls_back_cold(warm_compile, warm_log):
+    result, calls = warm_compile(warm_log)
+    assert result.ok and not result.warm
+    assert "-fmt=cvheader-test" in calls[0]
+    assert not any(a.startswith("-fmt=") for a in calls[1])
+
+
+def test_document_errors_are_not_retried_cold(warm_compile):
+    result, calls = warm_compile("! Undefined control sequence.\n\\foo\n")
+    assert not result.ok and result.returncode == 1
+    assert len(calls) == 1
+
+
+def test_format_errors_in_the_log_are_retried_cold(tmp_path):
+    log = tmp_path / "main.log"
+    log.write_text("---! cvheader-test.fmt was written by pdftex-other\n")
+    assert latex._format_failed(str(log))
+    log.write_text("! LaTeX Error: Environment itemise undefined.\n")
+    assert not latex._format_failed(str(log))
+    assert latex._format_failed(str(tmp_path / "missing.log"))
@@ -0,0 +1,88 @@
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import src.latex as latex
+
+
+@pytest.fixture(autouse=True)
+def build_cache(monkeypatch, tmp_path):
+    monkeypatch.setattr(latex.latex_cache, "BUILD_CACHE_DIR", str(tmp_path / "cache"))
+
+
+def fake_run(cmd, cwd, **kwargs):
+    """Stand-in pdflatex: writes <jobname>.pdf/.log holding the source."""
+    jobname = next(a for a in cmd if a.startswith("-jobname=")).split("=", 1)[1]
+    with open(os.path.join(cwd, f"{jobname}.tex"), encoding="utf-8") as f:
+        source = f.read()
+    for ext in ("pdf", "log", "aux"):
+        with open(os.path.join(cwd, f"{jobname}.{ext}"), "w", encoding="utf-8") as f:
+            f.write(source)
+    failed = "FAIL" in source
+    return type("Completed", (), {"returncode": 1 if failed else 0})()
+
+
+def test_concurrent_builds_do_not_share_files(monkeypatch, tmp_path):
+    monkeypatch.setattr(latex.subprocess, "run", fake_run)
+    outputs = [str(tmp_path / f"job{i}" / "main.pdf") for i in range(8)]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda i: latex.compile_tex(f"doc {i}", outputs[i], warm=False), range(8)))
+
+    for i, result in enumerate(results):
+        assert result.ok and result.returncode == 0
+        with open(outputs[i], encoding="utf-8") as f:
+            assert f.read() == f"doc {i}"
+        assert os.path.exists(result.log_path)
+        # build artefacts stay in the temporary build directory
+        assert not os.path.exists(tmp_path / f"job{i}" / "main.aux")
+
+
+def test_failed_build_reports_exit_status_and_log(monkeypatch, tmp_path):
+    monkeypatch.setattr(latex.subprocess, "run", fake_run)
+    result = latex.compile_tex("FAIL", str(tmp_path / "cv.pdf"), warm=False)
+    assert not result.ok and result.returncode == 1
+    assert result.pdf_path is None and result.log_path.endswith("cv.log")
+
+
+def test_unchanged_source_reuses_cached_pdf(monkeypatch, tmp_path):
+    runs = []
+
+    def counting_run(cmd, cwd, **kwargs):
+        runs.append(cmd)
+        return fake_run(cmd, cwd, **kwargs)
+
+    monkeypatch.setattr(latex.subprocess, "run", counting_run)
+    first = latex.compile_tex("same source", str(tmp_path / "a" / "main.pdf"), warm=False)
+    second = latex.compile_tex("same source", str(tmp_path / "b" / "main.pdf"), warm=False)
+    assert not first.cached and second.cached and second.ok
+    assert len(runs) == 1
+    with open(second.pdf_path, encoding="utf-8") as f:
+        assert f.read() == "same source"
+
+    forced = latex.compile_tex("same source", str(tmp_path / "b" / "main.pdf"), warm=False, force=True)
+    assert not forced.cached and len(runs) == 2
+    latex.compile_tex("changed source", str(tmp_path / "b" / "main.pdf"), warm=False)
+    assert len(runs) == 3
+
+
+def test_fitting_probe_build_is_reused(monkeypatch, tmp_path):
+    runs = []
+
+    def counting_run(cmd, cwd, **kwargs):
+        runs.append(cmd)
+        return fake_run(cmd, cwd, **kwargs)
+
+    monkeypatch.setattr(latex.subprocess, "run", counting_run)
+    # fake_run copies the source into the log, so the source says how it laid out
+    fits = "doc\nOutput written on probe.pdf (1 page, 100 bytes)."
+    overflows = "doc\nOutput written on probe.pdf (2 pages, 100 bytes)."
+    assert latex.measure_layout(fits, keep_fit=True) == {"pages": 1, "scaled": False}
+    assert latex.measure_layout(overflows, keep_fit=True)["pages"] == 2
+    assert len(runs) == 2
+
+    assert latex.compile_tex(fits, str(tmp_path / "main.pdf"), warm=False).cached
+    assert len(runs) == 2
+    assert not latex.compile_tex(overflows, str(tmp_path / "main.pdf"), warm=False).cached
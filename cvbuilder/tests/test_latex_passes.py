@@ -0,0 +1,45 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import src.latex as latex
+
+
+def make_pass(tmp_path, outputs):
+    """run_once writing the next (aux, log) pair of ``outputs``."""
+    runs = []
+
+    def run_once():
+        aux, log = outputs[min(len(runs), len(outputs) - 1)]
+        runs.append(1)
+        (tmp_path / "main.aux").write_text(aux)
+        (tmp_path / "main.log").write_text(log)
+        return 0
+
+    return run_once, runs
+
+
+def run(tmp_path, outputs):
+    run_once, runs = make_pass(tmp_path, outputs)
+    code, times = latex._run_passes(run_once, str(tmp_path / "main.aux"), str(tmp_path / "main.log"))
+    assert code == 0 and len(times) == len(runs)
+    return len(runs)
+
+
+def test_single_pass_when_log_is_clean(tmp_path):
+    assert run(tmp_path, [("\\relax", "Output written on main.pdf")]) == 1
+
+
+def test_reruns_until_aux_is_stable(tmp_path):
+    outputs = [
+        ("\\newlabel{a}{{1}}", "LaTeX Warning: Label(s) may have changed. Rerun to get cross-references right."),
+        ("\\newlabel{a}{{2}}", "Package rerunfilecheck Warning: File `main.out' has changed. (rerunfilecheck) Rerun"),
+        ("\\newlabel{a}{{2}}", "Package rerunfilecheck Warning: (rerunfilecheck) Rerun"),
+    ]
+    # the third pass leaves the .aux unchanged, so the stale marker is ignored
+    assert run(tmp_path, outputs) == 3
+
+
+def test_pass_limit(tmp_path):
+    outputs = [(f"\\relax{i}", "Rerun to get outlines right") for i in range(10)]
+    assert run(tmp_path, outputs) == latex.MAX_PASSES
@@ -0,0 +1,126 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from notion.async_client import AsyncNotionClient
+from notion.client import NotionClient
+
+
+class SlowClient(NotionClient):
+    """Serves two result pages per database and tracks concurrent requests."""
+
+    def __init__(self):
+        super().__init__(headers={}, session=object())
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+
+    def query_page(self, database_id, body):
+        with self.lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(0.05)
+        with self.lock:
+            self.in_flight -= 1
+        if "start_cursor" not in body:
+            return {"results": [{"id": f"{database_id}-1"}], "has_more": True, "next_cursor": "next"}
+        return {"results": [{"id": f"{database_id}-2"}], "has_more": False, "next_cursor": None}
+
+
+def test_fetches_databases_concurrently_within_limit(tmp_path, monkeypatch):
+    import notion.client as notion_client
+
+    monkeypatch.setattr(notion_client, "SNAPSHOT_DIR", str(tmp_path))
+    sync_client = SlowClient()
+
+    async def main():
+        client = AsyncNotionClient(sync_client, max_concurrency=2)
+
+        async def collect(db):
+            data = await client.fetch_database(db, incremental=False)
+            return await asyncio.to_thread(lambda: [p["id"] for p in data["results"]])
+
+        return await asyncio.gather(*(collect(db) for db in ("a", "b", "c")))
+
+    results = asyncio.run(main())
+    assert results == [["a-1", "a-2"], ["b-1", "b-2"], ["c-1", "c-2"]]
+    assert sync_client.peak == 2
+
+
+class StuckClient(NotionClient):
+    """Never answers the first query until released."""
+
+    def __init__(self):
+        super().__init__(headers={}, session=object())
+        self.release = threading.Event()
+
+    def query_page(self, database_id, body):
+        self.release.wait(5)
+        return {"results": [], "has_more": False, "next_cursor": None}
+
+
+def test_cancelled_pump_releases_waiting_consumer(tmp_path, monkeypatch):
+    import notion.client as notion_client
+
+    monkeypatch.setattr(notion_client, "SNAPSHOT_DIR", str(tmp_path))
+    sync_client = StuckClient()
+    outcome = []
+
+    async def main():
+        client = AsyncNotionClient(sync_client)
+        data = await client.fetch_database("a", incremental=False)
+
+        def consume():
+            try:
+                list(data["results"])
+            except asyncio.CancelledError as e:
+                outcome.append(e)
+
+        # A daemon thread, so a consumer that never wakes up fails the test instead of hanging it
+        consumer = threading.Thread(target=consume, daemon=True)
+        consumer.start()
+        await asyncio.sleep(0.1)  # the consumer is now blocked on the buffer
+        (pump,) = client._pumps
+        pump.cancel()
+        await asyncio.to_thread(consumer.join, 2)
+        sync_client.release.set()
+        return consumer.is_alive()
+
+    assert asyncio.run(main()) is False
+    assert len(outcome) == 1
+
+
+def test_sync_all_does_not_starve_a_small_default_executor(tmp_path, monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+
+    import notion.client as notion_client
+    import notion.notion as notion_module
+
+    monkeypatch.setattr(notion_client, "SNAPSHOT_DIR", str(tmp_path))
+    monkeypatch.setenv("SNAPSHOT_PERSIST", "0")
+    for name in ("PROJECT", "PERSONAL_INFO", "EXPERIENCE", "CERTIFICATES", "EDUCATION"):
+        monkeypatch.setenv(f"NOTION_{name}_ID", name.lower())
+
+    def query_page(self, database_id, body):
+        page = int(body.get("start_cursor") or 0)
+        more = page < 3
+        return {"results": [{"id": f"{database_id}-{page}"}], "has_more": more, "next_cursor": str(page + 1) if more else None}
+
+    monkeypatch.setattr(NotionClient, "query_page", query_page)
+    synced = []
+    monkeypatch.setattr(notion_module, "generate_skills_from_projects", synced.append)
+
+    async def main():
+        # Fewer default-executor threads than databases used to deadlock the sync
+        asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=2))
+        await notion_module.Notion().sync_all_async(incremental=False)
+
+    worker = threading.Thread(target=lambda: asyncio.run(main()), daemon=True)
+    worker.start()
+    worker.join(10)
+    assert not worker.is_alive()
+    assert len(synced) == 1 and len(synced[0]) == 4
+
@@ -0,0 +1,67 @@
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.notion.projects import _compute_duration, extract_project_data
+from src.schemas.notion import Project
+
+# Deliberately generous so slow CI machines pass
+MIN_ROWS_PER_SECOND = 20_000
+
+
+def sample_response(count):
+    def page(i):
+        return {
+            "url": f"https://www.notion.so/{i}",
+            "properties": {
+                "Project name": {"title": [{"text": {"content": f"Project {i}"}}]},
+                "Status": {"select": {"name": "Done"}},
+                "Category": {"select": {"name": ["AI", "Web", "Tools"][i % 3]}},
+                "Tech Stack": {"multi_select": [{"name": "Python"}, {"name": "Go"}]},
+                "Description": {"rich_text": [{"text": {"content": f"Description {i}"}}]},
+                "Detailed Notes": {"rich_text": [{"text": {"content": "Notes " * 20}}]},
+                "Start Date": {"date": {"start": "2023-01-01"}},
+                "End Date": {"date": {"start": "2023-04-01"}} if i % 2 else {"date": None},
+                "Role": {"select": {"name": "Dev"}},
+                "Tags": {"multi_select": [{"name": "ml"}]} if i % 5 else {"multi_select": []},
+            },
+        }
+
+    return {"results": [page(i) for i in range(count)]}
+
+
+def reference(notion_data):
+    # The hand-written .get() chains the declarative specs replaced
+    projects = []
+    for item in notion_data["results"]:
+        props = item.get("properties", {})
+        start_date = props.get("Start Date", {}).get("date", {}).get("start")
+        end_prop = props.get("End Date")
+        end_date = end_prop["date"]["start"] if end_prop and end_prop.get("date") else None
+        projects.append(Project(
+            name=props.get("Project name", {}).get("title", [{}])[0].get("text", {}).get("content", "Untitled Project"),
+            status=props.get("Status", {}).get("select", {}).get("name", "No Status"),
+            category=props.get("Category", {}).get("select", {}).get("name", "No Category"),
+            tech_stack=[t["name"] for t in props.get("Tech Stack", {}).get("multi_select", [])],
+            description=props.get("Description", {}).get("rich_text", [{}])[0].get("text", {}).get("content", "No Description"),
+            notes=props.get("Detailed Notes", {}).get("rich_text", [{}])[0].get("text", {}).get("content", "No Notes"),
+            duration=_compute_duration(start_date, end_date),
+            role=props.get("Role", {}).get("select", {}).get("name", "No Role"),
+            tags=[t["name"] for t in props.get("Tags", {}).get("multi_select", [])],
+        ))
+    return projects
+
+
+def test_matches_hand_written_reference():
+    data = sample_response(300)
+    assert [p.model_dump() for p in extract_project_data(data)] == [p.model_dump() for p in reference(data)]
+
+
+def test_throughput_floor():
+    data = sample_response(10_000)
+    started = time.perf_counter()
+    projects = extract_project_data(data)
+    elapsed = time.perf_counter() - started
+    assert len(projects) == 10_000
+    assert len(projects) / elapsed > MIN_ROWS_PER_SECOND
@@ -0,0 +1,77 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from notion.certificates import CertificatesClient
+from notion.education import EXTRACTOR as EDUCATION, EducationClient
+from notion.fields import Extractor, Field
+from notion.personal import PersonalInfoClient
+from src.notion.projects import extract_project_data
+from src.schemas.notion import Experience
+
+EDUCATION_PAGE = {
+    "url": "https://www.notion.so/edu-1",
+    "properties": {
+        "Level": {"title": [{"text": {"content": "MSc"}}]},
+        "University": {"rich_text": [{"text": {"content": "UPC"}}]},
+        "Field of study": {"rich_text": [{"text": {"content": "AI"}}]},
+        "Specialization": {"rich_text": []},
+        "Start Date Aprox": {"date": {"start": "2020-09-01"}},
+        "End Date Aprox": {"date": None},
+        "Duration (years)": {"formula": {"number": 2}},
+    },
+}
+
+
+def client(cls):
+    # extract() needs no credentials or database
+    return cls.__new__(cls)
+
+
+def test_trusted_and_validated_extraction_agree():
+    validated = EDUCATION.extract([EDUCATION_PAGE])
+    trusted = EDUCATION.extract([EDUCATION_PAGE], trusted=True)
+    assert [m.model_dump() for m in validated] == [m.model_dump() for m in trusted]
+    assert client(EducationClient).extract({"results": [EDUCATION_PAGE]}) == validated
+    assert validated[0].summary == "MSc in AI – UPC (2020-09-01 – Present) [2 years]"
+    assert str(validated[0].url) == "https://www.notion.so/edu-1"
+
+
+def test_missing_and_null_properties_fall_back_to_defaults():
+    pages = [
+        {},
+        {"properties": None},
+        {"properties": {"Name": None, "Skills": {"multi_select": None}, "Url": {"url": None}}},
+    ]
+    certificates = client(CertificatesClient).extract(pages)
+    for certificate in certificates:
+        assert certificate.name == ""
+        assert certificate.skills == []
+        assert certificate.url is None
+        assert certificate.summary == ""
+    # Every row gets its own list
+    certificates[0].skills.append("x")
+    assert certificates[1].skills == []
+
+
+def test_project_defaults_and_duration():
+    projects = extract_project_data({"results": [{"properties": {"Start Date": {"date": {"start": "2023-01-01"}},
+                                                                  "End Date": {"date": {"start": "2024-01-01"}}}}]})
+    project = projects[0]
+    assert (project.name, project.status, project.duration) == ("Untitled Project", "No Status", "1 yr")
+
+
+def test_personal_info_skips_rows_without_key():
+    pages = [
+        {"properties": {"Name": {"title": [{"text": {"content": "email"}}]}, "Value": {"rich_text": []}}},
+        {"properties": {"Value": {"rich_text": [{"text": {"content": "orphan"}}]}}},
+    ]
+    info = client(PersonalInfoClient).extract(pages)
+    assert [(i.key, i.value) for i in info] == [("email", "")]
+
+
+def test_unknown_kind_is_rejected():
+    with pytest.raises(ValueError, match="relation"):
+        Extractor(Experience, {"role": Field("Headline", "relation")})
@@ -0,0 +1,46 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import notion.client as notion_client
+from notion.client import NotionClient
+
+
+def page(page_id, edited, name):
+    return {"id": page_id, "last_edited_time": edited, "properties": {"Name": name}}
+
+
+class FakeClient(NotionClient):
+    def __init__(self, responses):
+        super().__init__(headers={})
+        self.responses = responses
+        self.payloads = []
+
+    def iter_database(self, database_id, payload=None, page_size=None):
+        self.payloads.append(payload)
+        yield from self.responses.pop(0)
+
+
+def test_incremental_fetch_merges_changed_pages(tmp_path, monkeypatch):
+    monkeypatch.setattr(notion_client, "SNAPSHOT_DIR", str(tmp_path))
+    client = FakeClient([
+        [page("a", "2024-01-01T10:00:00.000Z", "A"), page("b", "2024-01-02T10:00:00.000Z", "B")],
+        [page("b", "2024-01-03T09:00:00.000Z", "B2"), page("c", "2024-01-03T10:00:00.000Z", "C")],
+        [page("c", "2024-01-03T10:00:00.000Z", "C")],
+    ])
+
+    first = client.fetch_database("db", incremental=True)
+    assert first["changed"] == 2
+    assert client.payloads[0] == {}
+
+    second = client.fetch_database("db", incremental=True)
+    assert client.payloads[1]["filter"]["last_edited_time"] == {"on_or_after": "2024-01-02T10:00:00.000Z"}
+    assert second["changed"] == 2
+    assert [p["properties"]["Name"] for p in second["results"]] == ["A", "B2", "C"]
+
+    third = client.fetch_database("db", incremental=True)
+    assert third["changed"] == 0
+    assert len(third["results"]) == 3
+    assert client.unchanged(third)
+    assert not client.unchanged(second)
+
@@ -0,0 +1,34 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from notion.client import NotionClient
+
+
+class FakeResponse:
+    status_code = 200
+
+    def __init__(self, body):
+        self.body = body
+
+    def json(self):
+        return self.body
+
+
+def test_iter_database_follows_cursors():
+    bodies = []
+    pages = [
+        {"results": [{"id": "1"}, {"id": "2"}], "has_more": True, "next_cursor": "c1"},
+        {"results": [{"id": "3"}], "has_more": False, "next_cursor": None},
+    ]
+
+    class FakeSession:
+        def request(self, method, url, headers=None, json=None, **kwargs):
+            bodies.append(dict(json))
+            return FakeResponse(pages.pop(0))
+
+    client = NotionClient(headers={}, session=FakeSession())
+    stream = client.iter_database("db", page_size=2)
+    assert bodies == []  # nothing is fetched until the stream is consumed
+    assert [p["id"] for p in stream] == ["1", "2", "3"]
+    assert bodies == [{"page_size": 2}, {"page_size": 2, "start_cursor": "c1"}]
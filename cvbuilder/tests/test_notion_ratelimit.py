@@ -0,0 +1,54 @@
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from notion.ratelimit import TokenBucket, send_paced
+
+
+class FakeResponse:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class FakeSession:
+    def __init__(self, responses):
+        self.responses = responses
+        self.calls = 0
+
+    def request(self, method, url, **kwargs):
+        self.calls += 1
+        return self.responses.pop(0)
+
+
+def test_bucket_paces_after_burst():
+    bucket = TokenBucket(rate=50, capacity=2)
+    started = time.monotonic()
+    for _ in range(6):
+        bucket.acquire()
+    elapsed = time.monotonic() - started
+    # two burst tokens, then four more at 50/s
+    assert elapsed >= 0.07
+    assert bucket.stats.snapshot()["paced_seconds"] > 0
+
+
+def test_retry_after_is_honoured_for_all_callers():
+    bucket = TokenBucket(rate=1000, capacity=1)
+    session = FakeSession([FakeResponse(429, {"Retry-After": "0.1"}), FakeResponse(200)])
+    started = time.monotonic()
+    response = send_paced(session, bucket, "POST", "https://example.invalid")
+    assert response.status_code == 200
+    assert session.calls == 2
+    assert time.monotonic() - started >= 0.1
+    stats = bucket.stats.snapshot()
+    assert stats["rate_limited"] == 1
+    assert stats["retry_after_seconds"] == 0.1
+
+
+def test_server_errors_retry_until_exhausted():
+    bucket = TokenBucket(rate=1000, capacity=10)
+    session = FakeSession([FakeResponse(502), FakeResponse(503)])
+    response = send_paced(session, bucket, "POST", "https://example.invalid", max_retries=1)
+    assert response.status_code == 503
+    assert bucket.stats.snapshot()["server_errors"] == 1
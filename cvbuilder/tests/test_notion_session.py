@@ -0,0 +1,44 @@
+import json
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from notion.session import STATS, build_session
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        body = json.dumps({"results": []}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_session_reuses_keep_alive_connections():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        session = build_session(pool_size=2, timeout=(2, 2), retries=0)
+        before = STATS.snapshot()
+        url = f"http://127.0.0.1:{server.server_address[1]}/v1/databases/db/query"
+        for _ in range(3):
+            assert session.post(url, json={}).json() == {"results": []}
+        after = STATS.snapshot()
+        session.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert after["opened"] - before["opened"] == 1
+    assert after["reused"] - before["reused"] == 2
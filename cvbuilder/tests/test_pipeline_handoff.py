@@ -0,0 +1,66 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import notion.client as notion_client
+import src.store as store_module
+from notion.certificates import CertificatesClient
+from notion.education import EducationClient
+from notion.experience import ExperienceClient
+from notion.personal import PersonalInfoClient
+from src.pipeline import default_stages
+from src.pipeline import projects as project_pipeline
+from src.pipeline import skills as skills_pipeline
+from src.pipeline.scheduler import run_stages
+from src.schemas.notion import PersonalInfo, Project, Skills
+
+
+class EchoSelector:
+    def select_projects(self, projects):
+        return [{"category": "All", "items": [{"title": p.name} for p in projects]}]
+
+    def select_skills(self, skills):
+        assert isinstance(skills, Skills)
+        return [{"category": "Tools", "items": skills.tools}]
+
+
+def test_stages_hand_models_over_in_memory(monkeypatch):
+    def no_store(*args, **kwargs):
+        raise AssertionError("the hot path must not read the snapshot store")
+
+    monkeypatch.setenv("SNAPSHOT_PERSIST", "0")
+    monkeypatch.setattr(store_module, "_store", None)
+    monkeypatch.setattr(store_module, "SnapshotStore", no_store)
+    projects = [
+        Project(name="CV", tech_stack=["Python"], tags=["cli"]),
+        Project(name="Site", tech_stack=["Go"], tags=[]),
+    ]
+    monkeypatch.setattr(project_pipeline.notion_projects, "run", lambda: projects)
+    for pipeline in (project_pipeline, skills_pipeline):
+        monkeypatch.setattr(pipeline, "get_selector", lambda mode, model: EchoSelector())
+    monkeypatch.setattr(PersonalInfoClient, "sync", lambda self: [PersonalInfo(key="Name", value="Ann")])
+    # Experience goes through NotionClient.store with an incremental fetch that found no changes
+    unchanged_fetch = {
+        "results": [{
+            "url": "https://example.com/a_b",
+            "properties": {"Headline": {"title": [{"text": {"content": "Dev"}}]}},
+        }],
+        "changed": 0,
+        "incremental": True,
+    }
+    monkeypatch.setattr(ExperienceClient, "fetch", lambda self, incremental=None: unchanged_fetch)
+    persisted = []
+    monkeypatch.setattr(notion_client, "persist", lambda namespace, section, data: persisted.append(section))
+    monkeypatch.setattr(EducationClient, "sync", lambda self: [])
+    monkeypatch.setattr(CertificatesClient, "sync", lambda self: [])
+
+    results = run_stages(default_stages())
+
+    assert results["personal"] == {"name": "Ann"}
+    assert results["projects"] == [{"category": "All", "items": [{"title": "CV"}, {"title": "Site"}]}]
+    assert results["skills"] == [{"category": "Tools", "items": ["Go", "Python"]}]
+    # Rendered sections are plain data, so the templates escape URLs as strings
+    assert results["experience"][0]["url"] == "https://example.com/a_b"
+    assert results["experience"][0]["role"] == "Dev"
+    # Handed to the writer thread, which skips it if the stored payload is identical
+    assert persisted == ["experience"]
@@ -24,3 +24,17 @@ def test_extract_project_duration():
     assert projects[0].duration == "3 mo"
     dump = projects[0].model_dump()
     assert "start_date" not in dump and "end_date" not in dump
+
+
+def test_run_goes_through_the_projects_client(monkeypatch):
+    from src.notion import projects as notion_projects
+
+    notion_data = {"results": [{"properties": {"Start Date": {"date": {"start": "2023-01-01"}},
+                                               "End Date": {"date": {"start": "2023-03-01"}}}}]}
+    monkeypatch.setenv("SNAPSHOT_PERSIST", "0")
+    monkeypatch.setattr(notion_projects.ProjectsWithDuration, "fetch", lambda self, incremental=None: notion_data)
+    monkeypatch.setattr(notion_projects.ProjectsWithDuration, "load_saved", lambda self: ["saved"])
+    assert notion_projects.run()[0].duration == "2 mo"
+
+    monkeypatch.setattr(notion_projects.ProjectsWithDuration, "fetch", lambda self, incremental=None: None)
+    assert notion_projects.run() == ["saved"]
@@ -0,0 +1,50 @@
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.cv_agent.compact import estimate_tokens, fit_prompt, serialize_data, serialize_records
+
+PROJECT = {
+    "name": "Churn model",
+    "status": "Done",
+    "category": "No Category",
+    "tech_stack": ["Python", "PyTorch"],
+    "description": "Deep learning churn prediction",
+    "notes": "No Notes",
+    "role": "",
+    "tags": [],
+}
+
+
+def test_drops_status_empty_and_placeholder_fields():
+    line = serialize_records([PROJECT])
+    assert json.loads(line) == {
+        "name": "Churn model",
+        "tech_stack": ["Python", "PyTorch"],
+        "description": "Deep learning churn prediction",
+    }
+    assert " " not in line.replace("Churn model", "").replace("Deep learning churn prediction", "")
+
+
+def test_one_record_per_line():
+    text = serialize_records([PROJECT, dict(PROJECT, name="Other")])
+    assert [json.loads(line)["name"] for line in text.splitlines()] == ["Churn model", "Other"]
+
+
+def test_truncates_notes_to_fit_budget():
+    records = [dict(PROJECT, name=f"P{i}", notes="x" * 2000) for i in range(5)]
+    text = serialize_records(records, budget=500)
+    assert estimate_tokens(text) <= 500
+    assert all(json.loads(line)["notes"].endswith("…") for line in text.splitlines())
+
+
+def test_fit_prompt_reports_savings():
+    template = "Job: python\n\n## Projects:\n{}".format
+    prompt, before, after = fit_prompt(template, [PROJECT] * 3, budget=None)
+    assert prompt.startswith("Job: python")
+    assert after < before
+
+
+def test_skills_dict_is_compact_json():
+    assert serialize_data({"tools": ["Go"], "tags": []}) == '{"tools":["Go"]}'
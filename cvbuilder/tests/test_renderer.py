@@ -0,0 +1,43 @@
+import os
+import shutil
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import src.latex as latex
+from src.latex import ResumeRenderer
+
+CONTACT = {"name": "Ann", "phone": "1", "email": "a@x.com", "linkedin": "https://linkedin.com/in/a"}
+SKILLS = [{"category": "Tools & Co", "items": ["Go"]}]
+
+
+def render(renderer):
+    return renderer.render(CONTACT, SKILLS, [], [], [])
+
+
+def copy_templates(tmp_path):
+    target = tmp_path / "templates"
+    shutil.copytree(latex.TEMPLATE_DIR, target, ignore=shutil.ignore_patterns("main.tex"))
+    return target
+
+
+def test_document_is_header_contact_sections_footer(tmp_path):
+    tex = render(ResumeRenderer(str(copy_templates(tmp_path))))
+    assert tex.startswith("\\documentclass")
+    assert "\\namesection{Ann}" in tex and "Tools \\& Co" in tex
+    assert tex.endswith("\\end{document}")
+
+
+def test_reloads_changed_templates(tmp_path):
+    templates = copy_templates(tmp_path)
+    renderer = ResumeRenderer(str(templates), check_interval=0)
+    render(renderer)
+    (templates / "footer.tex").write_text("% new footer\n\\end{document}")
+    assert render(renderer).endswith("% new footer\n\\end{document}")
+
+
+def test_precompiled_templates_render_the_same(tmp_path, monkeypatch):
+    templates = copy_templates(tmp_path)
+    monkeypatch.setattr(latex, "COMPILED_TEMPLATE_DIR", str(tmp_path / "compiled"))
+    precompiled = ResumeRenderer(str(templates), precompile=True)
+    assert os.listdir(tmp_path / "compiled")
+    assert render(precompiled) == render(ResumeRenderer(str(templates)))
@@ -0,0 +1,54 @@
+import os
+import sys
+import time
+
+from pydantic import BaseModel
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.cv_agent.agent import CVAgent
+from src.cv_agent.cache import ResponseCache
+from src.cv_agent.validator import ask_and_validate_json
+
+
+class DummySchema(BaseModel):
+    foo: int
+
+
+class CountingAgent(CVAgent):
+    def __init__(self, cache, responses):
+        super().__init__(mode="local", model="test", cache=cache)
+        self.responses = responses
+        self.calls = 0
+
+    def _ask_ollama(self, prompt, schema=None):
+        self.calls += 1
+        return self.responses.pop(0)
+
+
+def test_validated_response_is_cached(tmp_path):
+    cache = ResponseCache(directory=str(tmp_path))
+    agent = CountingAgent(cache, ['{"foo": "bar"}', '{"foo": 1}'])
+    assert ask_and_validate_json(agent, "prompt", "Test", schema=DummySchema) == {"foo": 1}
+    assert agent.calls == 2
+
+    # the invalid first answer was never stored; the corrected one is served
+    # for the original prompt without calling the model
+    assert ask_and_validate_json(agent, "prompt", "Test", schema=DummySchema) == {"foo": 1}
+    assert agent.calls == 2
+    assert cache.hits == 1
+
+
+def test_ttl_and_lru_eviction(tmp_path):
+    cache = ResponseCache(directory=str(tmp_path), ttl_seconds=60, max_entries=2)
+    cache.put("a", "A")
+    cache.put("b", "B")
+    old = time.time() - 10
+    os.utime(tmp_path / "a.json", (old, old))
+    os.utime(tmp_path / "b.json", (old - 5, old - 5))
+    assert cache.get("b") == "B"  # refreshes b, leaving a least recently used
+    cache.put("c", "C")
+    assert cache.get("a") is None
+    assert cache.get("b") == "B"
+
+    cache.ttl_seconds = -1
+    assert cache.get("c") is None
@@ -0,0 +1,48 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.cv_agent.retrieval import TfidfEmbedder, project_text, rank_projects
+
+PROJECTS = [
+    {"name": "Kubernetes operator", "tech_stack": ["Go", "Kubernetes"], "description": "Cluster autoscaling operator"},
+    {"name": "Portfolio site", "tech_stack": ["HTML", "CSS"], "description": "Personal website", "notes": "No Notes"},
+    {"name": "Churn model", "tech_stack": ["Python", "PyTorch"], "description": "Deep learning churn prediction"},
+    {"name": "Recipe app", "tech_stack": ["Flutter"], "description": "Mobile app for recipes"},
+]
+
+
+class CountingEmbedder(TfidfEmbedder):
+    def __init__(self):
+        self.embedded = []
+
+    def embed(self, texts):
+        self.embedded.extend(texts)
+        return super().embed(texts)
+
+
+def test_keeps_most_relevant_projects_in_input_order(tmp_path):
+    job = "Machine learning engineer: Python, PyTorch, deep learning on Kubernetes"
+    ranked = rank_projects(PROJECTS, job, 2, directory=str(tmp_path))
+    assert [p["name"] for p in ranked] == ["Kubernetes operator", "Churn model"]
+
+
+def test_index_embeds_only_changed_projects(tmp_path):
+    embedder = CountingEmbedder()
+    rank_projects(PROJECTS, "python", 2, embedder, str(tmp_path))
+    assert len(embedder.embedded) == len(PROJECTS) + 1
+
+    embedder.embedded.clear()
+    changed = [dict(PROJECTS[0], description="Rewritten"), *PROJECTS[1:]]
+    rank_projects(changed, "python", 2, embedder, str(tmp_path))
+    # the changed project plus the job description
+    assert len(embedder.embedded) == 2
+
+
+def test_small_project_lists_skip_ranking(tmp_path):
+    assert rank_projects(PROJECTS, "anything", 10, directory=str(tmp_path)) is PROJECTS
+
+
+def test_placeholder_values_are_not_ranked():
+    text = project_text({"name": "Untitled Project", "description": "No Description", "tech_stack": ["Go"]})
+    assert text == "Go"
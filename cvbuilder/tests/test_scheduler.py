@@ -0,0 +1,72 @@
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.pipeline.scheduler import Stage, run_stages
+
+
+def test_independent_stages_run_concurrently():
+    barrier = threading.Barrier(3, timeout=2)
+
+    def branch(value):
+        def run():
+            barrier.wait()
+            return value
+        return run
+
+    stages = [Stage(name, branch(name)) for name in ("a", "b", "c")]
+    assert run_stages(stages) == {"a": "a", "b": "b", "c": "c"}
+
+
+def test_dependent_stage_waits_for_producer():
+    order = []
+
+    def fetch():
+        time.sleep(0.05)
+        order.append("fetch")
+
+    def skills():
+        order.append("skills")
+        return "skills"
+
+    stages = [
+        Stage("skills", skills, inputs=("data/projects.json",)),
+        Stage("fetch", fetch, outputs=("data/projects.json",)),
+    ]
+    results = run_stages(stages)
+    assert order == ["fetch", "skills"]
+    assert results["skills"] == "skills"
+
+
+def test_failure_stops_dependents():
+    ran = []
+
+    def boom():
+        raise RuntimeError("boom")
+
+    stages = [
+        Stage("fetch", boom, outputs=("raw",)),
+        Stage("select", lambda: ran.append("select"), inputs=("raw",)),
+    ]
+    with pytest.raises(RuntimeError):
+        run_stages(stages)
+    assert ran == []
+
+
+def test_rejects_cycles_and_missing_inputs():
+    with pytest.raises(ValueError):
+        run_stages([Stage("a", lambda: None, inputs=("y",), outputs=("x",)), Stage("b", lambda: None, inputs=("x",), outputs=("y",))])
+    with pytest.raises(ValueError):
+        run_stages([Stage("a", lambda: None, inputs=("missing",))])
+
+
+def test_pass_inputs_hands_results_over():
+    stages = [
+        Stage("fetch", lambda: [1, 2], outputs=("raw",)),
+        Stage("count", len, inputs=("raw",), pass_inputs=True),
+    ]
+    assert run_stages(stages)["count"] == 2
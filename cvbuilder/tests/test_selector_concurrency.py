@@ -0,0 +1,59 @@
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.cv_agent.agent import CVAgent
+from src.cv_agent.selector import CVSelector
+
+
+def test_run_all_overlaps_selections(monkeypatch):
+    selector = CVSelector(agent=object())
+    barrier = threading.Barrier(2, timeout=2)
+
+    def select(name):
+        # Only returns if the other selection is in flight at the same time
+        barrier.wait()
+        return name
+
+    monkeypatch.setattr(selector, "select_projects", lambda projects: select("projects"))
+    monkeypatch.setattr(selector, "select_skills", lambda skills: select("skills"))
+    assert selector.run_all() == ("projects", "skills")
+
+
+def run_parallel_calls(monkeypatch, num_parallel, calls=4):
+    if num_parallel is None:
+        monkeypatch.delenv("OLLAMA_NUM_PARALLEL", raising=False)
+    else:
+        monkeypatch.setenv("OLLAMA_NUM_PARALLEL", str(num_parallel))
+    agent = CVAgent(mode="local", model="test")
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+
+    def fake_ask(prompt, schema=None):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(0.05)
+        with lock:
+            state["active"] -= 1
+        return "{}"
+
+    monkeypatch.setattr(agent, "_ask_ollama", fake_ask)
+    threads = [threading.Thread(target=agent.ask, args=(f"p{i}",)) for i in range(calls)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return state["peak"]
+
+
+def test_ollama_calls_respect_num_parallel(monkeypatch):
+    assert run_parallel_calls(monkeypatch, 1) == 1
+    assert run_parallel_calls(monkeypatch, 2) == 2
+
+
+def test_ollama_calls_are_unbounded_without_num_parallel(monkeypatch):
+    # The server picks its own parallelism, so the client does not serialize
+    assert run_parallel_calls(monkeypatch, None) == 4
@@ -0,0 +1,87 @@
+import json
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import src.store as store_module
+from src.store import SnapshotStore
+
+
+def make_store(tmp_path):
+    return SnapshotStore(str(tmp_path / "store.sqlite3"))
+
+
+def test_only_changes_are_written(tmp_path):
+    store = make_store(tmp_path)
+    assert store.save("data", "experience", [{"role": "Dev"}])
+    assert not store.save("data", "experience", [{"role": "Dev"}])
+    assert store.version("data", "experience") == 1
+    assert store.save("data", "experience", [{"role": "Lead"}])
+    assert store.version("data", "experience") == 2
+    assert store.load("data", "experience") == [{"role": "Lead"}]
+    assert store.sections("data") == ["experience"]
+
+
+def test_namespaces_are_separate(tmp_path):
+    store = make_store(tmp_path)
+    store.save("latex", "skills", [{"category": "Go", "items": []}])
+    assert not store.has("data", "skills")
+    with pytest.raises(KeyError):
+        store.load("batch/job", "skills")
+
+
+def test_migrates_legacy_json_layout(tmp_path):
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    (data_dir / "projects.json").write_text(json.dumps([{"name": "CV"}]), encoding="utf-8")
+    (data_dir / "skills.json").write_text("not json", encoding="utf-8")
+    files = {
+        ("data", "projects"): str(data_dir / "projects.json"),
+        ("data", "skills"): str(data_dir / "skills.json"),
+        ("data", "education"): str(data_dir / "education.json"),
+    }
+    store = make_store(tmp_path)
+    assert store.migrate_json(files) == 1
+    assert store.load("data", "projects") == [{"name": "CV"}]
+    # Sections already in the store win over the old files
+    store.save("data", "projects", [{"name": "New"}])
+    assert store.migrate_json(files) == 0
+    assert store.load("data", "projects") == [{"name": "New"}]
+
+
+def test_get_store_migrates_on_creation(tmp_path, monkeypatch):
+    legacy = tmp_path / "experience.json"
+    legacy.write_text("[]", encoding="utf-8")
+    monkeypatch.setattr(store_module, "STORE_PATH", str(tmp_path / "store.sqlite3"))
+    monkeypatch.setattr(store_module, "LEGACY_FILES", {("data", "experience"): str(legacy)})
+    monkeypatch.setattr(store_module, "_store", None)
+    assert store_module.get_store().load("data", "experience") == []
+
+
+def test_concurrent_saves(tmp_path):
+    store = make_store(tmp_path)
+
+    def save(i):
+        store.save("data", f"section{i}", {"i": i})
+
+    threads = [threading.Thread(target=save, args=(i,)) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(store.sections("data")) == 8
+
+
+def test_persist_writes_models_in_background(tmp_path, monkeypatch):
+    from src.schemas.notion import Skills
+
+    monkeypatch.setattr(store_module, "_store", make_store(tmp_path))
+    store_module.persist("data", "skills", Skills(tools=["Go"], tags=[]))
+    store_module.flush()
+    assert store_module.get_store().load("data", "skills") == {"tools": ["Go"], "tags": []}
+
+    monkeypatch.setenv("SNAPSHOT_PERSIST", "0")
+    assert store_module.persist("data", "skills", Skills(tools=[], tags=[])) is None
@@ -0,0 +1,65 @@
+import io
+import os
+import shutil
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import src.latex as latex
+import src.latex_cache as latex_cache
+import src.latex_fit as latex_fit
+from src.latex import ResumeRenderer
+
+CONTACT = {"name": "Ann", "phone": "1", "email": "a@x.com", "linkedin": "https://linkedin.com/in/a"}
+SKILLS = [{"category": "Tools & Co", "items": ["Go", "Rust"]}]
+PROJECTS = [{"category": "Web", "items": [
+    {"title": f"P{i}", "description": "d", "details": "x" * 200, "tech": ["Go"], "duration": "2023"}
+    for i in range(20)
+]}]
+
+
+class CountingSink(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = []
+
+    def write(self, s):
+        self.writes.append(len(s))
+        return super().write(s)
+
+
+def make_renderer(tmp_path):
+    target = tmp_path / "templates"
+    shutil.copytree(latex.TEMPLATE_DIR, target, ignore=shutil.ignore_patterns("main.tex"))
+    return ResumeRenderer(str(target))
+
+
+def test_stream_matches_render(tmp_path):
+    renderer = make_renderer(tmp_path)
+    sink = CountingSink()
+    written = renderer.stream(sink, CONTACT, SKILLS, PROJECTS, [], [])
+    expected = renderer.render(CONTACT, SKILLS, PROJECTS, [], [])
+    assert sink.getvalue() == expected
+    assert written == len(expected)
+
+
+def test_writes_are_buffered(tmp_path):
+    renderer = make_renderer(tmp_path)
+    sink = CountingSink()
+    renderer.stream(sink, CONTACT, SKILLS, PROJECTS, [], [], buffer_size=1024)
+    chunks = len(list(renderer.chunks(CONTACT, SKILLS, PROJECTS, [], [])))
+    assert 1 < len(sink.writes) < chunks
+    # Every write but the last flushes at least one full buffer
+    assert all(size >= 1024 for size in sink.writes[:-1])
+
+
+def test_file_helpers_match_string_versions(tmp_path):
+    tex = make_renderer(tmp_path).render(CONTACT, SKILLS, PROJECTS, [], [])
+    path = tmp_path / "main.tex"
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        f.write(tex)
+    assert latex_cache.build_key_file(str(path)) == latex_cache.build_key(tex)
+
+    fitted = tmp_path / "fitted.tex"
+    latex_fit.apply_layout_file(str(path), str(fitted), 5)
+    with open(fitted, encoding="utf-8", newline="") as f:
+        assert f.read() == latex_fit.apply_layout(tex, 5)